@@ -5,27 +5,74 @@ Script de build pour ExcelToolsPro
 Génère les exécutables Production et Debug
 """
 
+import os
 import subprocess
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Logs et caches PyInstaller des builds parallèles
+BUILD_LOG_DIR = 'build_logs'
+
+# Modules du noyau compilés avec Cython (optionnel, option --cython)
+CYTHON_MODULES = [
+    'src/core/config.py',
+    'src/core/logger.py',
+]
+
+
 def clean_build_dirs():
-    """Nettoie les répertoires de build"""
-    dirs_to_clean = ['build', 'dist']
+    """Nettoie les répertoires de build (suppressions menées en parallèle)"""
+    dirs_to_clean = [d for d in ('build', 'dist', BUILD_LOG_DIR) if Path(d).exists()]
     for dir_name in dirs_to_clean:
-        dir_path = Path(dir_name)
-        if dir_path.exists():
-            print(f"Nettoyage de {dir_name}/...")
-            shutil.rmtree(dir_path)
+        print(f"Nettoyage de {dir_name}/...")
+
+    with ThreadPoolExecutor(max_workers=len(dirs_to_clean) or 1) as executor:
+        list(executor.map(lambda d: shutil.rmtree(d, ignore_errors=True), dirs_to_clean))
+
+
+def compile_extensions() -> bool:
+    """Compile les modules du noyau en extensions C avec Cython (in-place)"""
+    try:
+        import Cython
+        print(f"Cython version: {Cython.__version__}")
+    except ImportError:
+        print("AVERTISSEMENT: Cython n'est pas installé, modules Python conservés.")
+        print("Installez-le avec: pip install cython")
+        return False
+
+    cmd = [
+        sys.executable, '-m', 'Cython.Build.Cythonize',
+        '-i', '-3',
+        *CYTHON_MODULES
+    ]
+    result = subprocess.run(cmd, capture_output=False)
+
+    if result.returncode == 0:
+        print("[OK] Modules du noyau compilés")
+        return True
+    print("[AVERTISSEMENT] Échec de la compilation Cython, modules Python conservés")
+    clean_extensions()
+    return False
+
+
+def clean_extensions():
+    """Supprime les extensions compilées pour que les sources .py reprennent la main"""
+    for module in CYTHON_MODULES:
+        source = Path(module)
+        for artifact in source.parent.glob(f"{source.stem}.*"):
+            if artifact.suffix in ('.c', '.so', '.pyd'):
+                artifact.unlink()
 
 
-def build_executable(spec_file: str, name: str):
-    """Build un exécutable à partir d'un fichier spec"""
-    print(f"\n{'='*60}")
-    print(f"Construction de {name}...")
-    print(f"{'='*60}\n")
+def start_build(spec_file: str, name: str):
+    """Lance le build d'un exécutable en arrière-plan, sortie redirigée vers un log"""
+    stem = Path(spec_file).stem
+    log_path = Path(BUILD_LOG_DIR) / f"{stem}.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    print(f"Construction de {name}... (log: {log_path})")
 
     cmd = [
         sys.executable, '-m', 'PyInstaller',
@@ -34,13 +81,26 @@ def build_executable(spec_file: str, name: str):
         spec_file
     ]
 
-    result = subprocess.run(cmd, capture_output=False)
+    # Cache PyInstaller propre à chaque build: --clean ne doit pas vider
+    # le cache utilisé par le build lancé en parallèle
+    env = dict(os.environ, PYINSTALLER_CONFIG_DIR=str(Path(BUILD_LOG_DIR) / f"{stem}_cache"))
 
-    if result.returncode == 0:
-        print(f"\n[OK] {name} créé avec succès!")
+    log_file = open(log_path, 'w', encoding='utf-8')
+    process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT, env=env)
+    return process, log_file, log_path
+
+
+def wait_build(build, name: str) -> bool:
+    """Attend la fin d'un build lancé par start_build"""
+    process, log_file, log_path = build
+    returncode = process.wait()
+    log_file.close()
+
+    if returncode == 0:
+        print(f"[OK] {name} créé avec succès!")
         return True
     else:
-        print(f"\n[ERREUR] Échec de la création de {name}")
+        print(f"[ERREUR] Échec de la création de {name} (voir {log_path})")
         return False
 
 
@@ -63,11 +123,26 @@ def main():
     print("\nNettoyage des anciens builds...")
     clean_build_dirs()
 
-    # Build Production
-    success_prod = build_executable('ExcelToolsPro.spec', 'ExcelToolsPro (Production)')
+    # Compilation optionnelle du noyau (config/logger) avec Cython
+    use_cython = '--cython' in sys.argv
+    if use_cython:
+        print("\nCompilation Cython des modules du noyau...")
+        use_cython = compile_extensions()
 
-    # Build Debug
-    success_debug = build_executable('ExcelToolsPro_debug.spec', 'ExcelToolsPro_debug (Debug)')
+    try:
+        # Builds Production et Debug lancés en parallèle
+        print(f"\n{'='*60}")
+        prod_name = 'ExcelToolsPro (Production)'
+        debug_name = 'ExcelToolsPro_debug (Debug)'
+        prod_build = start_build('ExcelToolsPro.spec', prod_name)
+        debug_build = start_build('ExcelToolsPro_debug.spec', debug_name)
+        print(f"{'='*60}\n")
+
+        success_prod = wait_build(prod_build, prod_name)
+        success_debug = wait_build(debug_build, debug_name)
+    finally:
+        if use_cython:
+            clean_extensions()
 
     # Résumé
     print("\n" + "=" * 60)
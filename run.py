@@ -4,6 +4,7 @@ ExcelToolsPro - Point d'entrée principal
 Lance l'application graphique unifiée
 """
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -13,4 +14,6 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.ui.main_app import main
 
 if __name__ == "__main__":
+    # Requis pour les ProcessPoolExecutor dans l'exécutable PyInstaller
+    multiprocessing.freeze_support()
     main()
@@ -4,14 +4,65 @@ Sauvegarde/charge les préférences utilisateur et paramètres de l'application
 Tous les paramètres sont exposés et modifiables via l'IHM
 """
 
+import atexit
+import functools
 import json
+import os
+import sys
+import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+from .constants import APP_DATA_DIR, DATACLASS_OPTIONS
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # Dépendance optionnelle, repli sur le module json standard
+    orjson = None
+
+
+# Gestionnaires vivants dont les modifications en attente sont écrites à la sortie
+_live_managers: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers() -> None:
+    """Écrit les sauvegardes en attente des gestionnaires encore vivants (atexit)"""
+    for manager in list(_live_managers):
+        # Dossier supprimé entre-temps (fichier temporaire): rien à écrire
+        if manager.config_path.parent.is_dir():
+            manager._flush_now()
+        else:
+            manager._cancel_scheduled_save()
+
+
+atexit.register(_flush_live_managers)
+
+
+@functools.lru_cache(maxsize=None)
+def _fields_of(cls: type) -> tuple:
+    """Champs d'une dataclass (mis en cache par classe)"""
+    return fields(cls)
+
+
+def _fast_asdict(obj: Any) -> Any:
+    """
+    Équivalent de dataclasses.asdict sans copie profonde
+
+    Les listes et valeurs simples sont renvoyées par référence: le résultat
+    est destiné à la sérialisation et ne doit pas être modifié.
+    """
+    if is_dataclass(obj):
+        return {f.name: _fast_asdict(getattr(obj, f.name)) for f in _fields_of(type(obj))}
+    if isinstance(obj, dict):
+        return {key: _fast_asdict(value) for key, value in obj.items()}
+    return obj
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ExcelExportConfig:
     """Configuration des exports Excel"""
     # Formatage
@@ -42,7 +93,7 @@ class ExcelExportConfig:
     header_font_bold: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class SearchConfig:
     """Configuration du module de recherche"""
     # Limites
@@ -58,7 +109,7 @@ class SearchConfig:
     highlight_matches: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class MergeConfig:
     """Configuration du module de fusion"""
     # Colonnes clés suggérées (auto-détection)
@@ -76,7 +127,7 @@ class MergeConfig:
     default_export_matches_only: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class TransferConfig:
     """Configuration du module de transfert"""
     # Scan des fichiers
@@ -90,7 +141,7 @@ class TransferConfig:
     header_title: str = "DONNÉES EXTRAITES"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CSVConfig:
     """Configuration du module CSV"""
     # Encodages disponibles
@@ -109,7 +160,7 @@ class CSVConfig:
     default_skip_headers_on_merge: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class PerformanceConfig:
     """Configuration des performances"""
     # Preview
@@ -125,7 +176,7 @@ class PerformanceConfig:
     max_cache_size_mb: int = 100
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class UIConfig:
     """Configuration de l'interface utilisateur"""
     # Thème
@@ -151,7 +202,7 @@ class UIConfig:
     tooltip_delay_ms: int = 500
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LogConfig:
     """Configuration des logs"""
     level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
@@ -165,7 +216,7 @@ class LogConfig:
     max_log_file_size_mb: int = 10
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ModuleConfig:
     """Configuration d'un module spécifique"""
     enabled: bool = True
@@ -173,7 +224,7 @@ class ModuleConfig:
     settings: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AppConfig:
     """Configuration globale de l'application"""
     # Sous-configurations
@@ -211,14 +262,43 @@ class AppConfig:
 class ConfigManager:
     """Gestionnaire de configuration avec persistance JSON"""
 
-    DEFAULT_CONFIG_PATH = Path.home() / ".exceltoolspro" / "config.json"
+    DEFAULT_CONFIG_PATH = APP_DATA_DIR / "config.json"
+
+    # Délai de regroupement des sauvegardes automatiques (secondes)
+    AUTO_SAVE_DELAY = 0.5
 
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.config_path.parent.is_dir():
+            self.config_path.parent.mkdir(parents=True, exist_ok=True)
         self._config: Optional[AppConfig] = None
         self._callbacks: List[callable] = []
 
+        # Index LRU des fichiers récents (reconstruit depuis config.recent_files)
+        self._recent: Optional[OrderedDict] = None
+        self._recent_source: Optional[List[str]] = None
+
+        # Cache des clés pointées résolues: clé -> (objet parent, attribut)
+        self._resolve_cache: Dict[str, Tuple[Any, str]] = {}
+
+        # Compteur incrémenté à chaque modification par set() ou réinitialisation
+        # (clé de cache des consommateurs: l'objet AppConfig peut rester le même)
+        self._version = 0
+
+        # Empreinte du fichier au dernier chargement/sauvegarde
+        self._cached_stamp: Optional[Tuple[int, int]] = None
+
+        # Sauvegarde automatique différée
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        _live_managers.add(self)
+
+    @property
+    def version(self) -> int:
+        """Version de la configuration en mémoire (change à chaque modification)"""
+        return self._version
+
     @property
     def config(self) -> AppConfig:
         """Accès à la configuration, charge si nécessaire"""
@@ -227,13 +307,30 @@ class ConfigManager:
         return self._config
 
     def load(self) -> AppConfig:
-        """Charge la configuration depuis le fichier JSON"""
-        if self.config_path.exists():
+        """
+        Charge la configuration depuis le fichier JSON
+
+        Si le fichier n'a pas changé (date de modification et taille) depuis
+        le dernier chargement ou la dernière sauvegarde, la configuration en
+        mémoire est renvoyée sans relecture. Elle l'est aussi tant qu'une
+        sauvegarde est en attente: la copie sur disque est alors plus ancienne.
+        """
+        if self._config is not None and self._dirty:
+            return self._config
+
+        file_stamp = self._file_stamp()
+        if (file_stamp is not None and file_stamp == self._cached_stamp
+                and self._config is not None):
+            return self._config
+
+        self._resolve_cache.clear()
+        self._version += 1
+        self._cached_stamp = None
+        if file_stamp is not None:
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
+                data = self._read_json(self.config_path)
                 self._config = self._dict_to_config(data)
+                self._cached_stamp = file_stamp
 
             except (json.JSONDecodeError, TypeError, KeyError) as e:
                 print(f"Erreur de configuration, utilisation des valeurs par défaut: {e}")
@@ -243,6 +340,14 @@ class ConfigManager:
 
         return self._config
 
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Empreinte (mtime en ns, taille) du fichier de configuration, None s'il n'existe pas"""
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def _dict_to_config(self, data: dict) -> AppConfig:
         """Convertit un dictionnaire en AppConfig avec sous-configs"""
         # Extraire les sous-configurations
@@ -272,38 +377,124 @@ class ConfigManager:
             for name, mod_data in modules_data.items()
         }
 
-        return AppConfig(
-            excel_export=excel_export,
-            search=search,
-            merge=merge,
-            transfer=transfer,
-            csv=csv,
-            performance=performance,
-            ui=ui,
-            log=log,
-            modules=modules,
-            **data
-        )
+        sections = {
+            'excel_export': excel_export,
+            'search': search,
+            'merge': merge,
+            'transfer': transfer,
+            'csv': csv,
+            'performance': performance,
+            'ui': ui,
+            'log': log,
+            'modules': modules,
+        }
 
-    def save(self) -> bool:
-        """Sauvegarde la configuration dans le fichier JSON"""
-        try:
-            data = self._config_to_dict(self.config)
+        # Construction directe: les fabriques par défaut ne sont appelées
+        # que pour les champs absents du fichier
+        config = AppConfig.__new__(AppConfig)
+        for f in fields(AppConfig):
+            if f.name in sections:
+                value = sections[f.name]
+            elif f.name in data:
+                value = data.pop(f.name)
+            elif f.default is not MISSING:
+                value = f.default
+            else:
+                value = f.default_factory()
+            setattr(config, f.name, value)
 
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        if data:
+            raise TypeError(f"Paramètres de configuration inconnus: {', '.join(data)}")
 
-            return True
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde de la configuration: {e}")
-            return False
+        return config
+
+    def save(self) -> bool:
+        """Sauvegarde la configuration dans le fichier JSON"""
+        with self._save_lock:
+            self._cancel_scheduled_save()
+            try:
+                self._write_json(self.config_path, self.config)
+                # Le fichier reflète la mémoire: inutile de le relire au prochain load()
+                self._cached_stamp = self._file_stamp()
+                return True
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde de la configuration: {e}")
+                return False
+
+    def _schedule_save(self) -> None:
+        """Programme une sauvegarde différée (les modifications rapprochées sont regroupées)"""
+        with self._save_lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.AUTO_SAVE_DELAY, self._flush_now)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _cancel_scheduled_save(self) -> None:
+        """Annule la sauvegarde différée en attente"""
+        self._dirty = False
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _flush_now(self) -> None:
+        """Écrit immédiatement les modifications en attente"""
+        with self._save_lock:
+            if self._dirty:
+                self.save()
+            else:
+                self._cancel_scheduled_save()
 
     def _config_to_dict(self, config: AppConfig) -> dict:
-        """Convertit une AppConfig en dictionnaire"""
-        return asdict(config)
+        """Convertit une AppConfig en dictionnaire (sans copie des listes)"""
+        return _fast_asdict(config)
+
+    @staticmethod
+    def _read_json(path: Path) -> dict:
+        """Lit un fichier JSON (orjson si disponible)"""
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_json(self, path: Path, config: AppConfig) -> None:
+        """Écrit la configuration en JSON indenté (orjson si disponible) de façon atomique"""
+        if orjson is not None:
+            # orjson sérialise nativement les dataclasses, sans passer par asdict
+            payload = orjson.dumps(
+                config,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            data = self._config_to_dict(config)
+            payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+        # Écriture dans un fichier temporaire puis remplacement atomique:
+        # un arrêt brutal ne laisse jamais un fichier de configuration tronqué
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
 
     def get(self, key: str, default: Any = None) -> Any:
         """Récupère une valeur de configuration par clé (supporte la notation pointée)"""
+        resolved = self._resolve_cache.get(key)
+        if resolved is None:
+            resolved = self._resolve(key)
+            if resolved is not None:
+                self._resolve_cache[key] = resolved
+
+        if resolved is not None:
+            parent, attr = resolved
+            return getattr(parent, attr)
+
+        # Chemins traversant des dictionnaires (ex: modules): parcours non mis en cache
         keys = key.split('.')
         value = self.config
 
@@ -317,27 +508,41 @@ class ConfigManager:
 
         return value
 
+    def _resolve(self, key: str) -> Optional[Tuple[Any, str]]:
+        """Résout une clé pointée en (objet parent, attribut) si elle ne traverse que des dataclasses"""
+        keys = key.split('.')
+        obj = self.config
+
+        for k in keys[:-1]:
+            if not is_dataclass(obj) or k not in obj.__dataclass_fields__:
+                return None
+            obj = getattr(obj, k)
+
+        if not is_dataclass(obj) or keys[-1] not in obj.__dataclass_fields__:
+            return None
+        return obj, keys[-1]
+
     def set(self, key: str, value: Any) -> None:
         """Définit une valeur de configuration (supporte la notation pointée)"""
         keys = key.split('.')
 
-        if len(keys) == 1:
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
-        else:
-            # Navigation vers le bon sous-objet
-            obj = self.config
-            for k in keys[:-1]:
-                if hasattr(obj, k):
-                    obj = getattr(obj, k)
-                else:
-                    return
-
-            if hasattr(obj, keys[-1]):
-                setattr(obj, keys[-1], value)
+        # Navigation vers le bon sous-objet (seuls les champs de dataclass sont acceptés)
+        obj = self.config
+        for k in keys[:-1]:
+            if k not in getattr(obj, '__dataclass_fields__', ()):
+                return
+            obj = getattr(obj, k)
+
+        attr = keys[-1]
+        if attr in getattr(obj, '__dataclass_fields__', ()):
+            # Une sous-configuration remplacée invalide les chemins résolus en cache
+            if is_dataclass(getattr(obj, attr)):
+                self._resolve_cache.clear()
+            setattr(obj, attr, value)
+            self._version += 1
 
         if self.config.auto_save_config:
-            self.save()
+            self._schedule_save()
         self._notify_change(key, value)
 
     def get_module_config(self, module_name: str) -> ModuleConfig:
@@ -352,21 +557,35 @@ class ConfigManager:
         mod_config.settings[key] = value
         mod_config.last_used = datetime.now().isoformat()
         if self.config.auto_save_config:
-            self.save()
+            self._schedule_save()
 
     def add_recent_file(self, file_path: str) -> None:
         """Ajoute un fichier à l'historique des fichiers récents"""
-        if file_path in self.config.recent_files:
-            self.config.recent_files.remove(file_path)
-
-        self.config.recent_files.insert(0, file_path)
+        recent = self._get_recent_index()
+        recent.pop(file_path, None)
+        recent[file_path] = None
+        recent.move_to_end(file_path, last=False)
 
         # Limiter la taille de l'historique
-        if len(self.config.recent_files) > self.config.max_recent_files:
-            self.config.recent_files = self.config.recent_files[:self.config.max_recent_files]
+        while len(recent) > self.config.max_recent_files:
+            recent.popitem(last=True)
+
+        # Projection sur la liste persistée (même objet, format JSON inchangé)
+        self.config.recent_files[:] = recent
 
         if self.config.auto_save_config:
-            self.save()
+            self._schedule_save()
+
+    def _get_recent_index(self) -> OrderedDict:
+        """Retourne l'index LRU des fichiers récents, reconstruit si la liste a changé"""
+        recent_files = self.config.recent_files
+        # Comparaison complète: une entrée remplacée sur place garde la même longueur
+        # (liste bornée par max_recent_files, coût négligeable)
+        if (self._recent is None or self._recent_source is not recent_files
+                or list(self._recent) != recent_files):
+            self._recent = OrderedDict.fromkeys(recent_files)
+            self._recent_source = recent_files
+        return self._recent
 
     def on_change(self, callback: callable) -> None:
         """Enregistre un callback appelé lors d'un changement de configuration"""
@@ -383,6 +602,8 @@ class ConfigManager:
     def reset_to_defaults(self) -> None:
         """Réinitialise la configuration aux valeurs par défaut"""
         self._config = AppConfig()
+        self._resolve_cache.clear()
+        self._version += 1
         self.save()
 
     def reset_section(self, section: str) -> None:
@@ -400,15 +621,15 @@ class ConfigManager:
 
         if section in defaults:
             setattr(self.config, section, defaults[section])
+            self._resolve_cache.clear()
+            self._version += 1
             if self.config.auto_save_config:
-                self.save()
+                self._schedule_save()
 
     def export_config(self, export_path: Path) -> bool:
         """Exporte la configuration vers un fichier externe"""
         try:
-            data = self._config_to_dict(self.config)
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            self._write_json(export_path, self.config)
             return True
         except Exception as e:
             print(f"Erreur lors de l'export: {e}")
@@ -417,10 +638,10 @@ class ConfigManager:
     def import_config(self, import_path: Path) -> bool:
         """Importe la configuration depuis un fichier externe"""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
+            data = self._read_json(import_path)
             self._config = self._dict_to_config(data)
+            self._resolve_cache.clear()
+            self._version += 1
             self.save()
             return True
         except Exception as e:
@@ -431,15 +652,19 @@ class ConfigManager:
         """Retourne tous les paramètres sous forme de dictionnaire plat"""
         result = {}
 
-        def flatten(obj, prefix=''):
-            if hasattr(obj, '__dataclass_fields__'):
-                for field_name in obj.__dataclass_fields__:
-                    value = getattr(obj, field_name)
-                    key = f"{prefix}.{field_name}" if prefix else field_name
-                    if hasattr(value, '__dataclass_fields__'):
-                        flatten(value, key)
-                    else:
-                        result[key] = value
-
-        flatten(self.config)
+        # Parcours en profondeur itératif (même ordre que le parcours récursif)
+        stack = [(iter(_fields_of(type(self.config))), self.config, '')]
+        while stack:
+            field_iter, obj, prefix = stack[-1]
+            for f in field_iter:
+                value = getattr(obj, f.name)
+                # Clés pointées internées: les recherches ultérieures comparent par identité
+                key = sys.intern(f"{prefix}.{f.name}") if prefix else f.name
+                if is_dataclass(value):
+                    stack.append((iter(_fields_of(type(value))), value, key))
+                    break
+                result[key] = value
+            else:
+                stack.pop()
+
         return result
@@ -2,6 +2,16 @@
 Constantes globales de l'application ExcelToolsPro
 """
 
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+# Options communes des dataclasses (__slots__ disponible à partir de Python 3.10)
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Répertoire des données utilisateur (configuration, logs), résolu une seule fois
+APP_DATA_DIR = Path.home() / ".exceltoolspro"
+
 # Informations de l'application
 APP_INFO = {
     "name": "ExcelToolsPro",
@@ -11,8 +21,8 @@ APP_INFO = {
     "github": "https://github.com/edvance/exceltoolspro"
 }
 
-# Palette de couleurs moderne
-COLORS = {
+# Palette de couleurs moderne (lecture seule)
+COLORS = MappingProxyType({
     # Fond
     "bg_dark": "#1a1a2e",
     "bg_card": "#16213e",
@@ -37,24 +47,24 @@ COLORS = {
     # Bordures
     "border_light": "#3d3d6a",
     "border_dark": "#1e1e2e",
-}
+})
 
-# Types de fichiers supportés
-FILE_TYPES = {
-    "excel": [
+# Types de fichiers supportés (lecture seule)
+FILE_TYPES = MappingProxyType({
+    "excel": (
         ("Fichiers Excel", "*.xlsx *.xls *.xlsm"),
         ("Excel 2007+ (.xlsx)", "*.xlsx"),
         ("Excel avec macros (.xlsm)", "*.xlsm"),
         ("Excel 97-2003 (.xls)", "*.xls"),
-    ],
-    "csv": [
+    ),
+    "csv": (
         ("Fichiers CSV", "*.csv"),
         ("Tous les fichiers", "*.*"),
-    ],
-    "all": [
+    ),
+    "all": (
         ("Tous les fichiers", "*.*"),
-    ]
-}
+    ),
+})
 
 # États des étapes de workflow
 class StepStatus:
@@ -65,21 +75,21 @@ class StepStatus:
     SKIPPED = "skipped"
     WARNING = "warning"
 
-# Icônes des états
-STATUS_ICONS = {
+# Icônes des états (lecture seule)
+STATUS_ICONS = MappingProxyType({
     StepStatus.PENDING: "⏳",
     StepStatus.RUNNING: "🔄",
     StepStatus.SUCCESS: "✅",
     StepStatus.ERROR: "❌",
     StepStatus.SKIPPED: "⏭️",
     StepStatus.WARNING: "⚠️",
-}
+})
 
-# Niveaux de log
-LOG_LEVELS = {
+# Niveaux de log (lecture seule)
+LOG_LEVELS = MappingProxyType({
     "DEBUG": 10,
     "INFO": 20,
     "WARNING": 30,
     "ERROR": 40,
     "CRITICAL": 50,
-}
+})
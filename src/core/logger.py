@@ -4,13 +4,20 @@ Gestion des logs en temps réel avec callback pour l'IHM
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
+import time
+import weakref
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from enum import Enum
-from typing import List, Callable, Optional
+from typing import Deque, List, Callable, Optional, Union
 from dataclasses import dataclass
 
+from .constants import APP_DATA_DIR, DATACLASS_OPTIONS
+
 
 class LogLevel(Enum):
     """Niveaux de log avec couleurs associées"""
@@ -30,24 +37,40 @@ class LogLevel(Enum):
         return self.value[1]
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LogEntry:
     """Entrée de log structurée"""
-    timestamp: datetime
+    timestamp: float  # Secondes depuis l'epoch (time.time()), formaté à l'affichage
     level: LogLevel
     message: str
     source: str = ""
 
+    @property
+    def time_str(self) -> str:
+        """Heure locale de l'entrée au format HH:MM:SS"""
+        return time.strftime('%H:%M:%S', time.localtime(self.timestamp))
+
     def format(self, include_timestamp: bool = True) -> str:
         """Formate l'entrée pour affichage"""
-        parts = []
+        source = f"[{self.source}] " if self.source else ""
         if include_timestamp:
-            parts.append(f"[{self.timestamp.strftime('%H:%M:%S')}]")
-        parts.append(f"[{self.level.name_str}]")
-        if self.source:
-            parts.append(f"[{self.source}]")
-        parts.append(self.message)
-        return " ".join(parts)
+            return f"[{self.time_str}] [{self.level.name_str}] {source}{self.message}"
+        return f"[{self.level.name_str}] {source}{self.message}"
+
+
+# Niveaux comptabilisés comme erreurs (les membres d'Enum sont des singletons)
+_ERROR_LEVELS = frozenset({LogLevel.ERROR, LogLevel.CRITICAL})
+
+
+# Instance active par nom de logger Python: une seule écoute de file par nom
+_active_loggers: "weakref.WeakValueDictionary[str, Logger]" = weakref.WeakValueDictionary()
+
+
+# Correspondance LogLevel -> niveau du module logging (SUCCESS est journalisé en INFO)
+_PY_LEVEL = {
+    level: getattr(logging, level.name_str, logging.INFO)
+    for level in LogLevel
+}
 
 
 class Logger:
@@ -70,18 +93,22 @@ class Logger:
         max_entries: int = 10000
     ):
         self.name = name
-        self.level = level
+        self.level = level  # Met aussi à jour le seuil numérique (voir propriété)
         self.max_entries = max_entries
-        self.entries: List[LogEntry] = []
+        # Historique borné: les entrées les plus anciennes sont évincées en O(1)
+        self.entries: Deque[LogEntry] = deque(maxlen=max_entries)
+        self._errors: Deque[LogEntry] = deque(maxlen=max_entries)
+        self._warnings: Deque[LogEntry] = deque(maxlen=max_entries)
         self._callbacks: List[Callable[[LogEntry], None]] = []
         self._error_count = 0
         self._warning_count = 0
 
         # Configuration du répertoire de logs
         if log_dir is None:
-            log_dir = Path.home() / ".exceltoolspro" / "logs"
+            log_dir = APP_DATA_DIR / "logs"
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        if not self.log_dir.is_dir():
+            self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # Fichiers de log
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -91,14 +118,57 @@ class Logger:
         # Configuration du logger Python standard
         self._setup_python_logger()
 
+    @property
+    def level(self) -> LogLevel:
+        """Niveau minimal des logs enregistrés"""
+        return self._level
+
+    @level.setter
+    def level(self, level: LogLevel):
+        self._level = level
+        self._min_level = _PY_LEVEL[level]
+
+    def set_level(self, level: Union[LogLevel, str]):
+        """Définit le niveau minimal (LogLevel ou nom du niveau, ex: "DEBUG")"""
+        if isinstance(level, str):
+            level = LogLevel[level.upper()]
+        self.level = level
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Indique si un message de ce niveau serait enregistré"""
+        return _PY_LEVEL[level] >= self._min_level
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Permet d'éviter de construire des messages DEBUG coûteux s'ils sont filtrés"""
+        return self._min_level <= logging.DEBUG
+
     def _setup_python_logger(self):
-        """Configure le logger Python standard"""
+        """
+        Configure le logger Python standard
+
+        Le logger ne fait qu'empiler les enregistrements dans une file; un thread
+        d'écoute (QueueListener) les écrit dans le fichier et la console, ce qui
+        sort les entrées/sorties disque du chemin d'appel.
+
+        Une instance précédente du même nom est arrêtée. L'arrêt (file vidée,
+        fichiers fermés) a lieu au plus tard à la libération de l'instance ou
+        à la sortie du programme, via weakref.finalize qui ne la retient pas.
+        """
+        previous = _active_loggers.get(self.name)
+        if previous is not None:
+            previous.shutdown()
+
         self._logger = logging.getLogger(self.name)
         self._logger.setLevel(logging.DEBUG)
 
         # Nettoyer les handlers existants
+        for handler in self._logger.handlers:
+            handler.close()
         self._logger.handlers.clear()
 
+        handlers = []
+
         # Handler fichier avec UTF-8
         file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
@@ -107,7 +177,7 @@ class Logger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        self._logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
         # Handler console (optionnel)
         if sys.stdout is not None:
@@ -118,12 +188,47 @@ class Logger:
                 datefmt='%H:%M:%S'
             )
             console_handler.setFormatter(console_formatter)
-            self._logger.addHandler(console_handler)
+            handlers.append(console_handler)
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._logger.addHandler(queue_handler)
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        self._finalizer = weakref.finalize(
+            self, Logger._stop_listener, self._logger, queue_handler, listener, handlers
+        )
+        _active_loggers[self.name] = self
+
+    @staticmethod
+    def _stop_listener(py_logger, queue_handler, listener, handlers):
+        """Détache la file du logger, vide la file d'attente et ferme les handlers"""
+        py_logger.removeHandler(queue_handler)
+        listener.stop()
+        for handler in handlers:
+            handler.close()
+
+    def shutdown(self):
+        """Vide la file d'attente des logs et ferme les fichiers"""
+        self._finalizer()
+
+    def _log(self, level: LogLevel, message: str, source: str = "", args: tuple = ()):
+        """
+        Méthode interne de logging
+
+        Si args est fourni, le message est formaté (message % args) seulement
+        lorsque le niveau n'est pas filtré.
+        """
+        # Niveau filtré: aucune entrée, aucun handler, aucun callback
+        if _PY_LEVEL[level] < self._min_level:
+            return
+        if args:
+            message = message % args
 
-    def _log(self, level: LogLevel, message: str, source: str = ""):
-        """Méthode interne de logging"""
         entry = LogEntry(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             level=level,
             message=message,
             source=source
@@ -131,18 +236,17 @@ class Logger:
 
         # Ajouter à l'historique
         self.entries.append(entry)
-        if len(self.entries) > self.max_entries:
-            self.entries = self.entries[-self.max_entries:]
 
         # Compteurs
-        if level == LogLevel.ERROR or level == LogLevel.CRITICAL:
+        if level in _ERROR_LEVELS:
             self._error_count += 1
-        elif level == LogLevel.WARNING:
+            self._errors.append(entry)
+        elif level is LogLevel.WARNING:
             self._warning_count += 1
+            self._warnings.append(entry)
 
         # Logger Python
-        python_level = getattr(logging, level.name_str, logging.INFO)
-        self._logger.log(python_level, message)
+        self._logger.log(_PY_LEVEL[level], message)
 
         # Notifier les callbacks (IHM)
         for callback in self._callbacks:
@@ -195,10 +299,10 @@ class Logger:
         limit: int = 100
     ) -> List[LogEntry]:
         """Récupère les entrées de log filtrées"""
-        entries = self.entries
+        entries = list(self.entries)
 
         if level:
-            entries = [e for e in entries if e.level == level]
+            entries = [e for e in entries if e.level is level]
 
         if source:
             entries = [e for e in entries if e.source == source]
@@ -207,12 +311,11 @@ class Logger:
 
     def get_errors(self) -> List[LogEntry]:
         """Récupère toutes les erreurs"""
-        return [e for e in self.entries
-                if e.level in (LogLevel.ERROR, LogLevel.CRITICAL)]
+        return list(self._errors)
 
     def get_warnings(self) -> List[LogEntry]:
         """Récupère tous les avertissements"""
-        return [e for e in self.entries if e.level == LogLevel.WARNING]
+        return list(self._warnings)
 
     @property
     def error_count(self) -> int:
@@ -227,6 +330,8 @@ class Logger:
     def clear(self):
         """Efface l'historique des logs en mémoire"""
         self.entries.clear()
+        self._errors.clear()
+        self._warnings.clear()
         self._error_count = 0
         self._warning_count = 0
 
@@ -279,7 +384,7 @@ class Logger:
         """Exporte tous les logs vers un fichier"""
         try:
             entries = self.entries if include_debug else [
-                e for e in self.entries if e.level != LogLevel.DEBUG
+                e for e in self.entries if e.level is not LogLevel.DEBUG
             ]
 
             with open(export_path, 'w', encoding='utf-8') as f:
@@ -2,19 +2,49 @@
 Classe de base pour tous les modules fonctionnels
 """
 
+import asyncio
 import customtkinter as ctk
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Mapping
+import inspect
+import os
+import sys
 import threading
+import time
+from types import MappingProxyType
 
 from ..core.logger import Logger, LogLevel, get_logger
 from ..core.config import ConfigManager
 from ..core.constants import COLORS, StepStatus
 
 
-class BaseModule(ABC):
+def _NOOP(*args, **kwargs):
+    """Callback par défaut: ne fait rien"""
+    return None
+
+
+def _safe_wrap(callback: Optional[Callable], logger: Logger) -> Callable:
+    """
+    Enveloppe un callback utilisateur une seule fois, à l'enregistrement
+
+    Une exception levée par le callback est journalisée en DEBUG au lieu
+    d'interrompre la tâche ou d'être silencieusement ignorée.
+    """
+    if callback is None:
+        return _NOOP
+
+    def wrapper(*args):
+        try:
+            return callback(*args)
+        except Exception as e:
+            logger.debug(f"Erreur dans le callback {getattr(callback, '__name__', callback)!r}: {e}")
+
+    return wrapper
+
+
+class BaseModule:
     """
-    Classe de base abstraite pour tous les modules de l'application
+    Classe de base pour tous les modules de l'application
 
     Fournit:
     - Interface standard (frame)
@@ -22,14 +52,64 @@ class BaseModule(ABC):
     - Gestion de la configuration
     - Exécution asynchrone
     - Callbacks de progression
+
+    _execute_task s'exécute dans un thread de travail et ne doit pas manipuler
+    les widgets Tk directement: les callbacks de progression, de statut et de
+    fin sont réacheminés vers le thread de l'IHM (voir _ui_dispatch).
+
+    Les attributs d'instance de la classe de base sont déclarés dans __slots__.
+    Un module peut déclarer ses propres __slots__ pour ses attributs; sinon il
+    dispose d'un __dict__ habituel pour ceux-ci.
     """
 
+    __slots__ = (
+        'parent', 'config', 'logger', 'frame',
+        'is_running', '_cancel_event', 'current_future',
+        '_progress_callback', '_status_callback', '_complete_callback',
+        '_last_progress', '_last_progress_ts', '_last_status',
+        '_mod_settings', '_mod_settings_source', '_mod_settings_version',
+        '_log_fn', '_log_source', '_execute_task_fn',
+        '__weakref__',
+    )
+
     # Métadonnées du module (à surcharger)
     MODULE_ID = "base"
     MODULE_NAME = "Module de base"
     MODULE_DESCRIPTION = "Description du module"
     MODULE_ICON = "📦"
 
+    # Limitation du débit des notifications de progression vers l'IHM
+    PROGRESS_MIN_STEP = 0.005
+    PROGRESS_MIN_INTERVAL = 0.033  # secondes (~30 mises à jour/s)
+
+    # Pool de threads partagé par tous les modules (créé à la première exécution).
+    # Ses threads ne sont pas des démons: à la fermeture, les tâches encore en
+    # cours sont attendues au plus SHUTDOWN_TIMEOUT secondes (voir wait_for_workers)
+    EXECUTOR_THREAD_PREFIX = "etp-mod"
+    SHUTDOWN_TIMEOUT = 2.0
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    # Forme fixe des résultats transmis au callback de fin
+    _RESULT_TEMPLATE = MappingProxyType({'error': None, 'cancelled': False, 'data': None})
+
+    # Méthodes que chaque module doit implémenter
+    _REQUIRED_METHODS = ('_create_interface', '_execute_task', 'validate_inputs')
+
+    def __init_subclass__(cls, **kwargs):
+        """Vérifie une seule fois, à la définition de la classe, les méthodes obligatoires"""
+        super().__init_subclass__(**kwargs)
+        # Identifiant interné: source des logs et clé des paramètres du module
+        cls.MODULE_ID = sys.intern(cls.MODULE_ID)
+        missing = [
+            name for name in BaseModule._REQUIRED_METHODS
+            if getattr(cls, name) is getattr(BaseModule, name)
+        ]
+        if missing:
+            raise TypeError(
+                f"{cls.__name__} doit implémenter: {', '.join(missing)}"
+            )
+
     def __init__(
         self,
         parent: ctk.CTkFrame,
@@ -40,28 +120,48 @@ class BaseModule(ABC):
         self.config = config_manager
         self.logger = logger or get_logger()
 
+        # Raccourcis de logging liés une seule fois (appels positionnels)
+        self._log_fn = self.logger._log
+        self._log_source = self.MODULE_ID
+
+        # Paramètres du module en cache (rechargés si la configuration est remplacée ou modifiée)
+        self._mod_settings: Dict[str, Any] = {}
+        self._mod_settings_source = None
+        self._mod_settings_version = -1
+
         # Frame principal du module
         self.frame = ctk.CTkFrame(parent, fg_color="transparent")
 
         # État
         self.is_running = False
-        self.should_cancel = False
-        self.current_thread: Optional[threading.Thread] = None
+        self._cancel_event = threading.Event()
+        self.current_future: Optional[Future] = None
 
         # Callbacks
-        self._progress_callback: Optional[Callable[[float], None]] = None
-        self._status_callback: Optional[Callable[[str, str], None]] = None
-        self._complete_callback: Optional[Callable[[bool, Dict], None]] = None
+        self._progress_callback: Callable[[float], None] = _NOOP
+        self._status_callback: Callable[[str, str], None] = _NOOP
+        self._complete_callback: Callable[[bool, Dict], None] = _NOOP
+
+        # Dernières notifications transmises (limitation du débit)
+        self._last_progress = -1.0
+        self._last_progress_ts = 0.0
+        self._last_status: Optional[tuple] = None
+
+        # Tâche liée une seule fois (évite la résolution d'attribut à chaque exécution).
+        # Un module peut définir `async def _execute_task`: la coroutine est alors
+        # exécutée dans une boucle asyncio propre au thread de travail.
+        if inspect.iscoroutinefunction(self._execute_task):
+            self._execute_task_fn = lambda: asyncio.run(self._execute_task())
+        else:
+            self._execute_task_fn = self._execute_task
 
         # Initialiser l'interface
         self._create_interface()
 
-    @abstractmethod
     def _create_interface(self):
         """Crée l'interface du module (à implémenter)"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def _execute_task(self) -> Dict[str, Any]:
         """
         Exécute la tâche principale du module (à implémenter)
@@ -69,9 +169,8 @@ class BaseModule(ABC):
         Returns:
             Dictionnaire de résultats
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def validate_inputs(self) -> tuple[bool, str]:
         """
         Valide les entrées utilisateur (à implémenter)
@@ -79,7 +178,7 @@ class BaseModule(ABC):
         Returns:
             Tuple (valide, message d'erreur si non valide)
         """
-        pass
+        raise NotImplementedError
 
     def get_frame(self) -> ctk.CTkFrame:
         """Retourne le frame principal du module"""
@@ -95,47 +194,80 @@ class BaseModule(ABC):
 
     def log(self, message: str, level: LogLevel = LogLevel.INFO):
         """Enregistre un message de log"""
-        self.logger._log(level, message, source=self.MODULE_ID)
+        self._log_fn(level, message, self._log_source)
 
-    def log_info(self, message: str):
-        self.log(message, LogLevel.INFO)
+    # Les helpers acceptent un formatage différé: log_info("Fichier %s", nom)
+    # n'effectue le formatage que si le niveau n'est pas filtré.
+    def log_info(self, message: str, *args):
+        self._log_fn(LogLevel.INFO, message, self._log_source, args)
 
-    def log_success(self, message: str):
-        self.log(message, LogLevel.SUCCESS)
+    def log_success(self, message: str, *args):
+        self._log_fn(LogLevel.SUCCESS, message, self._log_source, args)
 
-    def log_warning(self, message: str):
-        self.log(message, LogLevel.WARNING)
+    def log_warning(self, message: str, *args):
+        self._log_fn(LogLevel.WARNING, message, self._log_source, args)
 
-    def log_error(self, message: str):
-        self.log(message, LogLevel.ERROR)
+    def log_error(self, message: str, *args):
+        self._log_fn(LogLevel.ERROR, message, self._log_source, args)
 
     def set_progress_callback(self, callback: Callable[[float], None]):
         """Définit le callback de progression (0.0 à 1.0)"""
-        self._progress_callback = callback
+        self._progress_callback = _safe_wrap(callback, self.logger)
 
     def set_status_callback(self, callback: Callable[[str, str], None]):
         """Définit le callback de statut (message, niveau)"""
-        self._status_callback = callback
+        self._status_callback = _safe_wrap(callback, self.logger)
 
     def set_complete_callback(self, callback: Callable[[bool, Dict], None]):
-        """Définit le callback de fin (succès, résultats)"""
-        self._complete_callback = callback
+        """
+        Définit le callback de fin (succès, résultats)
+
+        resultats contient toujours les clés 'error' (message ou None),
+        'cancelled' (bool) et 'data' (valeur retournée par _execute_task).
+        """
+        self._complete_callback = _safe_wrap(callback, self.logger)
 
     def update_progress(self, progress: float):
-        """Met à jour la progression"""
-        if self._progress_callback:
-            try:
-                self._progress_callback(progress)
-            except Exception:
-                pass
+        """Met à jour la progression (au plus ~30 fois par seconde, 0 et 1 toujours transmis)"""
+        if self._progress_callback is _NOOP:
+            return
+        now = time.monotonic()
+        if (0.0 < progress < 1.0
+                and abs(progress - self._last_progress) < self.PROGRESS_MIN_STEP
+                and now - self._last_progress_ts < self.PROGRESS_MIN_INTERVAL):
+            return
+        self._last_progress = progress
+        self._last_progress_ts = now
+        self._ui_dispatch(self._progress_callback, progress)
 
     def update_status(self, message: str, level: str = "info"):
-        """Met à jour le statut"""
-        if self._status_callback:
-            try:
-                self._status_callback(message, level)
-            except Exception:
-                pass
+        """Met à jour le statut (un statut identique au précédent n'est pas retransmis)"""
+        if self._status_callback is _NOOP:
+            return
+        status = (message, level)
+        if status == self._last_status:
+            return
+        self._last_status = status
+        self._ui_dispatch(self._status_callback, message, level)
+
+    def _ui_dispatch(self, fn: Callable, *args):
+        """
+        Exécute fn sur le thread de l'IHM
+
+        Appel direct depuis le thread principal; depuis un thread de travail,
+        l'appel est planifié dans la boucle Tk via after(0, ...). Tk n'étant pas
+        thread-safe, ce réacheminement reste nécessaire même sans GIL.
+        """
+        if fn is _NOOP:
+            return
+        if threading.current_thread() is threading.main_thread():
+            fn(*args)
+            return
+        try:
+            self.frame.after(0, fn, *args)
+        except RuntimeError:
+            # Boucle Tk non démarrée (exécution sans IHM): appel direct
+            fn(*args)
 
     def start_execution(self):
         """Démarre l'exécution dans un thread séparé"""
@@ -146,86 +278,187 @@ class BaseModule(ABC):
         # Valider les entrées
         valid, error = self.validate_inputs()
         if not valid:
-            self.log_error(f"Validation échouée: {error}")
+            self.log_error("Validation échouée: %s", error)
             self.update_status(error, "error")
             return
 
         self.is_running = True
-        self.should_cancel = False
+        self._cancel_event.clear()
         self.update_progress(0)
         self.update_status("Démarrage...", "info")
 
-        # Lancer dans un thread
-        self.current_thread = threading.Thread(target=self._run_task, daemon=True)
-        self.current_thread.start()
+        # Lancer dans le pool de threads partagé
+        self.current_future = BaseModule._get_executor().submit(self._run_task)
+
+    def run_in_background(
+        self,
+        work: Callable[[], Any],
+        on_done: Callable[[Any, Optional[Exception]], None]
+    ) -> Future:
+        """
+        Exécute une opération bloquante hors du thread de l'IHM
+
+        work s'exécute dans le pool de threads partagé, puis on_done(résultat,
+        exception ou None) est appelé sur le thread de l'IHM.
+        """
+        def done(future: Future):
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, e
+            self._ui_dispatch(on_done, result, error)
+
+        future = BaseModule._get_executor().submit(work)
+        future.add_done_callback(done)
+        return future
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Retourne le pool de threads partagé, créé à la demande"""
+        if BaseModule._executor is None:
+            with BaseModule._executor_lock:
+                if BaseModule._executor is None:
+                    BaseModule._executor = ThreadPoolExecutor(
+                        max_workers=os.cpu_count(),
+                        thread_name_prefix=BaseModule.EXECUTOR_THREAD_PREFIX
+                    )
+        return BaseModule._executor
+
+    @classmethod
+    def shutdown_executor(cls):
+        """Arrête le pool partagé sans attendre (tâches en file annulées)"""
+        with BaseModule._executor_lock:
+            if BaseModule._executor is not None:
+                BaseModule._executor.shutdown(wait=False, cancel_futures=True)
+                BaseModule._executor = None
+
+    @classmethod
+    def wait_for_workers(cls, timeout: float) -> bool:
+        """
+        Attend au plus timeout secondes la fin des threads du pool (après shutdown_executor)
+
+        Returns:
+            True si tous les threads du pool sont terminés
+        """
+        deadline = time.monotonic() + timeout
+        for thread in threading.enumerate():
+            if thread.name.startswith(BaseModule.EXECUTOR_THREAD_PREFIX):
+                thread.join(max(0.0, deadline - time.monotonic()))
+                if thread.is_alive():
+                    return False
+        return True
 
     def _run_task(self):
         """Exécute la tâche dans le thread"""
         success = False
-        results = {}
+        results = dict(self._RESULT_TEMPLATE)
 
         try:
-            self.log_info(f"Démarrage de {self.MODULE_NAME}")
-            results = self._execute_task()
-            success = not self.should_cancel
+            self.log_info("Démarrage de %s", self.MODULE_NAME)
+            results['data'] = self._execute_task_fn()
+            success = not self._cancel_event.is_set()
 
             if success:
-                self.log_success(f"{self.MODULE_NAME} terminé avec succès")
+                self.log_success("%s terminé avec succès", self.MODULE_NAME)
                 self.update_status("Terminé avec succès", "success")
             else:
+                results['cancelled'] = True
                 self.log_warning("Exécution annulée")
                 self.update_status("Annulé", "warning")
 
         except Exception as e:
-            self.log_error(f"Erreur: {str(e)}")
-            self.update_status(f"Erreur: {str(e)}", "error")
+            self.log_error("Erreur: %s", e)
+            self.update_status(f"Erreur: {e}", "error")
             results["error"] = str(e)
 
         finally:
             self.is_running = False
             self.update_progress(1.0 if success else 0)
 
-            if self._complete_callback:
-                try:
-                    self._complete_callback(success, results)
-                except Exception:
-                    pass
+            self._ui_dispatch(self._complete_callback, success, results)
 
     def cancel_execution(self):
         """Annule l'exécution en cours"""
         if self.is_running:
-            self.should_cancel = True
+            self._cancel_event.set()
+
+            # Tâche encore en file d'attente: elle ne démarrera jamais
+            if self.current_future is not None and self.current_future.cancel():
+                self.is_running = False
+                self.log_warning("Exécution annulée")
+                self.update_status("Annulé", "warning")
+                self.update_progress(0)
+                self._complete_callback(False, {**self._RESULT_TEMPLATE, 'cancelled': True})
+                return
+
             self.log_warning("Annulation demandée...")
             self.update_status("Annulation en cours...", "warning")
 
     def is_cancelled(self) -> bool:
         """Vérifie si l'annulation a été demandée"""
-        return self.should_cancel
+        return self._cancel_event.is_set()
+
+    @property
+    def cancel_event(self) -> threading.Event:
+        """
+        Événement d'annulation
+
+        Les tâches peuvent attendre dessus (cancel_event.wait(timeout)) plutôt
+        que d'appeler time.sleep, pour réagir immédiatement à une annulation.
+        """
+        return self._cancel_event
+
+    @property
+    def should_cancel(self) -> bool:
+        """Indique si l'annulation a été demandée (compatibilité)"""
+        return self._cancel_event.is_set()
+
+    @should_cancel.setter
+    def should_cancel(self, value: bool):
+        if value:
+            self._cancel_event.set()
+        else:
+            self._cancel_event.clear()
 
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """Récupère une valeur de configuration du module"""
         if self.config:
-            mod_config = self.config.get_module_config(self.MODULE_ID)
-            return mod_config.settings.get(key, default)
+            return self._get_mod_settings().get(key, default)
         return default
 
     def set_config_value(self, key: str, value: Any):
         """Définit une valeur de configuration du module"""
         if self.config:
+            # Modifie le même dictionnaire que celui mis en cache
             self.config.set_module_setting(self.MODULE_ID, key, value)
 
+    def _get_mod_settings(self) -> Dict[str, Any]:
+        """Dictionnaire des paramètres du module, mis en cache par configuration et version"""
+        app_config = self.config.config
+        version = self.config.version
+        if self._mod_settings_source is not app_config or self._mod_settings_version != version:
+            self._mod_settings = self.config.get_module_config(self.MODULE_ID).settings
+            self._mod_settings_source = app_config
+            self._mod_settings_version = version
+        return self._mod_settings
+
     def reset(self):
         """Réinitialise le module (à surcharger si nécessaire)"""
-        self.should_cancel = False
+        self._cancel_event.clear()
         self.update_progress(0)
         self.update_status("", "info")
 
     @classmethod
-    def get_metadata(cls) -> Dict[str, str]:
-        """Retourne les métadonnées du module"""
-        return {
-            "id": cls.MODULE_ID,
-            "name": cls.MODULE_NAME,
-            "description": cls.MODULE_DESCRIPTION,
-            "icon": cls.MODULE_ICON
-        }
+    def get_metadata(cls) -> Mapping[str, str]:
+        """Retourne les métadonnées du module (vue en lecture seule, calculée une fois par classe)"""
+        # cls.__dict__ et non getattr: une sous-classe ne doit pas hériter du cache parent
+        metadata = cls.__dict__.get('_metadata')
+        if metadata is None:
+            metadata = MappingProxyType({
+                "id": cls.MODULE_ID,
+                "name": cls.MODULE_NAME,
+                "description": cls.MODULE_DESCRIPTION,
+                "icon": cls.MODULE_ICON
+            })
+            cls._metadata = metadata
+        return metadata
@@ -5,10 +5,12 @@ Compare des données Excel avec d'autres fichiers Excel ou PDF/Word
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Tuple
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+import os
 import threading
 
 from .base_module import BaseModule
@@ -18,6 +20,28 @@ from ..ui.components.preview_table import PreviewTable
 from ..ui.components.stat_card import StatCardGroup
 from ..core.constants import COLORS
 from ..utils.excel_utils import ExcelUtils
+from ..utils import text_matching
+from ..utils.text_matching import FuzzyMatcher
+
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ImportError:
+    rf_process = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Taille maximale d'un bloc de la matrice de scores RapidFuzz (cellules et
+# lignes): l'annulation est vérifiée entre deux blocs
+FUZZY_BLOCK_CELLS = 1 << 22
+FUZZY_BLOCK_ROWS = 1024
+
+# Repli difflib: taille des blocs de valeurs et volume (valeurs × références)
+# à partir duquel le travail est réparti sur plusieurs processus
+DIFFLIB_BLOCK_SIZE = 256
+PROCESS_POOL_MIN_PAIRS = 200_000
 
 
 class CompareModule(BaseModule):
@@ -39,7 +63,7 @@ class CompareModule(BaseModule):
 
     def __init__(self, *args, **kwargs):
         self._stop_event = threading.Event()
-        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
         super().__init__(*args, **kwargs)
 
     def _create_interface(self):
@@ -379,40 +403,55 @@ class CompareModule(BaseModule):
     def _extract_text_from_document(self, filepath: str) -> str:
         """Extrait le texte d'un document PDF ou Word"""
         ext = Path(filepath).suffix.lower()
-        text = ""
+        parts: List[str] = []
 
         if ext == ".pdf":
             try:
-                import PyPDF2
-                with open(filepath, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    for page in reader.pages:
-                        text += page.extract_text() + "\n"
+                # PDFium (C++) si disponible: extraction nettement plus rapide
+                import pypdfium2 as pdfium
+                pdf = pdfium.PdfDocument(filepath)
+                try:
+                    # PDFium n'est pas thread-safe: les pages sont lues séquentiellement
+                    for page in pdf:
+                        textpage = page.get_textpage()
+                        parts.append(textpage.get_text_range())
+                        textpage.close()
+                        page.close()
+                finally:
+                    pdf.close()
             except ImportError:
-                # Fallback avec pdfplumber si disponible
                 try:
-                    import pdfplumber
-                    with pdfplumber.open(filepath) as pdf:
-                        for page in pdf.pages:
-                            text += (page.extract_text() or "") + "\n"
+                    import PyPDF2
+                    with open(filepath, 'rb') as f:
+                        reader = PyPDF2.PdfReader(f)
+                        for page in reader.pages:
+                            parts.append(page.extract_text())
                 except ImportError:
-                    raise ImportError("PyPDF2 ou pdfplumber requis pour lire les PDF")
+                    # Fallback avec pdfplumber si disponible
+                    try:
+                        import pdfplumber
+                        with pdfplumber.open(filepath) as pdf:
+                            for page in pdf.pages:
+                                parts.append(page.extract_text() or "")
+                    except ImportError:
+                        raise ImportError("pypdfium2, PyPDF2 ou pdfplumber requis pour lire les PDF")
+            # Chaque page suivie d'un saut de ligne
+            return "\n".join(parts) + "\n" if parts else ""
 
         elif ext in [".docx", ".doc"]:
             try:
                 from docx import Document
                 doc = Document(filepath)
-                for para in doc.paragraphs:
-                    text += para.text + "\n"
+                parts.extend(para.text + "\n" for para in doc.paragraphs)
                 for table in doc.tables:
+                    # Une chaîne par ligne du tableau (cellules séparées par des espaces)
                     for row in table.rows:
-                        for cell in row.cells:
-                            text += cell.text + " "
-                    text += "\n"
+                        parts.append(" ".join(cell.text for cell in row.cells) + " ")
+                    parts.append("\n")
             except ImportError:
                 raise ImportError("python-docx requis pour lire les fichiers Word")
 
-        return text
+        return "".join(parts)
 
     def _compare_excel_files(self):
         """Compare deux fichiers Excel"""
@@ -440,45 +479,53 @@ class CompareModule(BaseModule):
             case_sensitive = self.case_sensitive_var.get()
             threshold = self.similarity_slider.get() / 100
 
-            # Préparer les valeurs
-            values_to_find = df1[col1].dropna().astype(str).unique()
-            reference_values = set(df2[col2].dropna().astype(str))
+            # Préparer les valeurs (normalisées une seule fois)
+            # Colonne convertie une seule fois: sert aussi à répartir les lignes
+            keys = df1[col1]
+            keys_str = keys.astype(str)
+            values_to_find = keys_str[keys.notna().to_numpy()].unique()
+            search_values = pd.Series(values_to_find, dtype=object)
+            reference_series = df2[col2].dropna().astype(str)
 
             if not case_sensitive:
-                reference_values = {v.lower() for v in reference_values}
+                search_values = search_values.str.lower()
+                reference_series = reference_series.str.lower()
+
+            # Références uniques dans une liste contiguë (recherche et scoring)
+            reference_values = reference_series.drop_duplicates().tolist()
 
             found_values = []
             not_found_values = []
             total = len(values_to_find)
 
-            for idx, value in enumerate(values_to_find):
-                if self._stop_event.is_set():
-                    break
-
-                search_value = value if case_sensitive else value.lower()
-
-                if exact:
-                    is_found = search_value in reference_values
-                else:
-                    # Correspondance approximative avec difflib
-                    from difflib import SequenceMatcher
-                    is_found = any(
-                        SequenceMatcher(None, search_value, ref).ratio() >= threshold
-                        for ref in reference_values
+            if exact:
+                # Correspondance exacte vectorisée: une seule recherche par hachage
+                found_mask = search_values.isin(reference_values).to_numpy()
+                found_values = values_to_find[found_mask]
+                not_found_values = values_to_find[~found_mask]
+                self.frame.after(0, lambda: self.progress_bar_excel.set(1.0))
+
+            else:
+                # Valeurs ne différant que par la casse: comparées une seule fois
+                codes, unique_search = pd.factorize(search_values)
+                if rf_process is not None:
+                    # Correspondance approximative vectorisée (RapidFuzz)
+                    unique_found, processed = self._fuzzy_found_mask(
+                        unique_search.tolist(), reference_values, threshold
                     )
-
-                if is_found:
-                    found_values.append(value)
                 else:
-                    not_found_values.append(value)
-
-                # Mise à jour progression
-                progress = (idx + 1) / total
-                self.frame.after(0, lambda p=progress: self.progress_bar_excel.set(p))
+                    # Repli sans RapidFuzz: difflib, réparti sur plusieurs processus
+                    unique_found, processed = self._difflib_found_mask(
+                        unique_search.tolist(), reference_values, threshold
+                    )
+                # Valeurs uniques traitées dans l'ordre: code < processed si traité
+                done = codes < processed
+                found_mask = unique_found[codes]
+                found_values = values_to_find[done & found_mask]
+                not_found_values = values_to_find[done & ~found_mask]
 
             # Créer les DataFrames de résultats
-            self.df_found = df1[df1[col1].astype(str).isin(found_values)]
-            self.df_not_found = df1[df1[col1].astype(str).isin(not_found_values)]
+            self.df_found, self.df_not_found = self._partition_rows(df1, keys_str, found_values, not_found_values)
 
             # Mettre à jour l'interface
             self.frame.after(0, lambda: self._display_comparison_results(total))
@@ -490,6 +537,98 @@ class CompareModule(BaseModule):
         finally:
             self.frame.after(0, lambda: self.compare_excel_btn.configure(state="normal"))
 
+    @staticmethod
+    def _partition_rows(df: pd.DataFrame, col_str: pd.Series, found_values, not_found_values) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Sépare les lignes de df selon que leur clé (col_str, colonne déjà
+        convertie en texte) a été trouvée ou non
+
+        Les masques sont des tableaux NumPy: pas d'alignement d'index lors de
+        la sélection.
+        """
+        found_mask = col_str.isin(found_values).to_numpy()
+        not_found_mask = col_str.isin(not_found_values).to_numpy()
+        return df.iloc[found_mask], df.iloc[not_found_mask]
+
+    def _fuzzy_found_mask(self, search_values, reference_list: List[str], threshold: float) -> Tuple[np.ndarray, int]:
+        """
+        Indique pour chaque valeur si une référence atteint le seuil de similarité
+
+        La matrice de scores est calculée par blocs de lignes pour borner la
+        mémoire; la progression et l'annulation sont traitées entre deux blocs.
+
+        Returns:
+            Tuple (masque des valeurs trouvées, nombre de valeurs traitées)
+        """
+        total = len(search_values)
+        found_mask = np.zeros(total, dtype=bool)
+        if not reference_list:
+            return found_mask, total
+
+        cutoff = threshold * 100
+        block = max(1, min(FUZZY_BLOCK_ROWS, FUZZY_BLOCK_CELLS // len(reference_list)))
+        processed = 0
+        for start in range(0, total, block):
+            if self._stop_event.is_set():
+                break
+            scores = rf_process.cdist(
+                search_values[start:start + block], reference_list,
+                scorer=rf_fuzz.ratio, score_cutoff=cutoff, workers=-1
+            )
+            found_mask[start:start + block] = (scores >= cutoff).any(axis=1)
+            processed = min(start + block, total)
+
+            progress = processed / total
+            self.frame.after(0, lambda p=progress: self.progress_bar_excel.set(p))
+
+        return found_mask, processed
+
+    def _difflib_found_mask(self, search_values: List[str], reference_list: List[str], threshold: float) -> Tuple[np.ndarray, int]:
+        """
+        Équivalent difflib de _fuzzy_found_mask, traité par blocs de valeurs
+
+        Au-delà de PROCESS_POOL_MIN_PAIRS comparaisons, les blocs sont répartis
+        sur un ProcessPoolExecutor (difflib est en Python pur et ne libère pas
+        le GIL); les références sont transmises une seule fois par processus.
+
+        Returns:
+            Tuple (masque des valeurs trouvées, nombre de valeurs traitées)
+        """
+        total = len(search_values)
+        found_mask = np.zeros(total, dtype=bool)
+        starts = range(0, total, DIFFLIB_BLOCK_SIZE)
+        blocks = [search_values[start:start + DIFFLIB_BLOCK_SIZE] for start in starts]
+        workers = os.cpu_count() or 1
+
+        if workers > 1 and total * len(reference_list) >= PROCESS_POOL_MIN_PAIRS:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=text_matching.init_worker,
+                initargs=(reference_list, threshold)
+            )
+            futures = [self._executor.submit(text_matching.worker_found_mask, block) for block in blocks]
+            results = (future.result() for future in futures)
+        else:
+            results = map(FuzzyMatcher(reference_list, threshold).found_mask, blocks)
+
+        processed = 0
+        try:
+            for start, block_mask in zip(starts, results):
+                found_mask[start:start + len(block_mask)] = block_mask
+                processed = start + len(block_mask)
+
+                progress = processed / total
+                self.frame.after(0, lambda p=progress: self.progress_bar_excel.set(p))
+
+                if self._stop_event.is_set():
+                    break
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+        return found_mask, processed
+
     def _compare_excel_document(self):
         """Compare Excel avec un document PDF/Word"""
         if not self.excel_doc_selector.is_loaded():
@@ -523,26 +662,37 @@ class CompareModule(BaseModule):
             df = self.excel_doc_selector.get_dataframe()
             col = self.col_doc_combo.get()
 
-            values_to_find = df[col].dropna().astype(str).unique()
+            keys = df[col]
+            keys_str = keys.astype(str)
+            values_to_find = keys_str[keys.notna().to_numpy()].unique()
             found_values = []
             not_found_values = []
             total = len(values_to_find)
 
-            for idx, value in enumerate(values_to_find):
-                if self._stop_event.is_set():
-                    break
-
-                # Recherche insensible à la casse par défaut
-                if value.lower() in doc_text_lower:
-                    found_values.append(value)
-                else:
-                    not_found_values.append(value)
-
-                progress = (idx + 1) / total
-                self.frame.after(0, lambda p=progress: self.progress_bar_doc.set(p))
-
-            self.df_found = df[df[col].astype(str).isin(found_values)]
-            self.df_not_found = df[df[col].astype(str).isin(not_found_values)]
+            if ahocorasick is not None:
+                # Toutes les valeurs recherchées en un seul parcours du texte (Aho-Corasick)
+                found_mask = self._find_in_text_mask(values_to_find, doc_text_lower)
+                found_values = values_to_find[found_mask]
+                not_found_values = values_to_find[~found_mask]
+                self.frame.after(0, lambda: self.progress_bar_doc.set(1.0))
+            else:
+                # Au plus ~100 mises à jour de la barre de progression
+                # (annulation vérifiée au même rythme)
+                step = max(1, total // 100)
+                for idx, value in enumerate(values_to_find):
+                    # Recherche insensible à la casse par défaut
+                    if value.lower() in doc_text_lower:
+                        found_values.append(value)
+                    else:
+                        not_found_values.append(value)
+
+                    if (idx + 1) % step == 0 or idx + 1 == total:
+                        progress = (idx + 1) / total
+                        self.frame.after(0, lambda p=progress: self.progress_bar_doc.set(p))
+                        if self._stop_event.is_set():
+                            break
+
+            self.df_found, self.df_not_found = self._partition_rows(df, keys_str, found_values, not_found_values)
 
             self.frame.after(0, lambda: self._display_comparison_results(total))
 
@@ -553,6 +703,31 @@ class CompareModule(BaseModule):
         finally:
             self.frame.after(0, lambda: self.compare_doc_btn.configure(state="normal"))
 
+    @staticmethod
+    def _find_in_text_mask(values, text_lower: str) -> np.ndarray:
+        """
+        Indique pour chaque valeur si elle apparaît (sans tenir compte de la casse) dans le texte
+
+        Construit un automate Aho-Corasick sur les valeurs puis parcourt le
+        texte une seule fois, au lieu d'une recherche de sous-chaîne par valeur.
+        """
+        needles = [v.lower() for v in values]
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            if needle:
+                automaton.add_word(needle, needle)
+
+        hits = set()
+        if len(automaton):
+            automaton.make_automaton()
+            hits.update(needle for _, needle in automaton.iter(text_lower))
+
+        # La chaîne vide est contenue dans tout texte
+        return np.fromiter(
+            (not needle or needle in hits for needle in needles),
+            dtype=bool, count=len(needles)
+        )
+
     def _display_comparison_results(self, total: int):
         """Affiche les résultats de comparaison"""
         found = len(self.df_found) if self.df_found is not None else 0
@@ -598,28 +773,42 @@ class CompareModule(BaseModule):
 
         try:
             from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+            from openpyxl.styles import Font, PatternFill, Border, Side, NamedStyle
 
-            wb = Workbook()
-            wb.remove(wb.active)
+            # Mode écriture seule: les lignes sont écrites en flux (mémoire constante)
+            wb = Workbook(write_only=True)
 
-            # Styles
-            header_fill = PatternFill(start_color="2E5090", end_color="2E5090", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF")
-            found_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-            not_found_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+            # Styles nommés, enregistrés une seule fois dans le classeur
             border = Border(
                 left=Side(style='thin'), right=Side(style='thin'),
                 top=Side(style='thin'), bottom=Side(style='thin')
             )
+            header_style = NamedStyle(
+                name="etp_header",
+                fill=PatternFill(start_color="2E5090", end_color="2E5090", fill_type="solid"),
+                font=Font(bold=True, color="FFFFFF"),
+                border=border
+            )
+            found_style = NamedStyle(
+                name="etp_found",
+                fill=PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+                border=border
+            )
+            not_found_style = NamedStyle(
+                name="etp_not_found",
+                fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
+                border=border
+            )
+            for style in (header_style, found_style, not_found_style):
+                wb.add_named_style(style)
 
             if mode in ["found", "all"] and self.df_found is not None and len(self.df_found) > 0:
                 ws = wb.create_sheet("Trouvées")
-                self._write_df_to_sheet(ws, self.df_found, header_fill, header_font, found_fill, border)
+                self._write_df_to_sheet(ws, self.df_found, header_style.name, found_style.name)
 
             if mode in ["not_found", "all"] and self.df_not_found is not None and len(self.df_not_found) > 0:
                 ws = wb.create_sheet("Non_Trouvées")
-                self._write_df_to_sheet(ws, self.df_not_found, header_fill, header_font, not_found_fill, border)
+                self._write_df_to_sheet(ws, self.df_not_found, header_style.name, not_found_style.name)
 
             wb.save(filepath)
             messagebox.showinfo("Succès", f"Résultats exportés vers:\n{filepath}")
@@ -629,26 +818,33 @@ class CompareModule(BaseModule):
             messagebox.showerror("Erreur", str(e))
             self.log_error(str(e))
 
-    def _write_df_to_sheet(self, ws, df, header_fill, header_font, row_fill, border):
-        """Écrit un DataFrame dans une feuille avec formatage"""
-        # En-têtes
-        for col_idx, col_name in enumerate(df.columns, 1):
-            cell = ws.cell(row=1, column=col_idx, value=col_name)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.border = border
-
-        # Données
-        for row_idx, row in enumerate(df.itertuples(index=False), 2):
-            for col_idx, value in enumerate(row, 1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                cell.fill = row_fill
-                cell.border = border
+    @staticmethod
+    def _write_df_to_sheet(ws, df: pd.DataFrame, header_style: str, row_style: str):
+        """
+        Écrit un DataFrame dans une feuille en écriture seule avec formatage
+
+        Les largeurs de colonnes doivent être fixées avant la première ligne
+        en mode écriture seule: elles sont donc calculées au préalable.
+        """
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
 
         # Ajuster les colonnes
-        for col_idx, col_name in enumerate(df.columns, 1):
-            max_length = max(len(str(col_name)), df[col_name].astype(str).str.len().max())
-            ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(max_length + 2, 50)
+        for col_idx, (col_name, values) in enumerate(df.items(), 1):
+            max_length = max(len(str(col_name)), max(map(len, map(str, values)), default=0))
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
+
+        def styled(value, style):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style
+            return cell
+
+        # En-têtes
+        ws.append([styled(col_name, header_style) for col_name in df.columns])
+
+        # Données (listes de valeurs Python, sans namedtuple par ligne)
+        for row in df.to_numpy(dtype=object).tolist():
+            ws.append([styled(value, row_style) for value in row])
 
     def validate_inputs(self) -> tuple[bool, str]:
         return True, ""
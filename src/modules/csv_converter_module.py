@@ -5,7 +5,7 @@ Conversion CSV <-> Excel et fusion de fichiers
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Tuple
 import pandas as pd
 from pathlib import Path
 
@@ -14,7 +14,14 @@ from ..ui.components.tooltip import Tooltip
 from ..ui.components.preview_table import PreviewTable
 from ..ui.components.stat_card import StatCardGroup
 from ..core.constants import COLORS
-from ..utils.excel_utils import ExcelUtils
+from ..utils.excel_utils import ExcelUtils, EXCEL_READ_ENGINE
+from ..utils.file_utils import FileUtils
+
+# Nombre de lignes lues par bloc lors de la conversion CSV → Excel
+CSV_CHUNK_SIZE = 100_000
+
+# Tampon d'écriture du CSV produit par la conversion Excel → CSV
+CSV_WRITE_BUFFER = 1 << 20
 
 
 class CSVConverterModule(BaseModule):
@@ -36,18 +43,28 @@ class CSVConverterModule(BaseModule):
     def _create_interface(self):
         """Crée l'interface du module"""
         # Onglets pour les différentes fonctionnalités
-        self.tabview = ctk.CTkTabview(self.frame, fg_color=COLORS["bg_card"])
+        self.tabview = ctk.CTkTabview(
+            self.frame, fg_color=COLORS["bg_card"], command=self._on_tab_change
+        )
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
 
-        self.tabview.add("CSV → Excel")
-        self.tabview.add("Excel → CSV")
-        self.tabview.add("Fusion Excel")
-        self.tabview.add("Exploration")
+        # Contenu des onglets construit à la première ouverture
+        self._tab_builders = {
+            "CSV → Excel": self._create_csv_to_excel_tab,
+            "Excel → CSV": self._create_excel_to_csv_tab,
+            "Fusion Excel": self._create_merge_tab,
+            "Exploration": self._create_exploration_tab,
+        }
+        for name in self._tab_builders:
+            self.tabview.add(name)
 
-        self._create_csv_to_excel_tab()
-        self._create_excel_to_csv_tab()
-        self._create_merge_tab()
-        self._create_exploration_tab()
+        self._on_tab_change()
+
+    def _on_tab_change(self):
+        """Construit le contenu de l'onglet sélectionné s'il ne l'est pas encore"""
+        builder = self._tab_builders.pop(self.tabview.get(), None)
+        if builder:
+            builder()
 
     def _create_csv_to_excel_tab(self):
         """Onglet conversion CSV vers Excel"""
@@ -88,6 +105,33 @@ class CSVConverterModule(BaseModule):
         self.encoding_combo.set("utf-8")
         self.encoding_combo.pack(side="left", padx=10)
 
+        ctk.CTkLabel(options_frame, text="Lignes par bloc:").pack(side="left", padx=(20, 0))
+        self.chunksize_entry = ctk.CTkEntry(options_frame, width=80)
+        self.chunksize_entry.insert(0, str(CSV_CHUNK_SIZE))
+        self.chunksize_entry.pack(side="left", padx=10)
+        Tooltip(self.chunksize_entry, "Nombre de lignes lues à la fois (limite la mémoire utilisée)")
+
+        columns_frame = ctk.CTkFrame(section1, fg_color="transparent")
+        columns_frame.pack(fill="x", padx=15, pady=(0, 15))
+
+        ctk.CTkLabel(columns_frame, text="Colonnes:").pack(side="left")
+        self.csv_columns_entry = ctk.CTkEntry(columns_frame, width=300)
+        self.csv_columns_entry.pack(side="left", padx=10)
+        Tooltip(self.csv_columns_entry, "Colonnes à convertir, séparées par des virgules (vide = toutes)")
+
+        dates_frame = ctk.CTkFrame(section1, fg_color="transparent")
+        dates_frame.pack(fill="x", padx=15, pady=(0, 15))
+
+        ctk.CTkLabel(dates_frame, text="Colonnes date:").pack(side="left")
+        self.date_columns_entry = ctk.CTkEntry(dates_frame, width=200)
+        self.date_columns_entry.pack(side="left", padx=10)
+        Tooltip(self.date_columns_entry, "Colonnes à convertir en dates, séparées par des virgules")
+
+        ctk.CTkLabel(dates_frame, text="Format date:").pack(side="left", padx=(20, 0))
+        self.date_format_entry = ctk.CTkEntry(dates_frame, width=120)
+        self.date_format_entry.pack(side="left", padx=10)
+        Tooltip(self.date_format_entry, "Format des dates (ex: %d/%m/%Y), vide = ISO 8601")
+
         # Section fichier Excel de sortie
         section2 = ctk.CTkFrame(scroll, fg_color=COLORS["bg_card"], corner_radius=10)
         section2.pack(fill="x", pady=(0, 10))
@@ -112,6 +156,12 @@ class CSVConverterModule(BaseModule):
         self.sheet_name_entry.insert(0, "Données")
         self.sheet_name_entry.pack(side="left", padx=10)
 
+        self.values_only_var = ctk.BooleanVar(value=False)
+        values_only_check = ctk.CTkCheckBox(
+            frame3, text="Valeurs uniquement (sans mise en forme)", variable=self.values_only_var)
+        values_only_check.pack(side="left", padx=(20, 0))
+        Tooltip(values_only_check, "Écriture plus rapide, sans couleurs ni bordures")
+
         # Bouton de conversion
         ctk.CTkButton(
             scroll,
@@ -162,6 +212,11 @@ class CSVConverterModule(BaseModule):
         self.csv_separator_entry.insert(0, ",")
         self.csv_separator_entry.pack(side="left", padx=10)
 
+        ctk.CTkLabel(options_frame, text="Colonnes:").pack(side="left", padx=(20, 0))
+        self.excel_columns_entry = ctk.CTkEntry(options_frame, width=250)
+        self.excel_columns_entry.pack(side="left", padx=10)
+        Tooltip(self.excel_columns_entry, "Colonnes à exporter, séparées par des virgules (vide = toutes)")
+
         # Bouton de conversion
         ctk.CTkButton(
             scroll,
@@ -261,6 +316,14 @@ class CSVConverterModule(BaseModule):
         if filepath:
             self.csv_path_var.set(filepath)
 
+            # Format détecté sur un échantillon, modifiable avant conversion
+            encoding, separator = FileUtils.detect_csv_format(filepath)
+            if encoding:
+                self.encoding_combo.set(encoding)
+            if separator:
+                self.separator_entry.delete(0, "end")
+                self.separator_entry.insert(0, separator)
+
     def _browse_excel_output(self):
         filepath = filedialog.asksaveasfilename(
             title="Enregistrer sous",
@@ -276,25 +339,84 @@ class CSVConverterModule(BaseModule):
         separator = self.separator_entry.get() or ","
         encoding = self.encoding_combo.get()
         sheet_name = self.sheet_name_entry.get().strip() or "Données"
+        columns = self._parse_columns(self.csv_columns_entry.get())
+        date_columns = self._parse_columns(self.date_columns_entry.get())
+        date_format = self.date_format_entry.get().strip() or None
+        apply_formatting = not self.values_only_var.get()
 
         if not csv_path or not excel_path:
             messagebox.showwarning("Attention", "Veuillez sélectionner les fichiers")
             return
 
         try:
-            df = pd.read_csv(csv_path, sep=separator, encoding=encoding)
+            chunksize = int(self.chunksize_entry.get())
+        except ValueError:
+            chunksize = CSV_CHUNK_SIZE
+
+        def work():
+            if Path(excel_path).exists():
+                # Classeur existant: ses autres onglets sont conservés (chargement complet)
+                df = pd.read_csv(
+                    csv_path, sep=separator, encoding=encoding, usecols=columns,
+                    **ExcelUtils.csv_date_options(date_columns, date_format)
+                )
+                df = ExcelUtils.optimize_dtypes(df)
+                success, error = ExcelUtils.write_dataframe_to_excel(
+                    df, excel_path, sheet_name, apply_formatting=apply_formatting
+                )
+                return success, len(df), error
+
+            # Nouveau fichier: conversion en flux, mémoire bornée à un bloc
+            return ExcelUtils.write_csv_to_excel(
+                csv_path, excel_path, sheet_name,
+                sep=separator, encoding=encoding, chunksize=max(1, chunksize),
+                usecols=columns, date_columns=date_columns, date_format=date_format,
+                apply_formatting=apply_formatting
+            )
 
-            success, error = ExcelUtils.write_dataframe_to_excel(df, excel_path, sheet_name)
+        self._run_operation(
+            "Conversion CSV → Excel en cours...", work,
+            "Conversion terminée!\n{rows} lignes exportées", f"CSV converti: {csv_path}"
+        )
 
+    @staticmethod
+    def _parse_columns(text: str) -> Optional[List[str]]:
+        """Liste de colonnes saisie (séparées par des virgules), None si vide"""
+        columns = [col.strip() for col in text.split(",") if col.strip()]
+        return columns or None
+
+    def _run_operation(
+        self,
+        status: str,
+        work: Callable[[], Tuple[bool, int, Optional[str]]],
+        success_message: str,
+        log_message: str
+    ):
+        """
+        Lance une opération sur fichiers en arrière-plan
+
+        L'IHM reste réactive pendant l'opération; le résultat (succès, lignes,
+        erreur) est affiché à la fin. success_message peut contenir {rows}.
+        """
+        self.update_status(status, "info")
+
+        def on_done(result, exception):
+            if exception is not None:
+                self.update_status("Erreur", "error")
+                messagebox.showerror("Erreur", str(exception))
+                self.log_error(str(exception))
+                return
+
+            success, rows, error = result
             if success:
-                messagebox.showinfo("Succès", f"Conversion terminée!\n{len(df)} lignes exportées")
-                self.log_success(f"CSV converti: {csv_path}")
+                self.update_status("Terminé", "success")
+                messagebox.showinfo("Succès", success_message.format(rows=rows))
+                self.log_success(log_message)
             else:
+                self.update_status("Erreur", "error")
                 messagebox.showerror("Erreur", error)
 
-        except Exception as e:
-            messagebox.showerror("Erreur", str(e))
-            self.log_error(str(e))
+        self.run_in_background(work, on_done)
 
     # === Méthodes Excel -> CSV ===
 
@@ -308,19 +430,21 @@ class CSVConverterModule(BaseModule):
             self._load_excel_sheets(filepath)
 
     def _load_excel_sheets(self, filepath: str):
-        try:
-            df_dict = pd.read_excel(filepath, sheet_name=None, nrows=0)
-            sheets = list(df_dict.keys())
-            self.sheet_combo.configure(state="normal", values=sheets)
-            if sheets:
-                self.sheet_combo.set(sheets[0])
-        except Exception as e:
-            messagebox.showerror("Erreur", str(e))
+        # Noms lus dans les métadonnées du classeur, sans analyser les feuilles
+        sheets, error = ExcelUtils.get_sheet_names(filepath)
+        if error:
+            messagebox.showerror("Erreur", error)
+            return
+
+        self.sheet_combo.configure(state="normal", values=sheets)
+        if sheets:
+            self.sheet_combo.set(sheets[0])
 
     def _convert_excel_to_csv(self):
         excel_path = self.excel_input_var.get()
         sheet = self.sheet_combo.get()
         separator = self.csv_separator_entry.get() or ","
+        columns = self._parse_columns(self.excel_columns_entry.get())
 
         if not excel_path:
             messagebox.showwarning("Attention", "Veuillez sélectionner un fichier")
@@ -333,16 +457,19 @@ class CSVConverterModule(BaseModule):
         )
 
         if csv_path:
-            try:
-                df = pd.read_excel(excel_path, sheet_name=sheet)
-                df.to_csv(csv_path, sep=separator, index=False, encoding='utf-8')
-
-                messagebox.showinfo("Succès", f"Conversion terminée!\n{len(df)} lignes exportées")
-                self.log_success(f"Excel converti en CSV: {csv_path}")
-
-            except Exception as e:
-                messagebox.showerror("Erreur", str(e))
-                self.log_error(str(e))
+            def work():
+                df = pd.read_excel(
+                    excel_path, sheet_name=sheet, usecols=columns, engine=EXCEL_READ_ENGINE
+                )
+                # Fichier binaire à grand tampon: écritures disque moins nombreuses
+                with open(csv_path, 'wb', buffering=CSV_WRITE_BUFFER) as f:
+                    df.to_csv(f, sep=separator, index=False, encoding='utf-8')
+                return True, len(df), None
+
+            self._run_operation(
+                "Conversion Excel → CSV en cours...", work,
+                "Conversion terminée!\n{rows} lignes exportées", f"Excel converti en CSV: {csv_path}"
+            )
 
     # === Méthodes Fusion ===
 
@@ -370,22 +497,15 @@ class CSVConverterModule(BaseModule):
         )
 
         if output_path:
-            try:
-                success, rows, error = ExcelUtils.merge_excel_files(
-                    self.merge_files_list,
-                    output_path,
-                    skip_headers=self.skip_headers_var.get()
-                )
-
-                if success:
-                    messagebox.showinfo("Succès", f"Fusion terminée!\n{rows} lignes dans le fichier fusionné")
-                    self.log_success(f"Fichiers fusionnés: {output_path}")
-                else:
-                    messagebox.showerror("Erreur", error)
-
-            except Exception as e:
-                messagebox.showerror("Erreur", str(e))
-                self.log_error(str(e))
+            files = list(self.merge_files_list)
+            skip_headers = self.skip_headers_var.get()
+
+            self._run_operation(
+                "Fusion en cours...",
+                lambda: ExcelUtils.merge_excel_files(files, output_path, skip_headers=skip_headers),
+                "Fusion terminée!\n{rows} lignes dans le fichier fusionné",
+                f"Fichiers fusionnés: {output_path}"
+            )
 
     # === Méthodes Exploration ===
 
@@ -403,24 +523,20 @@ class CSVConverterModule(BaseModule):
             messagebox.showwarning("Attention", "Veuillez sélectionner un fichier")
             return
 
-        try:
-            from openpyxl import load_workbook
-            wb = load_workbook(filepath, read_only=True)
-            sheets = wb.sheetnames
-            wb.close()
-
-            result = f"FEUILLES DU FICHIER\n{'=' * 40}\n\n"
-            result += f"Fichier: {Path(filepath).name}\n"
-            result += f"Nombre de feuilles: {len(sheets)}\n\n"
-
-            for i, sheet in enumerate(sheets, 1):
-                result += f"  {i}. {sheet}\n"
+        sheets, error = ExcelUtils.get_sheet_names(filepath)
+        if error:
+            messagebox.showerror("Erreur", error)
+            return
 
-            self.explore_text.delete("1.0", "end")
-            self.explore_text.insert("1.0", result)
+        lines = [
+            "FEUILLES DU FICHIER", "=" * 40, "",
+            f"Fichier: {Path(filepath).name}",
+            f"Nombre de feuilles: {len(sheets)}", "",
+        ]
+        lines.extend(f"  {i}. {sheet}" for i, sheet in enumerate(sheets, 1))
 
-        except Exception as e:
-            messagebox.showerror("Erreur", str(e))
+        self.explore_text.delete("1.0", "end")
+        self.explore_text.insert("1.0", "\n".join(lines) + "\n")
 
     def _list_columns(self):
         filepath = self.explore_path_var.get()
@@ -428,22 +544,20 @@ class CSVConverterModule(BaseModule):
             messagebox.showwarning("Attention", "Veuillez sélectionner un fichier")
             return
 
-        try:
-            df = pd.read_excel(filepath, nrows=0)
-            columns = list(df.columns)
-
-            result = f"COLONNES DU FICHIER\n{'=' * 40}\n\n"
-            result += f"Fichier: {Path(filepath).name}\n"
-            result += f"Nombre de colonnes: {len(columns)}\n\n"
-
-            for i, col in enumerate(columns, 1):
-                result += f"  {i}. {col}\n"
+        columns, error = ExcelUtils.get_column_names(filepath)
+        if error:
+            messagebox.showerror("Erreur", error)
+            return
 
-            self.explore_text.delete("1.0", "end")
-            self.explore_text.insert("1.0", result)
+        lines = [
+            "COLONNES DU FICHIER", "=" * 40, "",
+            f"Fichier: {Path(filepath).name}",
+            f"Nombre de colonnes: {len(columns)}", "",
+        ]
+        lines.extend(f"  {i}. {col}" for i, col in enumerate(columns, 1))
 
-        except Exception as e:
-            messagebox.showerror("Erreur", str(e))
+        self.explore_text.delete("1.0", "end")
+        self.explore_text.insert("1.0", "\n".join(lines) + "\n")
 
     # === Méthodes obligatoires de BaseModule ===
 
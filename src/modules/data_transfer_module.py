@@ -5,10 +5,12 @@ Extraction et transfert de données avec configuration de champs
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import pandas as pd
 from pathlib import Path
-from datetime import datetime
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 from .base_module import BaseModule
 from ..ui.components.tooltip import Tooltip
@@ -17,6 +19,13 @@ from ..ui.components.stat_card import StatCardGroup
 from ..core.constants import COLORS
 from ..utils.excel_utils import ExcelUtils
 from ..utils.file_utils import FileUtils
+from ..utils.data_extraction import extract_fields, process_file, write_activity_sheet
+
+# Nombre de fichiers à partir duquel le traitement est réparti sur plusieurs processus
+PROCESS_POOL_MIN_FILES = 4
+
+# Nombre maximal de threads pour des fichiers sur un partage réseau
+NETWORK_MAX_THREADS = 32
 
 
 class DataTransferModule(BaseModule):
@@ -35,9 +44,15 @@ class DataTransferModule(BaseModule):
     MODULE_DESCRIPTION = "Extrait et transfère des données entre fichiers Excel"
     MODULE_ICON = "📋"
 
+    # Intervalle minimal entre deux rafraîchissements de la progression (secondes)
+    UI_UPDATE_INTERVAL = 0.1
+
     def __init__(self, *args, **kwargs):
         self.fields: List[Dict[str, str]] = []
         self.files: List[Path] = []
+        # Lignes de la liste des champs, réutilisées d'un affichage à l'autre
+        self._field_rows: List[Dict[str, Any]] = []
+        self._empty_fields_label: Optional[ctk.CTkLabel] = None
         super().__init__(*args, **kwargs)
 
     def _create_interface(self):
@@ -296,42 +311,56 @@ class DataTransferModule(BaseModule):
             self._update_fields_list()
 
     def _update_fields_list(self):
-        """Met à jour l'affichage de la liste des champs"""
-        for widget in self.fields_list_frame.winfo_children():
-            widget.destroy()
-
-        if not self.fields:
-            ctk.CTkLabel(
+        """
+        Met à jour l'affichage de la liste des champs
+
+        Les lignes déjà créées sont réutilisées (texte mis à jour) et les
+        lignes en trop sont masquées: seules les lignes manquantes sont créées.
+        """
+        if self._empty_fields_label is None:
+            self._empty_fields_label = ctk.CTkLabel(
                 self.fields_list_frame,
                 text="Aucun champ défini. Ajoutez des champs ci-dessus.",
                 text_color=COLORS["text_muted"]
-            ).pack(pady=10)
-            return
+            )
+
+        if self.fields:
+            self._empty_fields_label.pack_forget()
+        elif not self._empty_fields_label.winfo_manager():
+            self._empty_fields_label.pack(pady=10)
 
         for idx, field in enumerate(self.fields):
-            frame = ctk.CTkFrame(self.fields_list_frame, fg_color=("gray85", "gray25"))
-            frame.pack(fill="x", pady=2)
-
-            ctk.CTkLabel(
-                frame,
-                text=f"{idx + 1}. {field['name']}",
-                font=("Segoe UI", 11, "bold")
-            ).pack(side="left", padx=10, pady=5)
-
-            ctk.CTkLabel(
-                frame,
-                text=f"→ {field['term']}",
-                text_color=COLORS["text_muted"]
-            ).pack(side="left", padx=(0, 10))
+            if idx == len(self._field_rows):
+                self._field_rows.append(self._create_field_row(idx))
+            row = self._field_rows[idx]
+            row["name"].configure(text=f"{idx + 1}. {field['name']}")
+            row["term"].configure(text=f"→ {field['term']}")
+            if not row["frame"].winfo_manager():
+                row["frame"].pack(fill="x", pady=2)
+
+        for row in self._field_rows[len(self.fields):]:
+            row["frame"].pack_forget()
 
-            ctk.CTkButton(
-                frame,
-                text="❌",
-                width=30,
-                height=24,
-                fg_color=COLORS["error"],
-                command=lambda i=idx: self._remove_field(i)
-            ).pack(side="right", padx=5, pady=3)
+    def _create_field_row(self, idx: int) -> Dict[str, Any]:
+        """Crée les widgets de la ligne idx de la liste des champs (non affichée)"""
+        frame = ctk.CTkFrame(self.fields_list_frame, fg_color=("gray85", "gray25"))
+
+        name_label = ctk.CTkLabel(frame, text="", font=("Segoe UI", 11, "bold"))
+        name_label.pack(side="left", padx=10, pady=5)
+
+        term_label = ctk.CTkLabel(frame, text="", text_color=COLORS["text_muted"])
+        term_label.pack(side="left", padx=(0, 10))
+
+        ctk.CTkButton(
+            frame,
+            text="❌",
+            width=30,
+            height=24,
+            fg_color=COLORS["error"],
+            command=lambda: self._remove_field(idx)
+        ).pack(side="right", padx=5, pady=3)
+
+        return {"frame": frame, "name": name_label, "term": term_label}
 
     def _preview_extraction(self, filepath: str):
         """Prévisualise l'extraction sur un fichier"""
@@ -351,76 +380,7 @@ class DataTransferModule(BaseModule):
 
     def _extract_data_from_file(self, filepath: str, sheet_name: str) -> Optional[Dict]:
         """Extrait les données d'un fichier avec détection intelligente"""
-        from openpyxl import load_workbook
-
-        wb = load_workbook(filepath, data_only=True)
-        if sheet_name not in wb.sheetnames:
-            wb.close()
-            return None
-
-        sheet = wb[sheet_name]
-        data = {}
-
-        for field in self.fields:
-            term = field['term'].lower()
-            value = None
-
-            for row in sheet.iter_rows(min_row=1, max_row=200, values_only=False):
-                for cell in row:
-                    if cell.value is None:
-                        continue
-
-                    cell_text = str(cell.value).strip().lower()
-                    if term in cell_text:
-                        col_idx = cell.column
-                        row_idx = cell.row
-
-                        # Stratégie 1: Chercher à droite sur la même ligne
-                        for next_col in range(col_idx + 1, min(col_idx + 5, sheet.max_column + 1)):
-                            next_cell = sheet.cell(row=row_idx, column=next_col)
-                            if next_cell.value is not None:
-                                val = next_cell.value
-                                if isinstance(val, datetime):
-                                    val = val.strftime("%d/%m/%Y")
-                                value = str(val).strip()
-                                if value:
-                                    break
-
-                        # Stratégie 2: Si rien trouvé, chercher en dessous (format vertical)
-                        if not value:
-                            for next_row in range(row_idx + 1, min(row_idx + 3, sheet.max_row + 1)):
-                                below_cell = sheet.cell(row=next_row, column=col_idx)
-                                if below_cell.value is not None:
-                                    val = below_cell.value
-                                    if isinstance(val, datetime):
-                                        val = val.strftime("%d/%m/%Y")
-                                    value = str(val).strip()
-                                    if value:
-                                        break
-
-                        # Stratégie 3: Chercher cellule fusionnée adjacente
-                        if not value and hasattr(sheet, 'merged_cells'):
-                            for merged_range in sheet.merged_cells.ranges:
-                                if (merged_range.min_row == row_idx and
-                                    merged_range.min_col > col_idx and
-                                    merged_range.min_col <= col_idx + 3):
-                                    merged_cell = sheet.cell(row=merged_range.min_row, column=merged_range.min_col)
-                                    if merged_cell.value is not None:
-                                        val = merged_cell.value
-                                        if isinstance(val, datetime):
-                                            val = val.strftime("%d/%m/%Y")
-                                        value = str(val).strip()
-                                        break
-
-                        if value:
-                            break
-                if value:
-                    break
-
-            data[field['name']] = value or ""
-
-        wb.close()
-        return data
+        return extract_fields(filepath, sheet_name, self.fields)
 
     def validate_inputs(self) -> tuple[bool, str]:
         """Valide les entrées"""
@@ -437,7 +397,12 @@ class DataTransferModule(BaseModule):
         return True, ""
 
     def _execute_task(self) -> Dict[str, Any]:
-        """Exécute le traitement des fichiers"""
+        """
+        Exécute le traitement des fichiers
+
+        Les fichiers sont indépendants et peuvent être traités en parallèle
+        (voir _parallel_pool).
+        """
         sheet_name = self.sheet_combo.get()
         output_sheet = self.output_sheet_entry.get().strip() or "Activité"
 
@@ -445,77 +410,97 @@ class DataTransferModule(BaseModule):
         success = 0
         errors = 0
 
-        for idx, filepath in enumerate(self.files):
-            if self.is_cancelled():
-                break
-
-            self.update_progress((idx + 1) / total)
-            self.update_status(f"Traitement: {filepath.name}")
-
-            try:
-                data = self._extract_data_from_file(str(filepath), sheet_name)
+        pool = self._parallel_pool(total)
+        if pool is not None:
+            results = self._process_files_parallel(*pool, sheet_name, output_sheet)
+        else:
+            results = self._process_files_serial(sheet_name, output_sheet)
 
-                if data and any(data.values()):
-                    self._create_activity_sheet(filepath, data, output_sheet)
-                    success += 1
-                    self.log_success(f"Traité: {filepath.name}")
-                else:
-                    errors += 1
-                    self.log_warning(f"Aucune donnée trouvée: {filepath.name}")
+        # Affichage regroupé: au plus un rafraîchissement par UI_UPDATE_INTERVAL
+        last_update = 0.0
+        for done, (filepath, found, error) in enumerate(results, 1):
+            now = time.monotonic()
+            if done == total or now - last_update >= self.UI_UPDATE_INTERVAL:
+                last_update = now
+                self._ui_dispatch(self._show_progress, done / total, f"Traité: {filepath.name}")
 
-            except Exception as e:
+            if error is not None:
+                errors += 1
+                self.log_error(f"Erreur {filepath.name}: {error}")
+            elif found:
+                success += 1
+                self.log_success(f"Traité: {filepath.name}")
+            else:
                 errors += 1
-                self.log_error(f"Erreur {filepath.name}: {e}")
+                self.log_warning(f"Aucune donnée trouvée: {filepath.name}")
 
         # Mise à jour de l'interface
-        self.frame.after(0, lambda: self._update_stats(total, success, errors))
+        self._ui_dispatch(self._update_stats, total, success, errors)
 
         return {"total": total, "success": success, "errors": errors}
 
-    def _create_activity_sheet(self, filepath: Path, data: Dict, sheet_name: str):
-        """Crée la feuille d'activité dans le fichier"""
-        from openpyxl import load_workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    def _process_files_serial(self, sheet_name: str, output_sheet: str):
+        """Traite les fichiers un par un: (fichier, données trouvées, erreur)"""
+        for filepath in self.files:
+            if self.is_cancelled():
+                break
 
-        wb = load_workbook(filepath)
+            try:
+                yield filepath, process_file(filepath, sheet_name, self.fields, output_sheet), None
+            except Exception as e:
+                yield filepath, False, e
+
+    def _parallel_pool(self, total: int) -> Optional[Tuple[type, int]]:
+        """
+        Choisit l'exécuteur du traitement parallèle: (classe, nombre de workers)
+
+        Sur un partage réseau (chemin UNC), la latence d'accès aux fichiers
+        domine: des threads suffisent à la recouvrir, sans démarrage de
+        processus ni sérialisation. Sinon l'analyse XML, limitée par le CPU,
+        est répartie sur des processus au-delà de PROCESS_POOL_MIN_FILES.
+        Retourne None pour un traitement séquentiel.
+        """
+        cpus = os.cpu_count() or 1
+        if any(str(path).startswith(("\\\\", "//")) for path in self.files):
+            workers = min(NETWORK_MAX_THREADS, cpus * 4, total)
+            return (ThreadPoolExecutor, workers) if workers > 1 else None
+
+        workers = min(cpus, total)
+        if workers > 1 and total >= PROCESS_POOL_MIN_FILES:
+            return ProcessPoolExecutor, workers
+        return None
+
+    def _process_files_parallel(self, executor_class: type, workers: int,
+                                sheet_name: str, output_sheet: str):
+        """Traite les fichiers en parallèle, dans l'ordre de fin"""
+        self._ui_dispatch(
+            self.update_status, f"Traitement de {len(self.files)} fichiers ({workers} en parallèle)"
+        )
 
-        if sheet_name in wb.sheetnames:
-            del wb[sheet_name]
+        with executor_class(max_workers=workers) as executor:
+            futures = {
+                executor.submit(process_file, filepath, sheet_name, self.fields, output_sheet): filepath
+                for filepath in self.files
+            }
+            for future in as_completed(futures):
+                if self.is_cancelled():
+                    # Les fichiers en cours se terminent, les autres ne démarrent pas
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
 
-        ws = wb.create_sheet(sheet_name)
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as e:
+                    yield futures[future], False, e
 
-        # Styles
-        header_fill = PatternFill(start_color="2E5090", end_color="2E5090", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        label_fill = PatternFill(start_color="D6DCE4", end_color="D6DCE4", fill_type="solid")
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+    def _show_progress(self, progress: float, message: str):
+        """Met à jour la barre de progression et le statut (thread de l'IHM)"""
+        self.progress_bar.set(progress)
+        self.update_status(message)
 
-        # En-tête
-        ws.merge_cells('A1:B1')
-        ws['A1'] = "DONNÉES EXTRAITES"
-        ws['A1'].fill = header_fill
-        ws['A1'].font = header_font
-        ws['A1'].alignment = Alignment(horizontal='center')
-
-        # Données
-        row = 2
-        for field in self.fields:
-            ws.cell(row=row, column=1, value=field['name']).fill = label_fill
-            ws.cell(row=row, column=1).border = border
-            ws.cell(row=row, column=2, value=data.get(field['name'], "")).border = border
-            row += 1
-
-        # Ajuster les colonnes
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 40
-
-        wb.save(filepath)
-        wb.close()
+    def _create_activity_sheet(self, filepath: Path, data: Dict, sheet_name: str):
+        """Crée la feuille d'activité dans le fichier"""
+        write_activity_sheet(filepath, data, self.fields, sheet_name)
 
     def _update_stats(self, total: int, success: int, errors: int):
         """Met à jour les statistiques affichées"""
@@ -5,8 +5,8 @@ Visualiseur de logs en temps réel avec filtrage
 import customtkinter as ctk
 from tkinter import ttk
 import tkinter as tk
+import time
 from typing import Optional, List
-from datetime import datetime
 
 from .tooltip import Tooltip
 from ...core.constants import COLORS
@@ -182,7 +182,7 @@ class LogViewer(ctk.CTkFrame):
         self.log_text.configure(state="normal")
 
         # Formater le message
-        timestamp = f"[{entry.timestamp.strftime('%H:%M:%S')}] "
+        timestamp = f"[{entry.time_str}] "
         level_str = f"[{entry.level.name_str}] "
         message = f"{entry.message}\n"
 
@@ -232,7 +232,7 @@ class LogViewer(ctk.CTkFrame):
     def log(self, message: str, level: LogLevel = LogLevel.INFO, source: str = ""):
         """Méthode raccourci pour ajouter un log"""
         entry = LogEntry(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             level=level,
             message=message,
             source=source
@@ -6,6 +6,7 @@ Tous les paramètres sont exposés et modifiables via l'IHM
 
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
+import os
 import webbrowser
 from typing import Dict, Optional
 from pathlib import Path
@@ -18,6 +19,7 @@ from .components.tooltip import Tooltip
 from .components.log_viewer import LogViewer
 from .components.settings_panel import SettingsPanel, SettingDefinition, SettingType
 
+from ..modules.base_module import BaseModule
 from ..modules.merge_module import MergeModule
 from ..modules.file_search_module import FileSearchModule
 from ..modules.data_transfer_module import DataTransferModule
@@ -864,6 +866,11 @@ SUPPORT:
 
     def _on_closing(self):
         """Gestionnaire de fermeture de l'application"""
+        # Annuler les traitements en cours et libérer le pool de threads
+        for module in self.modules.values():
+            module.cancel_execution()
+        BaseModule.shutdown_executor()
+
         # Sauvegarder la configuration
         self.config_manager.save()
 
@@ -879,6 +886,15 @@ def main():
     try:
         app = ExcelToolsProApp()
         app.mainloop()
+
+        # Fenêtre fermée: attente bornée des tâches en cours (hors boucle Tk, que
+        # leur notification de fin sollicite). Une tâche bloquante sans point
+        # d'annulation (lecture pandas...) retiendrait sinon le processus, les
+        # threads du pool n'étant pas des démons.
+        BaseModule.shutdown_executor()
+        if not BaseModule.wait_for_workers(BaseModule.SHUTDOWN_TIMEOUT):
+            app.logger.shutdown()
+            os._exit(0)
     except Exception as e:
         import traceback
         error_msg = f"""
@@ -0,0 +1,457 @@
+"""
+Extraction de champs dans des fichiers Excel pour ExcelToolsPro
+Fonctions de niveau module, utilisables dans des processus de travail
+"""
+
+import html
+import os
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from bisect import bisect_right
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from openpyxl import load_workbook
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+# Lecture rapide (Rust) si disponible
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Nombre de lignes parcourues pour rechercher les libellés
+SEARCH_MAX_ROWS = 200
+
+# Taille de fichier xlsx en deçà de laquelle calamine est toujours utilisé
+CALAMINE_MAX_BYTES = 256 * 1024
+
+# Rapport taille des feuilles / taille des chaînes partagées au-delà duquel
+# la lecture en flux d'openpyxl est préférée à calamine (voir _prefer_calamine)
+STREAMING_SST_RATIO = 25
+
+# Caractères du texte d'un nombre, d'une date ou d'une durée ("1 day, 2:00:00")
+_NON_TEXT_CHARS = frozenset("0123456789.+-:e ,days")
+_XML_TAG = re.compile(r'<[^>]*>')
+# Balises de section de texte enrichi (<r>), avec ou sans préfixe d'espace de noms
+_RUN_TAGS = ('<r>', '<r ', ':r>', ':r ')
+# Types de cellule dont le texte n'est pas dans la table des chaînes partagées
+_TEXT_CELL_TYPE = re.compile(rb"""<(?:\w+:)?c\b[^>]*\bt=["'](?:inlineStr|str|e)["']""")
+_ROW_NUMBER = re.compile(rb"""<(?:\w+:)?row\b[^>]*\br=["'](\d+)["']""")
+_SHEET_SCAN_CHUNK = 64 * 1024
+
+# Styles de la feuille d'activité (construits une fois, partagés entre fichiers)
+HEADER_FILL = PatternFill(start_color="2E5090", end_color="2E5090", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+HEADER_ALIGNMENT = Alignment(horizontal='center')
+LABEL_FILL = PatternFill(start_color="D6DCE4", end_color="D6DCE4", fill_type="solid")
+_THIN = Side(style='thin')
+CELL_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+
+
+def _format_value(val) -> str:
+    """Convertit une valeur de cellule en texte (dates au format jj/mm/aaaa)"""
+    if isinstance(val, datetime):
+        val = val.strftime("%d/%m/%Y")
+    return str(val).strip()
+
+
+def _calamine_value(val):
+    """
+    Aligne une valeur lue par calamine sur celle d'openpyxl (data_only)
+
+    calamine renvoie "" pour une cellule vide, des flottants pour tous les
+    nombres et des dates sans heure: le texte comparé et extrait reste ainsi
+    identique quel que soit le moteur de lecture.
+    """
+    if val == "":
+        return None
+    if isinstance(val, float) and val.is_integer() and abs(val) < 1e15:
+        return int(val)
+    if isinstance(val, date) and not isinstance(val, datetime):
+        return datetime(val.year, val.month, val.day)
+    return val
+
+
+def _resolve_value(grid: List[list], row_idx: int, col_idx: int) -> Optional[str]:
+    """Valeur associée au libellé situé en (row_idx, col_idx), None si aucune"""
+    # Stratégie 1: Chercher à droite sur la même ligne
+    for next_value in grid[row_idx][col_idx + 1:col_idx + 5]:
+        if next_value is not None:
+            value = _format_value(next_value)
+            if value:
+                return value
+
+    # Stratégie 2: Si rien trouvé, chercher en dessous (format vertical)
+    for below in grid[row_idx + 1:row_idx + 3]:
+        if col_idx < len(below) and below[col_idx] is not None:
+            value = _format_value(below[col_idx])
+            if value:
+                return value
+
+    return None
+
+
+def _iter_rows(filepath: Union[str, Path], sheet_name: str, nrows: int) -> Optional[Iterator[list]]:
+    """
+    Parcourt les valeurs des nrows premières lignes de la feuille (à partir de A1)
+
+    Utilise calamine si disponible et plus rapide (voir _prefer_calamine),
+    sinon openpyxl en lecture seule. L'itérateur retourné doit être fermé
+    (close) s'il n'est pas consommé entièrement.
+
+    Returns:
+        Lignes de valeurs (None pour une cellule vide), None si la feuille n'existe pas
+    """
+    if _prefer_calamine(filepath):
+        wb = CalamineWorkbook.from_path(str(filepath))
+        try:
+            if sheet_name not in wb.sheet_names:
+                return None
+            rows = wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False, nrows=nrows)
+        finally:
+            wb.close()
+        return ([_calamine_value(v) for v in row] for row in rows)
+
+    # Lecture seule: pas de modèle objet des cellules, lignes lues à la demande
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    if sheet_name not in wb.sheetnames:
+        wb.close()
+        return None
+    sheet = wb[sheet_name]
+    # Ne pas se fier à la dimension déclarée, parfois absente ou fausse
+    sheet.reset_dimensions()
+    return _closing_rows(wb, sheet.iter_rows(max_row=nrows, values_only=True))
+
+
+def _prefer_calamine(filepath: Union[str, Path]) -> bool:
+    """
+    Indique si calamine doit être utilisé pour lire le fichier
+
+    calamine (Rust) analyse toujours la feuille entière, rapidement. openpyxl
+    en lecture seule lit la feuille au fil de l'eau et s'arrête aux lignes
+    demandées, mais analyse d'abord en Python toute la table des chaînes
+    partagées (environ 25 fois plus lentement). openpyxl n'est donc retenu
+    que pour un gros fichier dont les feuilles pèsent plus de
+    STREAMING_SST_RATIO fois la table des chaînes.
+    """
+    if CalamineWorkbook is None:
+        return False
+    if (Path(filepath).suffix.lower() not in ('.xlsx', '.xlsm')
+            or os.path.getsize(filepath) <= CALAMINE_MAX_BYTES):
+        return True
+
+    try:
+        with zipfile.ZipFile(filepath) as archive:
+            sizes = [(info.filename.lower(), info.file_size) for info in archive.infolist()]
+    except zipfile.BadZipFile:
+        return True
+
+    sheets_size = sum(size for name, size in sizes if name.startswith('xl/worksheets/'))
+    strings_size = sum(size for name, size in sizes if name.endswith('sharedstrings.xml'))
+    return sheets_size <= STREAMING_SST_RATIO * strings_size
+
+
+def _closing_rows(wb, rows) -> Iterator[list]:
+    """Lignes d'un classeur openpyxl, fermé à la fin du parcours"""
+    try:
+        for row in rows:
+            yield list(row)
+    finally:
+        wb.close()
+
+
+def extract_fields(filepath: Union[str, Path], sheet_name: str,
+                   fields: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """
+    Extrait les valeurs associées aux libellés des champs
+
+    Pour chaque champ, la première cellule contenant le terme (sans tenir
+    compte de la casse) est recherchée, puis sa valeur: à droite sur la même
+    ligne (y compris une cellule fusionnée adjacente, dont la valeur est dans
+    la première cellule) ou en dessous (format vertical).
+
+    Les lignes sont analysées au fil de la lecture: celle-ci s'arrête dès
+    que tous les champs ont une valeur.
+
+    Args:
+        filepath: Chemin du fichier Excel
+        sheet_name: Feuille source
+        fields: Champs à extraire ({"name": ..., "term": ...})
+
+    Returns:
+        Dictionnaire nom du champ -> valeur ("" si non trouvée),
+        None si la feuille n'existe pas
+    """
+    terms = [field['term'].lower() for field in fields]
+    if _labels_absent(filepath, sheet_name, terms):
+        return {field['name']: "" for field in fields}
+
+    # 2 lignes au-delà de la zone de recherche pour les valeurs en dessous
+    rows = _iter_rows(filepath, sheet_name, SEARCH_MAX_ROWS + 2)
+    if rows is None:
+        return None
+
+    find_labels = _label_matcher(terms)
+    values: List[Optional[str]] = [None] * len(fields)
+    pending = len(fields)
+    grid = []
+    scanned = 0
+
+    try:
+        # Une ligne est analysée dès que les 2 lignes suivantes sont lues
+        for row in rows:
+            grid.append(row)
+            if len(grid) - scanned > 2:
+                pending -= _scan_row(grid, scanned, find_labels, values)
+                scanned += 1
+                if not pending:
+                    break
+        else:
+            while pending and scanned < min(len(grid), SEARCH_MAX_ROWS):
+                pending -= _scan_row(grid, scanned, find_labels, values)
+                scanned += 1
+    finally:
+        rows.close()
+
+    return {field['name']: value or "" for field, value in zip(fields, values)}
+
+
+def _labels_absent(filepath: Union[str, Path], sheet_name: str, terms: List[str]) -> bool:
+    """
+    Vérifie, sans lire les cellules, qu'aucun terme ne peut figurer dans la feuille
+
+    Dans un fichier xlsx, le texte saisi est stocké dans la table des chaînes
+    partagées (xl/sharedStrings.xml): si aucun terme n'y figure, la lecture
+    du classeur est inutile. La conclusion n'est tirée que si les autres
+    sources de texte sont exclues: chaînes en ligne, résultats texte de
+    formules ou erreurs dans les lignes de recherche, et termes pouvant
+    apparaître dans le texte d'un nombre, d'une date ou d'un booléen.
+
+    Returns:
+        True si la feuille existe et ne contient aucun libellé, False en cas de doute
+    """
+    if not terms or any(_may_match_non_text(term) for term in terms):
+        return False
+    if Path(filepath).suffix.lower() not in ('.xlsx', '.xlsm'):
+        return False
+
+    try:
+        with zipfile.ZipFile(filepath) as archive:
+            names = archive.namelist()
+            strings_part = next((n for n in names if n.lower().endswith('sharedstrings.xml')), None)
+            sheet_part = _sheet_part(archive, sheet_name)
+            if strings_part is None or sheet_part not in names:
+                return False
+
+            strings = archive.read(strings_part).decode('utf-8', 'replace').lower()
+            if any(term in strings for term in terms):
+                return False
+            # Un terme peut être coupé par des balises de texte enrichi ou masqué
+            # par une entité: comparaison sur le texte seul (une ligne par chaîne)
+            if '&' in strings or any(tag in strings for tag in _RUN_TAGS):
+                text = html.unescape(_XML_TAG.sub('', strings.replace('</si>', '\n'))).lower()
+                if any(term in text for term in terms):
+                    return False
+
+            return not _has_other_text_cells(archive, sheet_part, SEARCH_MAX_ROWS)
+    except (zipfile.BadZipFile, KeyError, ET.ParseError):
+        return False
+
+
+def _may_match_non_text(term: str) -> bool:
+    """Indique si term peut apparaître dans le texte d'un nombre, d'une date, d'une durée ou d'un booléen"""
+    return set(term) <= _NON_TEXT_CHARS or term in "true" or term in "false"
+
+
+def _sheet_part(archive: zipfile.ZipFile, sheet_name: str) -> Optional[str]:
+    """Chemin, dans l'archive xlsx, du XML de la feuille sheet_name (None si absente)"""
+    rel_id = None
+    for element in ET.fromstring(archive.read('xl/workbook.xml')).iter():
+        if element.tag.endswith('}sheet') and element.get('name') == sheet_name:
+            rel_id = next((v for k, v in element.attrib.items() if k.endswith('}id')), None)
+            break
+    if rel_id is None:
+        return None
+
+    for element in ET.fromstring(archive.read('xl/_rels/workbook.xml.rels')).iter():
+        if element.tag.endswith('}Relationship') and element.get('Id') == rel_id:
+            target = element.get('Target', '')
+            if target.startswith('/'):
+                return target[1:]
+            return posixpath.normpath(posixpath.join('xl', target))
+    return None
+
+
+def _has_other_text_cells(archive: zipfile.ZipFile, sheet_part: str, max_row: int) -> bool:
+    """
+    Indique si les max_row premières lignes de la feuille contiennent du texte
+    hors chaînes partagées (chaîne en ligne, résultat texte de formule, erreur)
+
+    Le XML est décompressé par blocs et la lecture s'arrête après la ligne max_row.
+    """
+    tail = b""
+    with archive.open(sheet_part) as stream:
+        while True:
+            chunk = stream.read(_SHEET_SCAN_CHUNK)
+            if not chunk:
+                return False
+            # Recouvrement pour les motifs à cheval sur deux blocs
+            data = tail + chunk
+            if _TEXT_CELL_TYPE.search(data):
+                return True
+            rows = _ROW_NUMBER.findall(data)
+            if rows and int(rows[-1]) > max_row:
+                return False
+            tail = data[-256:]
+
+
+def _scan_row(grid: List[list], row_idx: int, find_labels, values: List[Optional[str]]) -> int:
+    """
+    Résout les champs dont un libellé se trouve sur la ligne row_idx
+
+    Pour chaque champ, la première occurrence (dans l'ordre des cellules)
+    dont la valeur est non vide l'emporte.
+
+    Returns:
+        Nombre de champs résolus sur cette ligne
+    """
+    # Texte normalisé de chaque cellule, calculé une seule fois pour tous les champs
+    text_row = [None if v is None else str(v).strip().lower() for v in grid[row_idx]]
+    resolved = 0
+
+    for col_idx, field_indexes in find_labels(text_row):
+        value = None
+        for idx in field_indexes:
+            if values[idx] is not None:
+                continue
+            if value is None:
+                value = _resolve_value(grid, row_idx, col_idx) or ""
+            if value:
+                values[idx] = value
+                resolved += 1
+
+    return resolved
+
+
+def _label_matcher(terms: List[str]):
+    """
+    Construit la recherche des termes dans les textes d'une ligne
+
+    Avec pyahocorasick, tous les termes sont recherchés en un seul parcours
+    du texte de la ligne (cellules concaténées avec un séparateur absent des
+    fichiers xlsx), au lieu d'un test de sous-chaîne par terme et par cellule.
+
+    Returns:
+        Fonction: textes des cellules (None si vide) ->
+        [(colonne, index des termes trouvés)], dans l'ordre des colonnes
+    """
+    if ahocorasick is None or not terms or not all(terms):
+        def find_labels(text_row: List[Optional[str]]) -> List[Tuple[int, List[int]]]:
+            found = []
+            for col_idx, cell_text in enumerate(text_row):
+                if cell_text is not None:
+                    indexes = [idx for idx, term in enumerate(terms) if term in cell_text]
+                    if indexes:
+                        found.append((col_idx, indexes))
+            return found
+
+        return find_labels
+
+    automaton = ahocorasick.Automaton()
+    for idx, term in enumerate(terms):
+        if term in automaton:
+            automaton.get(term).append(idx)
+        else:
+            automaton.add_word(term, [idx])
+    automaton.make_automaton()
+
+    def find_labels(text_row: List[Optional[str]]) -> List[Tuple[int, List[int]]]:
+        columns = []
+        starts = []
+        texts = []
+        offset = 0
+        for col_idx, cell_text in enumerate(text_row):
+            if cell_text is not None:
+                columns.append(col_idx)
+                starts.append(offset)
+                texts.append(cell_text)
+                offset += len(cell_text) + 1
+
+        # Les correspondances arrivent par position de fin croissante, donc dans l'ordre des colonnes
+        found = []
+        for end, indexes in automaton.iter("\0".join(texts)):
+            col_idx = columns[bisect_right(starts, end) - 1]
+            if found and found[-1][0] == col_idx:
+                found[-1][1].extend(indexes)
+            else:
+                found.append((col_idx, list(indexes)))
+        return found
+
+    return find_labels
+
+
+def write_activity_sheet(filepath: Union[str, Path], data: Dict[str, str],
+                         fields: List[Dict[str, str]], sheet_name: str):
+    """
+    Crée (ou remplace) la feuille d'activité dans le fichier
+
+    Args:
+        filepath: Chemin du fichier Excel (modifié sur place)
+        data: Valeurs extraites par nom de champ
+        fields: Champs, dans l'ordre d'affichage
+        sheet_name: Nom de la feuille à créer
+    """
+    wb = load_workbook(filepath)
+
+    if sheet_name in wb.sheetnames:
+        del wb[sheet_name]
+
+    ws = wb.create_sheet(sheet_name)
+
+    # En-tête
+    ws.merge_cells('A1:B1')
+    title = ws['A1']
+    title.value = "DONNÉES EXTRAITES"
+    title.fill = HEADER_FILL
+    title.font = HEADER_FONT
+    title.alignment = HEADER_ALIGNMENT
+
+    # Données
+    for row, field in enumerate(fields, 2):
+        label = ws.cell(row=row, column=1, value=field['name'])
+        label.fill = LABEL_FILL
+        label.border = CELL_BORDER
+        ws.cell(row=row, column=2, value=data.get(field['name'], "")).border = CELL_BORDER
+
+    # Ajuster les colonnes
+    ws.column_dimensions['A'].width = 30
+    ws.column_dimensions['B'].width = 40
+
+    wb.save(filepath)
+    wb.close()
+
+
+def process_file(filepath: Union[str, Path], sheet_name: str,
+                 fields: List[Dict[str, str]], output_sheet: str) -> bool:
+    """
+    Traite un fichier: extraction des champs puis écriture de la feuille d'activité
+
+    Tâche de ProcessPoolExecutor (fonction de module, sérialisable).
+
+    Returns:
+        True si des données ont été trouvées et écrites, False sinon
+    """
+    data = extract_fields(filepath, sheet_name, fields)
+    if data and any(data.values()):
+        write_activity_sheet(filepath, data, fields, output_sheet)
+        return True
+    return False
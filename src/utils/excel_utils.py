@@ -4,16 +4,121 @@ Fonctions communes de lecture/écriture/formatage Excel
 Utilise la configuration centralisée pour tous les paramètres
 """
 
+import functools
+import itertools
+import os
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from datetime import date, datetime, time
 
 from openpyxl import load_workbook, Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.utils import get_column_letter
 
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Lecture complète des feuilles: moteur calamine (Rust, pandas 2.2+) si disponible
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READ_ENGINE = "calamine"
+except ImportError:
+    EXCEL_READ_ENGINE = None
+
+# Nombre de lignes préparées à la fois lors de l'écriture avec xlsxwriter
+XLSXWRITER_BLOCK_ROWS = 10_000
+DATE_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+
+# Taille totale à partir de laquelle les fichiers à fusionner sont lus en parallèle
+MERGE_PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+
+# Textes lus comme valeurs manquantes par pandas.read_excel (na_values par défaut)
+PANDAS_NA_STRINGS = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+})
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_sheet_names(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Onglets d'un classeur, mis en cache par version du fichier (date, taille)"""
+    with pd.ExcelFile(path) as xl:
+        return tuple(xl.sheet_names)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_column_names(path: str, sheet_name: Any, mtime_ns: int, size: int) -> Tuple[Any, ...]:
+    """
+    En-têtes d'un onglet, mis en cache par version du fichier (date, taille)
+
+    Pour un xlsx, seule la première ligne est lue (openpyxl en lecture seule),
+    avec le nommage de pandas: colonnes vides de fin ignorées, en-têtes vides
+    "Unnamed: n", doublons suffixés ".1", ".2"...
+    """
+    if Path(path).suffix.lower() not in ('.xlsx', '.xlsm'):
+        return tuple(pd.read_excel(path, sheet_name=sheet_name, nrows=0).columns)
+
+    wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+        row = list(next(ws.iter_rows(max_row=1, values_only=True), ()))
+    finally:
+        wb.close()
+
+    while row and row[-1] is None:
+        row.pop()
+
+    names = [f"Unnamed: {col_idx}" if value is None else value for col_idx, value in enumerate(row)]
+    original = set(names)
+    counts: Dict[Any, int] = {}
+    for col_idx, base in enumerate(names):
+        name = base
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in original else counts.get(name, 0)
+        names[col_idx] = name
+        counts[name] = count + 1
+    return tuple(names)
+
+
+def _read_excel_text(cell) -> Optional[str]:
+    """
+    Texte d'une cellule openpyxl tel que lu par pandas.read_excel(dtype=str)
+
+    Cellule vide, erreur ou texte "NA", "null"... → None. Nombres entiers
+    (y compris 5.0) sans décimale, dates et heures au format str().
+
+    Raises:
+        ValueError: valeur dont le texte pandas dépend du reste de la colonne
+            (booléen confondu avec 0 ou 1) ou type non pris en charge (durée)
+    """
+    value = cell.value
+    if value is None or cell.data_type == 'e':
+        return None
+    if isinstance(value, str):
+        return None if value in PANDAS_NA_STRINGS else value
+    if isinstance(value, bool):
+        raise ValueError("Booléen: texte pandas dépendant de la colonne")
+    if isinstance(value, (int, float)) and cell.data_type == 'n':
+        as_int = int(value)
+        return str(as_int) if as_int == value else str(float(value))
+    if isinstance(value, (datetime, time)):
+        return str(value)
+    raise ValueError(f"Valeur non prise en charge: {type(value).__name__}")
+
+
+def _file_version(filepath: str) -> Tuple[str, int, int]:
+    """Clé de cache d'un fichier: chemin absolu, date de modification, taille"""
+    stat = os.stat(filepath)
+    return os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size
+
 
 class ExcelUtils:
     """Classe utilitaire pour les opérations Excel"""
@@ -69,23 +174,42 @@ class ExcelUtils:
     @staticmethod
     def get_excel_sheets(filepath: str) -> List[str]:
         """Récupère la liste des feuilles d'un fichier Excel"""
-        try:
-            xl = pd.ExcelFile(filepath)
-            return xl.sheet_names
-        except Exception:
-            return []
+        return ExcelUtils.get_sheet_names(filepath)[0]
 
     @staticmethod
     def get_sheet_names(filepath: str) -> Tuple[List[str], Optional[str]]:
         """
         Récupère la liste des onglets d'un fichier Excel
 
+        Le résultat est mis en cache tant que le fichier n'est pas modifié.
+
         Returns:
             Tuple (liste des onglets, message d'erreur ou None)
         """
         try:
-            xl = pd.ExcelFile(filepath)
-            return xl.sheet_names, None
+            path, mtime_ns, size = _file_version(filepath)
+            return list(_cached_sheet_names(path, mtime_ns, size)), None
+        except Exception as e:
+            return [], str(e)
+
+    @staticmethod
+    def get_column_names(filepath: str, sheet_name: Optional[str] = None) -> Tuple[List[Any], Optional[str]]:
+        """
+        Récupère les en-têtes de colonnes d'un onglet
+
+        Le résultat est mis en cache tant que le fichier n'est pas modifié.
+
+        Args:
+            filepath: Chemin du fichier Excel
+            sheet_name: Nom de l'onglet (None = premier onglet)
+
+        Returns:
+            Tuple (liste des colonnes, message d'erreur ou None)
+        """
+        try:
+            path, mtime_ns, size = _file_version(filepath)
+            sheet = 0 if sheet_name is None else sheet_name
+            return list(_cached_column_names(path, sheet, mtime_ns, size)), None
         except Exception as e:
             return [], str(e)
 
@@ -131,6 +255,24 @@ class ExcelUtils:
         try:
             filepath = Path(filepath)
 
+            # Nouveau fichier: écriture en flux avec xlsxwriter si disponible
+            if xlsxwriter is not None and not filepath.exists():
+                ExcelUtils._write_dataframe_xlsxwriter(
+                    df, filepath, sheet_name,
+                    apply_formatting=apply_formatting,
+                    freeze_header=freeze_header,
+                    auto_fit_columns=auto_fit_columns,
+                    alternate_rows=alternate_rows,
+                    add_borders=add_borders,
+                    header_bg_color=header_bg_color,
+                    header_font_color=header_font_color,
+                    alternate_row_color=alternate_row_color,
+                    min_column_width=min_column_width,
+                    max_column_width=max_column_width,
+                    autofit_sample_rows=autofit_sample_rows
+                )
+                return True, None
+
             # Charger ou créer le workbook
             if filepath.exists():
                 wb = load_workbook(filepath)
@@ -211,6 +353,361 @@ class ExcelUtils:
         except Exception as e:
             return False, str(e)
 
+    @staticmethod
+    def write_csv_to_excel(
+        csv_path: str,
+        filepath: str,
+        sheet_name: str = "Sheet1",
+        sep: str = ",",
+        encoding: str = "utf-8",
+        chunksize: int = 100_000,
+        usecols: Optional[List[str]] = None,
+        date_columns: Optional[List[str]] = None,
+        date_format: Optional[str] = None,
+        apply_formatting: bool = True,
+        header_bg_color: str = "#1F4E79",
+        header_font_color: str = "#FFFFFF",
+        alternate_row_color: str = "#F2F2F2",
+        min_column_width: int = 10,
+        max_column_width: int = 50,
+        autofit_sample_rows: int = 100
+    ) -> Tuple[bool, int, Optional[str]]:
+        """
+        Convertit un fichier CSV en Excel par blocs de lignes
+
+        Le CSV est lu par blocs de chunksize lignes et écrit en flux dans un
+        classeur en écriture seule: la mémoire reste bornée à un bloc. Le
+        formatage est celui de write_dataframe_to_excel (en-tête, bordures,
+        alternance, largeurs estimées sur les premières lignes, en-tête gelé).
+        Le fichier de destination est remplacé.
+
+        Les colonnes date_columns sont converties à la lecture; le cache de
+        read_csv ne convertit qu'une fois chaque valeur distincte (horodatages
+        répétés des exports transactionnels).
+
+        Args:
+            csv_path: Chemin du fichier CSV
+            filepath: Chemin du fichier Excel de destination
+            sheet_name: Nom de l'onglet
+            sep: Séparateur du CSV
+            encoding: Encodage du CSV
+            chunksize: Nombre de lignes lues par bloc
+            usecols: Colonnes à convertir (None = toutes), filtrées à la lecture
+            date_columns: Colonnes à convertir en dates (None = aucune)
+            date_format: Format strftime des dates (None = ISO 8601)
+            apply_formatting: Styler les cellules (False = valeurs seules,
+                écriture nettement plus rapide)
+
+        Returns:
+            Tuple (succès, nombre de lignes, message d'erreur ou None)
+        """
+        try:
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import NamedStyle
+
+            reader = pd.read_csv(
+                csv_path, sep=sep, encoding=encoding, chunksize=chunksize, usecols=usecols,
+                **ExcelUtils.csv_date_options(date_columns, date_format)
+            )
+            first_chunk = next(reader)
+
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(sheet_name)
+
+            if apply_formatting:
+                # Styles nommés, enregistrés une seule fois
+                thin_border = Border(
+                    left=Side(style='thin'),
+                    right=Side(style='thin'),
+                    top=Side(style='thin'),
+                    bottom=Side(style='thin')
+                )
+                header_style = NamedStyle(
+                    name="etp_header",
+                    fill=PatternFill(
+                        start_color=ExcelUtils._hex_to_rgb(header_bg_color),
+                        end_color=ExcelUtils._hex_to_rgb(header_bg_color),
+                        fill_type="solid"
+                    ),
+                    font=Font(bold=True, color=ExcelUtils._hex_to_rgb(header_font_color), size=11),
+                    alignment=Alignment(horizontal='center', vertical='center', wrap_text=True),
+                    border=thin_border
+                )
+                row_style = NamedStyle(
+                    name="etp_row",
+                    alignment=Alignment(vertical='center'),
+                    border=thin_border
+                )
+                alternate_style = NamedStyle(
+                    name="etp_row_alt",
+                    fill=PatternFill(
+                        start_color=ExcelUtils._hex_to_rgb(alternate_row_color),
+                        end_color=ExcelUtils._hex_to_rgb(alternate_row_color),
+                        fill_type="solid"
+                    ),
+                    alignment=Alignment(vertical='center'),
+                    border=thin_border
+                )
+                date_style = NamedStyle(
+                    name="etp_date",
+                    alignment=Alignment(vertical='center'),
+                    border=thin_border,
+                    number_format=DATE_FORMAT
+                )
+                alternate_date_style = NamedStyle(
+                    name="etp_date_alt",
+                    fill=PatternFill(
+                        start_color=ExcelUtils._hex_to_rgb(alternate_row_color),
+                        end_color=ExcelUtils._hex_to_rgb(alternate_row_color),
+                        fill_type="solid"
+                    ),
+                    alignment=Alignment(vertical='center'),
+                    border=thin_border,
+                    number_format=DATE_FORMAT
+                )
+                for style in (header_style, row_style, alternate_style,
+                              date_style, alternate_date_style):
+                    wb.add_named_style(style)
+
+            # Largeurs (à fixer avant la première ligne en écriture seule)
+            widths = ExcelUtils._column_widths(
+                first_chunk, min_column_width, max_column_width, autofit_sample_rows
+            )
+            for col_idx, width in enumerate(widths, start=1):
+                ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+            ws.freeze_panes = 'A2'
+
+            if not apply_formatting:
+                # Valeurs seules: lignes ajoutées telles quelles, sans objet cellule
+                ws.append(list(first_chunk.columns))
+                rows = 0
+                for chunk in itertools.chain([first_chunk], reader):
+                    for row in chunk.itertuples(index=False, name=None):
+                        ws.append(row)
+                    rows += len(chunk)
+
+                wb.save(filepath)
+                return True, rows, None
+
+            def styled(value, style):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = style
+                return cell
+
+            ws.append([styled(col_name, "etp_header") for col_name in first_chunk.columns])
+
+            # Style par colonne: format de date pour les colonnes converties
+            is_date = [
+                pd.api.types.is_datetime64_any_dtype(dtype) for dtype in first_chunk.dtypes
+            ]
+            plain_styles = ["etp_date" if d else "etp_row" for d in is_date]
+            alternate_styles = ["etp_date_alt" if d else "etp_row_alt" for d in is_date]
+
+            # Lignes paires de la feuille (première ligne de données) en couleur alternée
+            rows = 0
+            for chunk in itertools.chain([first_chunk], reader):
+                for row in chunk.itertuples(index=False, name=None):
+                    styles = alternate_styles if rows % 2 == 0 else plain_styles
+                    ws.append([styled(value, style) for value, style in zip(row, styles)])
+                    rows += 1
+
+            wb.save(filepath)
+
+            return True, rows, None
+
+        except Exception as e:
+            return False, 0, str(e)
+
+    @staticmethod
+    def optimize_dtypes(df: pd.DataFrame, category_ratio: float = 0.5) -> pd.DataFrame:
+        """
+        Réduit la mémoire d'un DataFrame sans changer les valeurs écrites
+
+        Entiers réduits au plus petit type suffisant, colonnes texte peu
+        variées (valeurs distinctes / lignes < category_ratio) en catégories.
+        Les flottants restent en float64: Excel stocke des doubles et un
+        float32 modifierait les valeurs (1.1 → 1.100000023841858).
+
+        Args:
+            df: DataFrame à optimiser (non modifié)
+            category_ratio: Proportion maximale de valeurs distinctes
+
+        Returns:
+            DataFrame optimisé
+        """
+        columns = {}
+        for col_name in df.select_dtypes(include=['integer']).columns:
+            columns[col_name] = pd.to_numeric(df[col_name], downcast='integer')
+
+        rows = len(df)
+        if rows:
+            for col_name in df.select_dtypes(include=['object', 'string']).columns:
+                if df[col_name].nunique() / rows < category_ratio:
+                    columns[col_name] = df[col_name].astype('category')
+
+        return df.assign(**columns) if columns else df
+
+    @staticmethod
+    def csv_date_options(
+        date_columns: Optional[List[str]] = None,
+        date_format: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Options de pd.read_csv pour la conversion des colonnes de dates
+
+        Args:
+            date_columns: Colonnes à convertir (None ou vide = aucune)
+            date_format: Format strftime (None = ISO 8601, formats mixtes acceptés)
+
+        Returns:
+            Arguments nommés à passer à pd.read_csv
+        """
+        if not date_columns:
+            return {}
+        return {
+            'parse_dates': list(date_columns),
+            'date_format': date_format or 'ISO8601',
+            'cache_dates': True,
+        }
+
+    @staticmethod
+    def _write_dataframe_xlsxwriter(
+        df: pd.DataFrame,
+        filepath: Path,
+        sheet_name: str,
+        apply_formatting: bool,
+        freeze_header: bool,
+        auto_fit_columns: bool,
+        alternate_rows: bool,
+        add_borders: bool,
+        header_bg_color: str,
+        header_font_color: str,
+        alternate_row_color: str,
+        min_column_width: int,
+        max_column_width: int,
+        autofit_sample_rows: int
+    ):
+        """
+        Écrit un DataFrame dans un nouveau fichier avec xlsxwriter
+
+        Mode constant_memory: chaque ligne est écrite sur disque dès qu'elle
+        est complète. Même formatage que le chemin openpyxl de
+        write_dataframe_to_excel.
+        """
+        # Écriture dans un fichier temporaire du même dossier puis remplacement:
+        # une erreur en cours d'écriture ne laisse pas de classeur partiel
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+        try:
+            with xlsxwriter.Workbook(str(tmp_path), {
+                'constant_memory': True,
+                'strings_to_urls': False,
+                'strings_to_numbers': False,
+                'default_date_format': DATE_FORMAT,
+            }) as wb:
+                ws = wb.add_worksheet(sheet_name)
+
+                header_format = row_format = alternate_format = None
+                date_cols = []
+                if apply_formatting:
+                    (header_format, row_format, alternate_format,
+                     row_date_format, alternate_date_format) = ExcelUtils._xlsxwriter_formats(
+                        wb, alternate_rows, add_borders,
+                        header_bg_color, header_font_color, alternate_row_color
+                    )
+                    # Colonnes pouvant contenir des dates (datetime64 ou object mixte)
+                    date_cols = [
+                        col_idx for col_idx, dtype in enumerate(df.dtypes)
+                        if pd.api.types.is_datetime64_any_dtype(dtype)
+                        or pd.api.types.is_object_dtype(dtype)
+                    ]
+
+                if auto_fit_columns:
+                    widths = ExcelUtils._column_widths(
+                        df, min_column_width, max_column_width, autofit_sample_rows
+                    )
+                    for col_idx, width in enumerate(widths):
+                        ws.set_column(col_idx, col_idx, width)
+
+                if freeze_header:
+                    ws.freeze_panes(1, 0)
+
+                ws.write_row(0, 0, list(df.columns), header_format)
+
+                # Lignes paires de la feuille (première ligne de données) en couleur alternée
+                row_idx = 1
+                for start in range(0, len(df), XLSXWRITER_BLOCK_ROWS):
+                    block = df.iloc[start:start + XLSXWRITER_BLOCK_ROWS]
+                    # Valeurs manquantes (NaN, NaT, NA) écrites comme cellules vides
+                    block = block.astype(object).where(block.notna(), None)
+                    for row in block.itertuples(index=False, name=None):
+                        alternate = row_idx % 2
+                        ws.write_row(row_idx, 0, row, alternate_format if alternate else row_format)
+                        for col_idx in date_cols:
+                            value = row[col_idx]
+                            if isinstance(value, (datetime, date)):
+                                ws.write(row_idx, col_idx, value,
+                                         alternate_date_format if alternate else row_date_format)
+                        row_idx += 1
+            os.replace(tmp_path, filepath)
+        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+    @staticmethod
+    def _xlsxwriter_formats(
+        wb,
+        alternate_rows: bool,
+        add_borders: bool,
+        header_bg_color: str,
+        header_font_color: str,
+        alternate_row_color: str
+    ) -> Tuple[Any, Any, Any, Any, Any]:
+        """
+        Formats xlsxwriter du formatage standard
+
+        Un format de cellule remplace le format de date par défaut du
+        classeur: les variantes date servent aux valeurs datetime et date.
+
+        Returns:
+            Tuple (en-tête, ligne, ligne alternée, date, date alternée)
+        """
+        border = 1 if add_borders else 0
+        header_format = wb.add_format({
+            'bold': True,
+            'font_size': 11,
+            'font_color': header_font_color,
+            'bg_color': header_bg_color,
+            'align': 'center',
+            'valign': 'vcenter',
+            'text_wrap': True,
+            'border': border,
+        })
+        row_props = {'valign': 'vcenter', 'border': border}
+        alternate_props = dict(row_props, bg_color=alternate_row_color) if alternate_rows else row_props
+        return (
+            header_format,
+            wb.add_format(row_props),
+            wb.add_format(alternate_props),
+            wb.add_format(dict(row_props, num_format=DATE_FORMAT)),
+            wb.add_format(dict(alternate_props, num_format=DATE_FORMAT)),
+        )
+
+    @staticmethod
+    def _column_widths(
+        df: pd.DataFrame,
+        min_width: int = 10,
+        max_width: int = 50,
+        sample_rows: int = 100
+    ) -> List[int]:
+        """Largeurs de colonnes estimées sur les premières lignes (règles de _auto_fit_columns)"""
+        widths = []
+        for col_name, values in df.head(sample_rows).items():
+            max_length = max([len(str(col_name))] + [len(str(v)) for v in values.dropna() if v])
+            widths.append(min(max(max_length + 2, min_width), max_width))
+        return widths
+
     @staticmethod
     def write_with_config(
         df: pd.DataFrame,
@@ -411,10 +908,19 @@ class ExcelUtils:
             Tuple (succès, nombre de lignes, message d'erreur ou None)
         """
         try:
+            # Nouveau fichier sans configuration: fusion en flux, sans DataFrame
+            if config is None and xlsxwriter is not None and not Path(output_path).exists():
+                result = ExcelUtils._merge_excel_files_streaming(
+                    file_paths, output_path, skip_headers
+                )
+                if result is not None:
+                    return result
+
             all_data = []
 
-            for i, filepath in enumerate(file_paths):
-                df, _, error = ExcelUtils.read_excel_file(filepath)
+            for i, (filepath, (df, _, error)) in enumerate(
+                zip(file_paths, ExcelUtils._read_excel_files(file_paths))
+            ):
                 if error:
                     return False, 0, f"Erreur lecture {filepath}: {error}"
 
@@ -439,6 +945,161 @@ class ExcelUtils:
         except Exception as e:
             return False, 0, str(e)
 
+    @staticmethod
+    def _merge_excel_files_streaming(
+        file_paths: List[str],
+        output_path: str,
+        skip_headers: bool = True,
+        min_column_width: int = 10,
+        max_column_width: int = 50,
+        autofit_sample_rows: int = 100
+    ) -> Optional[Tuple[bool, int, Optional[str]]]:
+        """
+        Fusionne des fichiers xlsx ligne à ligne (openpyxl lecture seule → xlsxwriter)
+
+        Aucun DataFrame n'est construit: la mémoire reste bornée à une ligne.
+        Le résultat est celui du chemin DataFrame (read_excel_file, iloc[1:]
+        avec skip_headers, concat): valeurs converties en texte comme par
+        pandas, lignes vides intermédiaires conservées, lignes vides de fin
+        ignorées, même formatage.
+
+        Returns:
+            Tuple (succès, nombre de lignes, message d'erreur ou None), ou None
+            si le résultat ne serait pas identique (format autre que xlsx,
+            en-têtes différents, vides ou en double, valeur hors des colonnes
+            de l'en-tête, booléen...): le fichier partiel est alors supprimé
+        """
+        if not file_paths or any(
+            Path(path).suffix.lower() not in ('.xlsx', '.xlsm') for path in file_paths
+        ):
+            return None
+
+        try:
+            headers = [ExcelUtils._read_header_row(path) for path in file_paths]
+        except Exception:
+            return None
+        header = headers[0]
+        # En-têtes renommés par pandas ("Unnamed: n", doublons ".1") ou non textuels exclus
+        if (not header or any(other != header for other in headers[1:])
+                or not all(isinstance(name, str) and name not in PANDAS_NA_STRINGS for name in header)
+                or len(set(header)) != len(header)):
+            return None
+
+        wb = xlsxwriter.Workbook(output_path, {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'strings_to_numbers': False,
+            'default_date_format': DATE_FORMAT,
+        })
+        # Lignes paires de la feuille (première ligne de données) en couleur alternée
+        row_idx = 1
+        try:
+            ws = wb.add_worksheet("Données_Fusionnées")
+            header_format, row_format, alternate_format = ExcelUtils._xlsxwriter_formats(
+                wb, True, True, "#1F4E79", "#FFFFFF", "#F2F2F2"
+            )[:3]
+            ws.freeze_panes(1, 0)
+            ws.write_row(0, 0, header, header_format)
+            lengths = [len(str(col_name)) for col_name in header]
+
+            for file_idx, path in enumerate(file_paths):
+                rows = ExcelUtils._iter_merge_rows(path, len(header))
+                if skip_headers and file_idx > 0:
+                    rows = itertools.islice(rows, 1, None)
+
+                for row in rows:
+                    ws.write_row(row_idx, 0, row, alternate_format if row_idx % 2 else row_format)
+
+                    # Largeurs estimées sur les premières lignes (règles de _column_widths)
+                    if row_idx <= autofit_sample_rows:
+                        for col_idx, value in enumerate(row):
+                            if value:
+                                lengths[col_idx] = max(lengths[col_idx], len(value))
+                    row_idx += 1
+
+            for col_idx, length in enumerate(lengths):
+                width = min(max(length + 2, min_column_width), max_column_width)
+                ws.set_column(col_idx, col_idx, width)
+        except ValueError:
+            row_idx = None
+        finally:
+            wb.close()
+
+        if row_idx is None:
+            os.remove(output_path)
+            return None
+        return True, row_idx - 1, None
+
+    @staticmethod
+    def _iter_merge_rows(filepath: str, width: int) -> Iterable[List[Optional[str]]]:
+        """
+        Lignes de données d'un fichier xlsx, telles que dans read_excel_file
+
+        Lignes vides intermédiaires conservées, lignes vides de fin ignorées.
+
+        Raises:
+            ValueError: valeur hors des colonnes de l'en-tête ou non
+                convertible comme pandas (voir _read_excel_text)
+        """
+        wb = load_workbook(filepath, read_only=True, data_only=True, keep_links=False)
+        try:
+            ws = wb.worksheets[0]
+            # Dimensions déclarées parfois fausses: lecture de toutes les lignes (comme pandas)
+            ws.reset_dimensions()
+            blank_rows = 0
+            for cells in ws.iter_rows(min_row=2):
+                if all(cell.value is None or cell.value == '' for cell in cells):
+                    blank_rows += 1
+                    continue
+                if any(cell.value is not None and cell.value != '' for cell in cells[width:]):
+                    raise ValueError("Valeur hors des colonnes de l'en-tête")
+
+                for _ in range(blank_rows):
+                    yield [None] * width
+                blank_rows = 0
+                row = [_read_excel_text(cell) for cell in cells[:width]]
+                yield row + [None] * (width - len(row))
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _read_header_row(filepath: str) -> List[Any]:
+        """En-tête (première ligne, cellules vides de fin ignorées, noms nettoyés) du premier onglet d'un fichier xlsx"""
+        wb = load_workbook(filepath, read_only=True, data_only=True, keep_links=False)
+        try:
+            if wb.sheetnames[0] != wb.worksheets[0].title:
+                raise ValueError("Premier onglet non lisible comme feuille de calcul")
+            ws = wb.worksheets[0]
+            ws.reset_dimensions()
+            row = list(next(ws.iter_rows(max_row=1, values_only=True), ()))
+        finally:
+            wb.close()
+
+        while row and (row[-1] is None or row[-1] == ''):
+            row.pop()
+        return [value.strip() if isinstance(value, str) else value for value in row]
+
+    @staticmethod
+    def _read_excel_files(file_paths: List[str]) -> Iterable[Tuple[Optional[pd.DataFrame], List[str], Optional[str]]]:
+        """
+        Lit plusieurs fichiers Excel (résultats de read_excel_file, dans l'ordre)
+
+        L'analyse d'un xlsx (zip + XML) est coûteuse en CPU et indépendante
+        d'un fichier à l'autre: au-delà de MERGE_PARALLEL_MIN_BYTES, les
+        fichiers sont lus en parallèle dans des processus séparés.
+        """
+        workers = min(os.cpu_count() or 1, len(file_paths))
+        if workers > 1:
+            total_size = sum(
+                os.path.getsize(path) for path in file_paths if os.path.isfile(path)
+            )
+            if total_size >= MERGE_PARALLEL_MIN_BYTES:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(ExcelUtils.read_excel_file, file_paths))
+
+        # Lecture séquentielle à la demande (arrêt possible à la première erreur)
+        return map(ExcelUtils.read_excel_file, file_paths)
+
     @staticmethod
     def search_in_excel(
         df: pd.DataFrame,
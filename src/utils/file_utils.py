@@ -2,12 +2,22 @@
 Utilitaires de gestion de fichiers pour ExcelToolsPro
 """
 
+import codecs
+import csv
 import os
 import shutil
 from pathlib import Path
 from typing import List, Optional, Tuple, Generator
 from datetime import datetime
 
+try:
+    import chardet
+except ImportError:
+    chardet = None
+
+# Taille de l'échantillon lu pour détecter le format d'un CSV
+CSV_SNIFF_BYTES = 64 * 1024
+
 
 class FileUtils:
     """Classe utilitaire pour les opérations sur les fichiers"""
@@ -211,6 +221,63 @@ class FileUtils:
             size_bytes /= 1024
         return f"{size_bytes:.1f} PB"
 
+    @staticmethod
+    def detect_csv_format(
+        filepath: str,
+        sample_size: int = CSV_SNIFF_BYTES
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Détecte l'encodage et le séparateur d'un CSV sur un échantillon
+
+        Seuls les sample_size premiers octets sont lus. L'UTF-8 est essayé en
+        premier (avec BOM: utf-8-sig), puis chardet si disponible.
+
+        Args:
+            filepath: Chemin du fichier CSV
+            sample_size: Nombre d'octets analysés
+
+        Returns:
+            Tuple (encodage, séparateur), None pour ce qui n'a pu être détecté
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                sample = f.read(sample_size)
+        except OSError:
+            return None, None
+
+        if not sample:
+            return None, None
+
+        encoding = None
+        text = None
+        try:
+            # Décodage incrémental: un caractère coupé en fin d'échantillon est ignoré
+            text = codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            encoding = 'utf-8-sig' if sample.startswith(codecs.BOM_UTF8) else 'utf-8'
+        except UnicodeDecodeError:
+            if chardet is not None:
+                detected = chardet.detect(sample).get('encoding')
+                if detected:
+                    try:
+                        encoding = codecs.lookup(detected).name
+                        text = sample.decode(encoding, errors='replace')
+                    except LookupError:
+                        encoding = None
+
+        if text is None:
+            return encoding, None
+
+        # Dernière ligne éventuellement incomplète exclue de l'analyse
+        if len(sample) == sample_size and '\n' in text:
+            text = text[:text.rindex('\n')]
+
+        try:
+            separator = csv.Sniffer().sniff(text, delimiters=',;\t|').delimiter
+        except csv.Error:
+            separator = None
+
+        return encoding, separator
+
     @staticmethod
     def validate_path(filepath: str, must_exist: bool = True) -> Tuple[bool, Optional[str]]:
         """
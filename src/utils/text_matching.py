@@ -0,0 +1,89 @@
+"""
+Correspondance approximative de texte pour ExcelToolsPro
+Similarité difflib, utilisable dans des processus de travail
+"""
+
+from bisect import bisect_left, bisect_right
+from difflib import SequenceMatcher
+from typing import Iterable, List, Optional
+
+
+class FuzzyMatcher:
+    """Teste des valeurs contre un ensemble de références avec difflib"""
+
+    def __init__(self, references: Iterable[str], threshold: float):
+        """
+        Args:
+            references: Valeurs de référence (déjà normalisées)
+            threshold: Seuil de similarité (0.0 à 1.0)
+        """
+        self.references = list(references)
+        self.threshold = threshold
+        # Un seul comparateur réutilisé pour toutes les paires
+        self._matcher = SequenceMatcher(None, "", "")
+
+    def matches(self, value: str) -> bool:
+        """Vérifie si une référence atteint le seuil de similarité avec value"""
+        return self.found_mask([value])[0]
+
+    def found_mask(self, values: Iterable[str]) -> List[bool]:
+        """
+        Retourne, pour chaque valeur, si elle correspond à une référence
+
+        Boucle externe sur les références: l'index de la séquence b (b2j) n'est
+        calculé qu'une fois par référence et par appel. Les valeurs sont triées
+        par longueur afin de ne comparer à chaque référence que celles dont la
+        longueur permet d'atteindre le seuil (borne de real_quick_ratio).
+        """
+        values = list(values)
+        count = len(values)
+        threshold = self.threshold
+        if threshold <= 0:
+            return [bool(self.references)] * count
+
+        mask = [False] * count
+        order = sorted(range(count), key=lambda i: len(values[i]))
+        lengths = [len(values[i]) for i in order]
+        # ratio <= 2*min(la, lb)/(la + lb): bornes sur la longueur de la valeur
+        low_factor = threshold / (2 - threshold) - 1e-9
+        high_factor = (2 - threshold) / threshold + 1e-9
+        remaining = count
+        matcher = self._matcher
+
+        for ref in self.references:
+            if not remaining:
+                break
+            ref_len = len(ref)
+            start = bisect_left(lengths, ref_len * low_factor)
+            end = bisect_right(lengths, ref_len * high_factor)
+            if start >= end:
+                continue
+
+            matcher.set_seq2(ref)
+            for idx in order[start:end]:
+                if mask[idx]:
+                    continue
+                matcher.set_seq1(values[idx])
+                # Bornes supérieures peu coûteuses avant le calcul complet
+                if (matcher.real_quick_ratio() >= threshold
+                        and matcher.quick_ratio() >= threshold
+                        and matcher.ratio() >= threshold):
+                    mask[idx] = True
+                    remaining -= 1
+
+        return mask
+
+
+# Comparateur propre à chaque processus de travail (voir init_worker)
+_worker_matcher: Optional[FuzzyMatcher] = None
+
+
+def init_worker(references: List[str], threshold: float):
+    """Initialiseur de ProcessPoolExecutor: références transmises une seule fois par processus"""
+    global _worker_matcher
+    _worker_matcher = FuzzyMatcher(references, threshold)
+
+
+def worker_found_mask(values: List[str]) -> List[bool]:
+    """Tâche de ProcessPoolExecutor: masque des valeurs trouvées pour un bloc"""
+    return _worker_matcher.found_mask(values)
@@ -53,6 +53,15 @@ class TestAppConfig:
         assert isinstance(config.excel_export, ExcelExportConfig)
         assert isinstance(config.search, SearchConfig)
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True requiert Python 3.10")
+    def test_slotted_instances(self):
+        """Test absence de __dict__ par instance"""
+        config = AppConfig()
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config.ui, "__dict__")
+        with pytest.raises(AttributeError):
+            config.ui.unknown_option = True
+
     def test_nested_configs(self):
         """Test configurations imbriquées"""
         config = AppConfig()
@@ -90,6 +99,83 @@ class TestConfigManager:
         manager2 = ConfigManager(config_path=temp_config_file)
         assert manager2.config.ui.theme == "light"
 
+    def test_save_and_load_non_ascii(self, temp_config_file):
+        """Test sauvegarde des caractères accentués en UTF-8"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.merge.default_output_sheet_name = "Données_Été"
+        manager.save()
+
+        with open(temp_config_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        assert data["merge"]["default_output_sheet_name"] == "Données_Été"
+
+        manager2 = ConfigManager(config_path=temp_config_file)
+        assert manager2.config.merge.default_output_sheet_name == "Données_Été"
+
+    def test_save_and_load_without_orjson(self, temp_config_file, monkeypatch):
+        """Test repli sur le module json standard"""
+        import src.core.config as config_module
+        monkeypatch.setattr(config_module, "orjson", None)
+
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.ui.theme = "light"
+        assert manager.save() is True
+
+        manager2 = ConfigManager(config_path=temp_config_file)
+        assert manager2.config.ui.theme == "light"
+
+    def test_config_to_dict_matches_asdict(self, temp_config_file):
+        """Test conversion en dictionnaire identique à dataclasses.asdict"""
+        from dataclasses import asdict
+
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.auto_save_config = False
+        manager.set_module_setting("test_module", "key", "value")
+        manager.add_recent_file("/path/to/file.xlsx")
+
+        assert manager._config_to_dict(manager.config) == asdict(manager.config)
+
+    def test_save_is_atomic(self, temp_config_file, monkeypatch):
+        """Test sauvegarde atomique: fichier intact si le remplacement échoue"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.save()
+        original = temp_config_file.read_bytes()
+
+        def failing_replace(src, dst):
+            raise OSError("disque plein")
+
+        monkeypatch.setattr(os, "replace", failing_replace)
+        manager.config.ui.theme = "light"
+
+        assert manager.save() is False
+        assert temp_config_file.read_bytes() == original
+        assert not temp_config_file.with_name(temp_config_file.name + ".tmp").exists()
+
+    def test_load_skips_unchanged_file(self, temp_config_file, monkeypatch):
+        """Test rechargement évité si le fichier n'a pas changé"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.save()
+        config = manager.config
+
+        def fail_read(path):
+            raise AssertionError("Le fichier ne devrait pas être relu")
+
+        monkeypatch.setattr(manager, "_read_json", fail_read)
+        assert manager.load() is config
+
+    def test_load_reads_externally_modified_file(self, temp_config_file):
+        """Test rechargement si le fichier a été modifié par ailleurs"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.save()
+
+        other = ConfigManager(config_path=temp_config_file)
+        other.config.ui.theme = "light"
+        other.save()
+        stat = temp_config_file.stat()
+        os.utime(temp_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager.load().ui.theme == "light"
+
     def test_get_simple_value(self, temp_config_file):
         """Test récupération valeur simple"""
         manager = ConfigManager(config_path=temp_config_file)
@@ -108,6 +194,26 @@ class TestConfigManager:
         value = manager.get("nonexistent.key", default="fallback")
         assert value == "fallback"
 
+    def test_get_after_reset_section(self, temp_config_file):
+        """Test lecture après remplacement d'une section (cache invalidé)"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.auto_save_config = False
+
+        manager.set("ui.theme", "light")
+        assert manager.get("ui.theme") == "light"
+
+        manager.reset_section("ui")
+        assert manager.get("ui.theme") == "dark"
+
+    def test_get_module_setting_path(self, temp_config_file):
+        """Test lecture d'un chemin traversant le dictionnaire des modules"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.auto_save_config = False
+        manager.set_module_setting("test_module", "custom_key", "custom_value")
+
+        assert manager.get("modules.test_module") is manager.get_module_config("test_module")
+        assert manager.get("modules.missing", default="fallback") == "fallback"
+
     def test_set_simple_value(self, temp_config_file):
         """Test définition valeur simple"""
         manager = ConfigManager(config_path=temp_config_file)
@@ -124,6 +230,26 @@ class TestConfigManager:
         manager.set("ui.theme", "light")
         assert manager.config.ui.theme == "light"
 
+    def test_set_unknown_key_is_ignored(self, temp_config_file):
+        """Test clé inconnue ignorée"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.auto_save_config = False
+
+        manager.set("ui.unknown_option", 1)
+        manager.set("unknown_section.theme", "light")
+
+        assert manager.get("ui.unknown_option") is None
+        assert manager.config.ui.theme == "dark"
+
+    def test_set_whole_section(self, temp_config_file):
+        """Test remplacement d'une section complète"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.auto_save_config = False
+        assert manager.get("ui.theme") == "dark"
+
+        manager.set("ui", UIConfig(theme="light"))
+        assert manager.get("ui.theme") == "light"
+
     def test_module_config(self, temp_config_file):
         """Test configuration de module"""
         manager = ConfigManager(config_path=temp_config_file)
@@ -166,6 +292,105 @@ class TestConfigManager:
 
         assert len(manager.config.recent_files) == 3
 
+    def test_auto_save_is_coalesced(self, temp_config_file, monkeypatch):
+        """Test regroupement des sauvegardes automatiques"""
+        manager = ConfigManager(config_path=temp_config_file)
+        writes = []
+        original_write = manager._write_json
+        monkeypatch.setattr(
+            manager, "_write_json",
+            lambda path, config: (writes.append(path), original_write(path, config))
+        )
+
+        for i in range(20):
+            manager.set("ui.font_size", i)
+        assert writes == []
+
+        manager._flush_now()
+        assert len(writes) == 1
+
+        manager2 = ConfigManager(config_path=temp_config_file)
+        assert manager2.config.ui.font_size == 19
+
+    def test_load_keeps_pending_auto_save(self, temp_config_file):
+        """Test load() avant la sauvegarde différée: modifications conservées"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.save()
+
+        manager.set("ui.font_size", 99)
+        assert manager._flush_timer is not None
+        assert manager.load().ui.font_size == 99
+
+        manager._flush_now()
+        assert ConfigManager(config_path=temp_config_file).config.ui.font_size == 99
+
+    def test_exit_flush_does_not_keep_managers_alive(self, temp_config_file):
+        """Test sauvegarde à la sortie: gestionnaires libérés, timers annulés"""
+        import gc
+        import weakref
+        from src.core import config as config_module
+
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.set("ui.font_size", 42)
+        timer = manager._flush_timer
+
+        config_module._flush_live_managers()
+        assert manager._flush_timer is None
+        timer.join(1)
+        assert not timer.is_alive()
+        assert ConfigManager(config_path=temp_config_file).config.ui.font_size == 42
+
+        ref = weakref.ref(manager)
+        del manager, timer
+        gc.collect()
+        assert ref() is None
+
+    def test_explicit_save_cancels_pending_auto_save(self, temp_config_file):
+        """Test annulation de la sauvegarde différée par save()"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.set("ui.theme", "light")
+        assert manager._flush_timer is not None
+
+        manager.save()
+        assert manager._flush_timer is None
+        assert manager._dirty is False
+
+    def test_add_existing_recent_file_moves_to_front(self, temp_config_file):
+        """Test remontée d'un fichier récent déjà présent"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.auto_save_config = False
+
+        manager.add_recent_file("/path/to/a.xlsx")
+        manager.add_recent_file("/path/to/b.xlsx")
+        manager.add_recent_file("/path/to/a.xlsx")
+
+        assert manager.config.recent_files == ["/path/to/a.xlsx", "/path/to/b.xlsx"]
+
+    def test_recent_files_replaced_in_place(self, temp_config_file):
+        """Test entrée de la liste remplacée sur place (même longueur)"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.auto_save_config = False
+
+        manager.add_recent_file("/path/to/a.xlsx")
+        manager.add_recent_file("/path/to/b.xlsx")
+        manager.config.recent_files[0] = "/path/to/c.xlsx"
+        manager.add_recent_file("/path/to/b.xlsx")
+
+        assert manager.config.recent_files == [
+            "/path/to/b.xlsx", "/path/to/c.xlsx", "/path/to/a.xlsx"
+        ]
+
+    def test_recent_files_after_reload(self, temp_config_file):
+        """Test fichiers récents après rechargement de la configuration"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.add_recent_file("/path/to/a.xlsx")
+        manager.save()
+
+        manager.load()
+        manager.add_recent_file("/path/to/b.xlsx")
+
+        assert manager.config.recent_files == ["/path/to/b.xlsx", "/path/to/a.xlsx"]
+
     def test_reset_to_defaults(self, temp_config_file):
         """Test réinitialisation"""
         manager = ConfigManager(config_path=temp_config_file)
@@ -189,6 +414,23 @@ class TestConfigManager:
         assert manager.config.ui.theme == "dark"
         assert manager.config.ui.font_size == 12
 
+    def test_version_changes_on_modification(self, temp_config_file):
+        """Test version incrémentée par set() et les réinitialisations"""
+        manager = ConfigManager(config_path=temp_config_file)
+        manager.config.auto_save_config = False
+        config = manager.config
+
+        versions = [manager.version]
+        manager.set("modules", {})
+        versions.append(manager.version)
+        manager.reset_section("ui")
+        versions.append(manager.version)
+        manager.get("ui.theme")
+        versions.append(manager.version)
+
+        assert manager.config is config
+        assert versions[0] < versions[1] < versions[2] == versions[3]
+
     def test_export_config(self, temp_config_file, temp_directory):
         """Test export configuration"""
         manager = ConfigManager(config_path=temp_config_file)
@@ -257,6 +499,31 @@ class TestConfigManager:
         assert "ui.theme" in flat
         assert "excel_export.freeze_header" in flat
         assert flat["ui.theme"] == "dark"
+        assert flat["debug_mode"] is False
+
+        keys = list(flat)
+        assert keys[0] == "excel_export.freeze_header"
+        assert keys.index("log.max_log_file_size_mb") < keys.index("continue_on_error")
+
+    def test_load_partial_config_uses_defaults(self, temp_config_file):
+        """Test chargement d'un fichier partiel: champs absents par défaut"""
+        with open(temp_config_file, 'w', encoding='utf-8') as f:
+            json.dump({"ui": {"theme": "light"}, "debug_mode": True}, f)
+
+        manager = ConfigManager(config_path=temp_config_file)
+        assert manager.config.ui.theme == "light"
+        assert manager.config.debug_mode is True
+        assert manager.config.recent_files == []
+        assert manager.config.max_recent_files == 10
+        assert manager.config.merge.key_column_patterns == MergeConfig().key_column_patterns
+
+    def test_load_unknown_key_falls_back_to_defaults(self, temp_config_file):
+        """Test clé inconnue: valeurs par défaut"""
+        with open(temp_config_file, 'w', encoding='utf-8') as f:
+            json.dump({"unknown_option": 1, "debug_mode": True}, f)
+
+        manager = ConfigManager(config_path=temp_config_file)
+        assert manager.config.debug_mode is False
 
     def test_corrupted_config_file(self, temp_config_file):
         """Test fichier config corrompu"""
@@ -0,0 +1,284 @@
+"""
+Tests unitaires pour l'extraction de champs dans des fichiers Excel
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import data_extraction
+from src.utils.data_extraction import extract_fields, process_file, write_activity_sheet
+
+
+FIELDS = [
+    {"name": "Client", "term": "client"},
+    {"name": "Date", "term": "date"},
+    {"name": "Montant", "term": "montant"},
+]
+
+
+def _make_workbook(path, rows, sheet_name="Données", merges=()):
+    """Crée un classeur avec les lignes données (et cellules fusionnées)"""
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = sheet_name
+    for row in rows:
+        ws.append(row)
+    for merge in merges:
+        ws.merge_cells(merge)
+    wb.save(path)
+    return path
+
+
+class TestExtractFields:
+    """Tests pour extract_fields"""
+
+    def test_value_to_the_right(self, temp_directory):
+        """Test valeur à droite du libellé (dates au format jj/mm/aaaa)"""
+        path = _make_workbook(Path(temp_directory) / "a.xlsx", [
+            ["Nom du client :", None, "ACME"],
+            ["Date", datetime(2024, 3, 5)],
+        ])
+
+        data = extract_fields(path, "Données", FIELDS)
+        assert data == {"Client": "ACME", "Date": "05/03/2024", "Montant": ""}
+
+    def test_value_below(self, temp_directory):
+        """Test valeur sous le libellé (format vertical)"""
+        path = _make_workbook(Path(temp_directory) / "b.xlsx", [
+            ["Titre"],
+            ["MONTANT TOTAL"],
+            [None],
+            [1250.5],
+        ])
+
+        data = extract_fields(path, "Données", FIELDS)
+        assert data["Montant"] == "1250.5"
+
+    def test_first_match_with_value(self, temp_directory):
+        """Test libellé sans valeur ignoré au profit de l'occurrence suivante"""
+        path = _make_workbook(Path(temp_directory) / "c.xlsx", [
+            ["Client"],
+            [None],
+            [None],
+            ["Client", "Dupont"],
+        ])
+
+        data = extract_fields(path, "Données", FIELDS)
+        assert data["Client"] == "Dupont"
+
+    def test_merged_value(self, temp_directory):
+        """Test valeur dans une cellule fusionnée adjacente"""
+        path = _make_workbook(
+            Path(temp_directory) / "d.xlsx",
+            [["Client", None, "Martin", None]],
+            merges=["C1:D1"]
+        )
+
+        data = extract_fields(path, "Données", FIELDS)
+        assert data["Client"] == "Martin"
+
+    def test_same_result_with_openpyxl(self, temp_directory, monkeypatch):
+        """Test résultats identiques avec calamine et openpyxl"""
+        pytest.importorskip("python_calamine")
+        path = _make_workbook(Path(temp_directory) / "m.xlsx", [
+            [None, "Client", 42],
+            [None, "Date", datetime(2024, 3, 5, 10, 30)],
+            [None, "Montant", None, None, None, None, 12.5],
+            [None, 7],
+        ])
+
+        with_calamine = extract_fields(path, "Données", FIELDS)
+        monkeypatch.setattr(data_extraction, "CalamineWorkbook", None)
+        assert extract_fields(path, "Données", FIELDS) == with_calamine
+        assert with_calamine == {"Client": "42", "Date": "05/03/2024", "Montant": "7"}
+
+    def test_same_labels_with_aho_corasick(self, monkeypatch):
+        """Test libellés identiques avec et sans pyahocorasick"""
+        pytest.importorskip("ahocorasick")
+        text_rows = [
+            ["client", None, "date client", "montant"],
+            [None, "dates", "", "montant ht"],
+            ["date", "client", None, "total"],
+        ]
+        terms = ["client", "date", "montant", "client", "ht"]
+
+        find_labels = data_extraction._label_matcher(terms)
+        with_automaton = [find_labels(row) for row in text_rows]
+        monkeypatch.setattr(data_extraction, "ahocorasick", None)
+        find_labels = data_extraction._label_matcher(terms)
+        expected = [find_labels(row) for row in text_rows]
+
+        assert [[(c, sorted(set(idx))) for c, idx in row] for row in with_automaton] == expected
+        assert expected[0][0] == (0, [0, 3])
+
+    def test_reading_stops_when_all_fields_found(self, temp_directory, monkeypatch):
+        """Test arrêt de la lecture dès que tous les champs sont résolus"""
+        path = _make_workbook(
+            Path(temp_directory) / "s.xlsx",
+            [["Client", "ACME"], ["Date", "lundi"], ["Montant", 10]] + [["x"]] * 100
+        )
+        consumed = []
+        iter_rows = data_extraction._iter_rows
+
+        def counting_iter_rows(*args):
+            for row in iter_rows(*args):
+                consumed.append(row)
+                yield row
+
+        monkeypatch.setattr(data_extraction, "_iter_rows", counting_iter_rows)
+        data = extract_fields(path, "Données", FIELDS)
+
+        assert data == {"Client": "ACME", "Date": "lundi", "Montant": "10"}
+        assert len(consumed) == 5
+
+    def test_calamine_kept_for_shared_strings(self, temp_directory, monkeypatch):
+        """Test choix du moteur selon la table des chaînes partagées"""
+        pytest.importorskip("python_calamine")
+        xlsxwriter = pytest.importorskip("xlsxwriter")
+        monkeypatch.setattr(data_extraction, "CALAMINE_MAX_BYTES", 0)
+
+        shared = Path(temp_directory) / "shared.xlsx"
+        wb = xlsxwriter.Workbook(str(shared))
+        ws = wb.add_worksheet("Données")
+        for row in range(50):
+            ws.write_row(row, 0, [f"texte {row} {col}" for col in range(5)])
+        wb.close()
+        # Fichier sans chaînes partagées (chaînes en ligne)
+        inline = _make_workbook(Path(temp_directory) / "inline.xlsx", [["Client", "ACME"]] * 200)
+
+        assert data_extraction._prefer_calamine(shared) is True
+        assert data_extraction._prefer_calamine(inline) is False
+        assert extract_fields(inline, "Données", FIELDS)["Client"] == "ACME"
+
+    def test_missing_sheet(self, temp_directory):
+        """Test feuille absente"""
+        path = _make_workbook(Path(temp_directory) / "e.xlsx", [["Client", "X"]])
+        assert extract_fields(path, "Autre", FIELDS) is None
+
+
+class TestSharedStringsShortCircuit:
+    """Tests pour le contrôle préalable de la table des chaînes partagées"""
+
+    @pytest.fixture
+    def xlsxwriter(self):
+        return pytest.importorskip("xlsxwriter")
+
+    def _write(self, xlsxwriter, path, fill):
+        wb = xlsxwriter.Workbook(str(path))
+        ws = wb.add_worksheet("Données")
+        fill(wb, ws)
+        wb.close()
+        return path
+
+    def test_absent_labels_skip_reading(self, temp_directory, xlsxwriter, monkeypatch):
+        """Test fichier sans libellé: aucune lecture des cellules"""
+        path = self._write(xlsxwriter, Path(temp_directory) / "a.xlsx",
+                           lambda wb, ws: ws.write_row(0, 0, ["Autre", "valeur", 2024]))
+        monkeypatch.setattr(data_extraction, "_iter_rows", None)
+
+        assert extract_fields(path, "Données", FIELDS) == {"Client": "", "Date": "", "Montant": ""}
+
+    def test_labels_in_shared_strings(self, temp_directory, xlsxwriter):
+        """Test libellés présents (y compris en texte enrichi et avec entités XML)"""
+        def fill(wb, ws):
+            ws.write_rich_string(0, 0, "Cli", wb.add_format({"bold": True}), "ent")
+            ws.write(0, 1, "ACME")
+            ws.write_row(1, 0, ["R&D", "oui"])
+        path = self._write(xlsxwriter, Path(temp_directory) / "b.xlsx", fill)
+
+        assert not data_extraction._labels_absent(path, "Données", ["client"])
+        assert not data_extraction._labels_absent(path, "Données", ["r&d"])
+        assert extract_fields(path, "Données", FIELDS)["Client"] == "ACME"
+
+    def test_formula_text_is_not_skipped(self, temp_directory, xlsxwriter):
+        """Test libellé issu d'une formule (texte hors chaînes partagées)"""
+        def fill(wb, ws):
+            ws.write_formula(0, 0, '="Client"', None, "Client")
+            ws.write(0, 1, "ACME")
+        path = self._write(xlsxwriter, Path(temp_directory) / "c.xlsx", fill)
+
+        assert not data_extraction._labels_absent(path, "Données", ["client"])
+        assert extract_fields(path, "Données", FIELDS)["Client"] == "ACME"
+
+    def test_doubtful_cases(self, temp_directory, xlsxwriter):
+        """Test absence de conclusion en cas de doute"""
+        path = self._write(xlsxwriter, Path(temp_directory) / "d.xlsx",
+                           lambda wb, ws: ws.write_row(0, 0, ["Autre", 2024, True]))
+        inline = _make_workbook(Path(temp_directory) / "e.xlsx", [["Autre", "valeur"]])
+
+        # Termes pouvant figurer dans le texte d'un nombre ou d'un booléen
+        assert not data_extraction._labels_absent(path, "Données", ["2024"])
+        assert not data_extraction._labels_absent(path, "Données", ["true"])
+        # Feuille absente, fichier sans chaînes partagées
+        assert not data_extraction._labels_absent(path, "Autre", ["client"])
+        assert not data_extraction._labels_absent(inline, "Données", ["client"])
+        assert data_extraction._labels_absent(path, "Données", ["client"])
+
+
+class TestProcessFile:
+    """Tests pour process_file et write_activity_sheet"""
+
+    def test_activity_sheet_written(self, temp_directory):
+        """Test création de la feuille d'activité sans perte des autres feuilles"""
+        from openpyxl import load_workbook
+
+        path = _make_workbook(Path(temp_directory) / "f.xlsx", [["Client", "ACME"]])
+        assert process_file(path, "Données", FIELDS, "Activité") is True
+
+        wb = load_workbook(path)
+        assert wb.sheetnames == ["Données", "Activité"]
+        ws = wb["Activité"]
+        assert ws["A1"].value == "DONNÉES EXTRAITES"
+        assert ws["A1"].fill.fgColor.rgb.endswith("2E5090")
+        assert ws["A1"].font.bold is True
+        assert ws["A2"].fill.fgColor.rgb.endswith("D6DCE4")
+        assert ws["B2"].border.left.style == "thin"
+        assert [(ws.cell(row=r, column=1).value, ws.cell(row=r, column=2).value)
+                for r in range(2, 5)] == [("Client", "ACME"), ("Date", None), ("Montant", None)]
+        wb.close()
+
+    def test_existing_activity_sheet_replaced(self, temp_directory):
+        """Test remplacement d'une feuille d'activité existante"""
+        from openpyxl import load_workbook
+
+        path = _make_workbook(Path(temp_directory) / "g.xlsx", [["Client", "ACME"]])
+        write_activity_sheet(path, {"Client": "Ancien"}, FIELDS[:1], "Activité")
+        process_file(path, "Données", FIELDS, "Activité")
+
+        wb = load_workbook(path)
+        assert wb.sheetnames == ["Données", "Activité"]
+        assert wb["Activité"]["B2"].value == "ACME"
+        wb.close()
+
+    def test_no_data_found(self, temp_directory):
+        """Test fichier sans donnée: pas d'écriture"""
+        from openpyxl import load_workbook
+
+        path = _make_workbook(Path(temp_directory) / "h.xlsx", [["Autre", "valeur"]])
+        assert process_file(path, "Données", FIELDS, "Activité") is False
+        assert load_workbook(path).sheetnames == ["Données"]
+
+    def test_process_pool_worker(self, temp_directory):
+        """Test exécution dans des processus de travail"""
+        paths = [
+            _make_workbook(Path(temp_directory) / f"p{i}.xlsx", [["Client", f"C{i}"]])
+            for i in range(3)
+        ]
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(
+                process_file, paths, ["Données"] * 3, [FIELDS] * 3, ["Activité"] * 3
+            ))
+
+        assert results == [True, True, True]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
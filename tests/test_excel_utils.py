@@ -101,6 +101,72 @@ class TestExcelUtils:
         assert success is True
         assert os.path.exists(filepath)
 
+    def test_write_formatting_applied(self, temp_directory):
+        """Test styles effectivement présents dans le fichier écrit"""
+        from openpyxl import load_workbook
+
+        filepath = os.path.join(temp_directory, "styles.xlsx")
+        df = pd.DataFrame({
+            "Nom": ["Alice", None, "Charlie"],
+            "Date": pd.to_datetime(["2024-01-15", None, "2024-03-01"])
+        })
+
+        success, error = ExcelUtils.write_dataframe_to_excel(df, filepath, "Styles")
+
+        assert success is True
+        ws = load_workbook(filepath)["Styles"]
+        assert ws["A1"].font.b is True
+        assert ws["A2"].fill.fill_type == "solid"
+        assert ws["A3"].fill.fill_type is None
+        assert ws["A2"].border.left.style == "thin"
+        assert ws.freeze_panes == "A2"
+        assert ws["A3"].value is None
+        assert ws["B2"].is_date
+
+    def test_write_dates_in_object_column(self, temp_directory):
+        """Test dates d'une colonne object mixte écrites au format date"""
+        from datetime import date, datetime
+        from openpyxl import load_workbook
+
+        filepath = os.path.join(temp_directory, "mixed_dates.xlsx")
+        df = pd.DataFrame({
+            "Valeur": [datetime(2024, 1, 15, 10, 30), "texte", date(2024, 3, 1), 42, None]
+        }, dtype=object)
+
+        success, error = ExcelUtils.write_dataframe_to_excel(df, filepath, "Mixte")
+
+        assert success is True
+        ws = load_workbook(filepath)["Mixte"]
+        assert ws["A2"].is_date and ws["A2"].value == datetime(2024, 1, 15, 10, 30)
+        assert ws["A4"].is_date and ws["A4"].value == datetime(2024, 3, 1)
+        assert ws["A3"].value == "texte"
+        assert ws["A5"].value == 42 and not ws["A5"].is_date
+        assert ws["A5"].fill.fill_type is None
+        assert ws["A4"].fill.fill_type == "solid"
+
+    def test_write_error_leaves_no_file(self, temp_directory):
+        """Test erreur en cours d'écriture: aucun fichier partiel laissé"""
+        pytest.importorskip("xlsxwriter")
+        filepath = os.path.join(temp_directory, "partial.xlsx")
+        df = pd.DataFrame({"Valeur": [1, {"non": "supporté"}]}, dtype=object)
+
+        success, error = ExcelUtils.write_dataframe_to_excel(df, filepath, "Erreur")
+
+        assert success is False
+        assert error
+        assert os.listdir(temp_directory) == []
+
+    def test_write_keeps_existing_sheets(self, temp_directory, sample_dataframe):
+        """Test écriture dans un classeur existant"""
+        filepath = os.path.join(temp_directory, "existing.xlsx")
+        ExcelUtils.write_dataframe_to_excel(sample_dataframe, filepath, "Premier")
+
+        success, error = ExcelUtils.write_dataframe_to_excel(sample_dataframe, filepath, "Second")
+
+        assert success is True
+        sheets, _ = ExcelUtils.get_sheet_names(filepath)
+        assert sheets == ["Premier", "Second"]
+
     def test_write_without_formatting(self, temp_directory, sample_dataframe):
         """Test écriture sans formatage"""
         filepath = os.path.join(temp_directory, "unformatted.xlsx")
@@ -114,6 +180,26 @@ class TestExcelUtils:
 
         assert success is True
 
+    def test_optimize_dtypes(self):
+        """Test réduction des types sans perte de valeurs"""
+        df = pd.DataFrame({
+            "Petit": [1, 2, 3, 4] * 2,
+            "Grand": [2 ** 40] * 8,
+            "Code": ["A", "A", "B", "A"] * 2,
+            "Unique": [f"u{i}" for i in range(8)],
+            "Prix": [1.1, 2.2, 3.3, 4.4] * 2,
+        })
+
+        result = ExcelUtils.optimize_dtypes(df)
+
+        assert result["Petit"].dtype == "int8"
+        assert result["Grand"].dtype == "int64"
+        assert isinstance(result["Code"].dtype, pd.CategoricalDtype)
+        assert not isinstance(result["Unique"].dtype, pd.CategoricalDtype)
+        assert result["Prix"].dtype == "float64"
+        assert result.astype(object).equals(df.astype(object))
+        assert df["Petit"].dtype == "int64"
+
     def test_get_sheet_names(self, multi_sheet_excel_file):
         """Test récupération noms d'onglets"""
         sheets, error = ExcelUtils.get_sheet_names(multi_sheet_excel_file)
@@ -124,6 +210,190 @@ class TestExcelUtils:
         assert "Sheet2" in sheets
 
 
+class TestExcelUtilsMetadataCache:
+    """Tests pour le cache des onglets et colonnes"""
+
+    def test_sheet_names_cached(self, multi_sheet_excel_file):
+        """Test lecture unique des onglets d'un fichier inchangé"""
+        from src.utils import excel_utils
+
+        ExcelUtils.get_sheet_names(multi_sheet_excel_file)
+        hits = excel_utils._cached_sheet_names.cache_info().hits
+        sheets, error = ExcelUtils.get_sheet_names(multi_sheet_excel_file)
+
+        assert error is None
+        assert sheets == ["Sheet1", "Sheet2"]
+        assert excel_utils._cached_sheet_names.cache_info().hits == hits + 1
+
+    def test_cache_invalidated_on_change(self, temp_directory):
+        """Test relecture après modification du fichier"""
+        filepath = os.path.join(temp_directory, "changing.xlsx")
+        pd.DataFrame({"A": [1]}).to_excel(filepath, sheet_name="Avant", index=False)
+        assert ExcelUtils.get_sheet_names(filepath)[0] == ["Avant"]
+        assert ExcelUtils.get_column_names(filepath)[0] == ["A"]
+
+        with pd.ExcelWriter(filepath) as writer:
+            pd.DataFrame({"B": [1], "C": [2]}).to_excel(writer, sheet_name="Après", index=False)
+            pd.DataFrame({"D": [1]}).to_excel(writer, sheet_name="Autre", index=False)
+
+        assert ExcelUtils.get_sheet_names(filepath)[0] == ["Après", "Autre"]
+        assert ExcelUtils.get_column_names(filepath)[0] == ["B", "C"]
+        assert ExcelUtils.get_column_names(filepath, "Autre")[0] == ["D"]
+
+    def test_column_names_like_pandas(self, temp_directory):
+        """Test en-têtes vides et doublons nommés comme pandas"""
+        from openpyxl import Workbook
+
+        filepath = os.path.join(temp_directory, "headers.xlsx")
+        wb = Workbook()
+        wb.active.append(["A", None, "A", " B ", "A.1", "A", None, None])
+        wb.active.append([1, 2, 3, 4, 5, 6, 7])
+        wb.save(filepath)
+
+        columns, error = ExcelUtils.get_column_names(filepath)
+
+        assert error is None
+        assert columns == list(pd.read_excel(filepath, nrows=0).columns)
+
+    def test_column_names_missing_file(self):
+        """Test colonnes d'un fichier inexistant"""
+        columns, error = ExcelUtils.get_column_names("absent.xlsx")
+        assert columns == []
+        assert error is not None
+
+
+class TestExcelUtilsCsvToExcel:
+    """Tests pour la conversion CSV vers Excel par blocs"""
+
+    def test_write_csv_to_excel_chunked(self, temp_directory):
+        """Test conversion sur plusieurs blocs"""
+        csv_path = os.path.join(temp_directory, "data.csv")
+        output = os.path.join(temp_directory, "data.xlsx")
+        df = pd.DataFrame({"Code": [f"C{i}" for i in range(7)], "Valeur": range(7)})
+        df.to_csv(csv_path, sep=";", index=False)
+
+        success, rows, error = ExcelUtils.write_csv_to_excel(
+            csv_path, output, "Données", sep=";", chunksize=3
+        )
+
+        assert success is True
+        assert rows == 7
+        assert error is None
+
+        result = pd.read_excel(output, sheet_name="Données")
+        assert result["Code"].tolist() == df["Code"].tolist()
+        assert result["Valeur"].tolist() == list(range(7))
+
+    def test_write_csv_to_excel_formatting(self, temp_directory):
+        """Test formatage de l'en-tête et alternance des lignes"""
+        from openpyxl import load_workbook
+
+        csv_path = os.path.join(temp_directory, "data.csv")
+        output = os.path.join(temp_directory, "data.xlsx")
+        pd.DataFrame({"A": [1, 2, 3]}).to_csv(csv_path, index=False)
+
+        ExcelUtils.write_csv_to_excel(csv_path, output, "Feuille", chunksize=2)
+
+        ws = load_workbook(output)["Feuille"]
+        assert ws["A1"].font.b is True
+        assert ws.freeze_panes == "A2"
+        assert ws["A2"].fill.fill_type == "solid"
+        assert ws["A3"].fill.fill_type is None
+        assert ws["A2"].border.left.style == "thin"
+
+    def test_write_csv_to_excel_usecols(self, temp_directory):
+        """Test conversion d'une partie des colonnes"""
+        csv_path = os.path.join(temp_directory, "wide.csv")
+        output = os.path.join(temp_directory, "wide.xlsx")
+        pd.DataFrame({"A": [1, 2], "B": ["x", "y"], "C": [3, 4]}).to_csv(csv_path, index=False)
+
+        success, rows, error = ExcelUtils.write_csv_to_excel(
+            csv_path, output, "Feuille", usecols=["C", "A"]
+        )
+
+        assert success is True
+        assert rows == 2
+        result = pd.read_excel(output)
+        assert list(result.columns) == ["A", "C"]
+        assert result["C"].tolist() == [3, 4]
+
+    def test_write_csv_to_excel_values_only(self, temp_directory):
+        """Test conversion sans mise en forme"""
+        from openpyxl import load_workbook
+
+        csv_path = os.path.join(temp_directory, "data.csv")
+        output = os.path.join(temp_directory, "data.xlsx")
+        pd.DataFrame({"A": [1, 2, 3], "B": ["x", None, "z"]}).to_csv(csv_path, index=False)
+
+        success, rows, error = ExcelUtils.write_csv_to_excel(
+            csv_path, output, "Feuille", chunksize=2, apply_formatting=False
+        )
+
+        assert success is True
+        assert rows == 3
+        ws = load_workbook(output)["Feuille"]
+        values = [list(row) for row in ws.iter_rows(values_only=True)]
+        assert values == [["A", "B"], [1, "x"], [2, None], [3, "z"]]
+        assert ws["A1"].font.b is False
+        assert ws["A2"].fill.fill_type is None
+
+    def test_write_csv_to_excel_date_columns(self, temp_directory):
+        """Test conversion des colonnes de dates"""
+        from datetime import datetime
+        from openpyxl import load_workbook
+
+        csv_path = os.path.join(temp_directory, "dates.csv")
+        output = os.path.join(temp_directory, "dates.xlsx")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write("Id,Date\n1,2024-01-02\n2,\n3,2024-01-02 10:30:00\n")
+
+        success, rows, error = ExcelUtils.write_csv_to_excel(
+            csv_path, output, "Feuille", chunksize=2, date_columns=["Date"]
+        )
+
+        assert success is True
+        assert rows == 3
+        ws = load_workbook(output)["Feuille"]
+        assert ws["B2"].value == datetime(2024, 1, 2)
+        assert ws["B3"].value is None
+        assert ws["B4"].value == datetime(2024, 1, 2, 10, 30)
+        assert ws["B2"].number_format == "yyyy-mm-dd hh:mm:ss"
+        assert ws["A2"].number_format == "General"
+
+    def test_csv_date_options(self):
+        """Test options de lecture des dates"""
+        assert ExcelUtils.csv_date_options(None) == {}
+        assert ExcelUtils.csv_date_options(["D"])["date_format"] == "ISO8601"
+        options = ExcelUtils.csv_date_options(["D"], "%d/%m/%Y")
+        assert options["parse_dates"] == ["D"]
+        assert options["date_format"] == "%d/%m/%Y"
+        assert options["cache_dates"] is True
+
+    def test_write_csv_to_excel_header_only(self, temp_directory):
+        """Test CSV sans données"""
+        csv_path = os.path.join(temp_directory, "empty.csv")
+        output = os.path.join(temp_directory, "empty.xlsx")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write("A,B\n")
+
+        success, rows, error = ExcelUtils.write_csv_to_excel(csv_path, output, "Feuille")
+
+        assert success is True
+        assert rows == 0
+        assert list(pd.read_excel(output).columns) == ["A", "B"]
+
+    def test_write_csv_to_excel_missing_file(self, temp_directory):
+        """Test fichier CSV inexistant"""
+        success, rows, error = ExcelUtils.write_csv_to_excel(
+            os.path.join(temp_directory, "absent.csv"),
+            os.path.join(temp_directory, "out.xlsx")
+        )
+
+        assert success is False
+        assert rows == 0
+        assert error is not None
+
+
 class TestExcelUtilsMerge:
     """Tests pour la fusion de fichiers"""
 
@@ -172,6 +442,149 @@ class TestExcelUtilsMerge:
 
         assert success is True
 
+    def test_merge_parallel_read(self, temp_directory, monkeypatch):
+        """Test fusion avec lecture des fichiers en parallèle"""
+        import src.utils.excel_utils as excel_utils
+        monkeypatch.setattr(excel_utils, "MERGE_PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(excel_utils, "xlsxwriter", None)
+        monkeypatch.setattr(excel_utils.os, "cpu_count", lambda: 2)
+
+        files = []
+        for i in range(3):
+            path = os.path.join(temp_directory, f"part{i}.xlsx")
+            pd.DataFrame({"Col": [f"v{i}a", f"v{i}b"]}).to_excel(path, index=False)
+            files.append(path)
+        output = os.path.join(temp_directory, "merged.xlsx")
+
+        success, count, error = ExcelUtils.merge_excel_files(files, output, skip_headers=False)
+
+        assert success is True
+        assert count == 6
+        df_merged, _, _ = ExcelUtils.read_excel_file(output)
+        assert df_merged["Col"].tolist() == ["v0a", "v0b", "v1a", "v1b", "v2a", "v2b"]
+
+    def test_merge_streaming(self, temp_directory):
+        """Test fusion en flux (valeurs en texte, en-têtes répétés sautés)"""
+        pytest.importorskip("xlsxwriter")
+        from datetime import datetime
+        from openpyxl import load_workbook
+
+        file1 = os.path.join(temp_directory, "f1.xlsx")
+        file2 = os.path.join(temp_directory, "f2.xlsx")
+        output = os.path.join(temp_directory, "merged.xlsx")
+        pd.DataFrame({"A": ["h1", "v1"], "B": [1, datetime(2024, 1, 2)]}).to_excel(file1, index=False)
+        pd.DataFrame({"A": ["h1", "v3"], "B": [2, 3.5]}).to_excel(file2, index=False)
+
+        success, count, error = ExcelUtils.merge_excel_files(
+            [file1, file2], output, skip_headers=True
+        )
+
+        assert success is True
+        assert count == 3
+        assert error is None
+        ws = load_workbook(output)["Données_Fusionnées"]
+        values = [list(row) for row in ws.iter_rows(values_only=True)]
+        assert values == [["A", "B"], ["h1", "1"], ["v1", "2024-01-02 00:00:00"], ["v3", "3.5"]]
+        assert ws["A1"].font.b is True
+        assert ws.freeze_panes == "A2"
+
+    def test_merge_streaming_same_as_dataframe(self, temp_directory, monkeypatch):
+        """Test fusion en flux identique au chemin DataFrame (lignes vides, types)"""
+        pytest.importorskip("xlsxwriter")
+        from datetime import datetime, time
+        from openpyxl import Workbook, load_workbook
+
+        def make(name, rows):
+            wb = Workbook()
+            ws = wb.active
+            ws.append([" Nom ", "Valeur", "Date"])
+            for row in rows:
+                ws.append(row)
+            path = os.path.join(temp_directory, name)
+            wb.save(path)
+            return path
+
+        files = [
+            make("a.xlsx", [
+                ["a1", 5.0, datetime(2024, 1, 2)],
+                [None, None, None],
+                ["a2", 1.5, time(10, 30)],
+                ["", "NA", None],
+                ["a3", 1e20, "#N/A"],
+                [None, None, None],
+            ]),
+            make("b.xlsx", [
+                [None, None, None],
+                ["b1", "texte long pour la largeur", datetime(2024, 3, 4, 8, 15)],
+                [None, None],
+                ["b2", 7],
+            ]),
+            make("c.xlsx", [["c1", 0.1], ["c2", "=1+1"]]),
+        ]
+
+        def merged(output, skip_headers):
+            success, count, error = ExcelUtils.merge_excel_files(files, output, skip_headers)
+            assert success is True, error
+            ws = load_workbook(output)["Données_Fusionnées"]
+            widths = [ws.column_dimensions[col].width for col in "ABC"]
+            return count, [list(row) for row in ws.iter_rows(values_only=True)], widths
+
+        for skip_headers in (True, False):
+            streamed = merged(os.path.join(temp_directory, f"s{skip_headers}.xlsx"), skip_headers)
+            with monkeypatch.context() as patch:
+                patch.setattr(ExcelUtils, "_merge_excel_files_streaming", lambda *args: None)
+                expected = merged(os.path.join(temp_directory, f"d{skip_headers}.xlsx"), skip_headers)
+            assert streamed == expected
+
+        assert expected[0] == 11
+        assert expected[1][2] == [None, None, None]
+
+    def test_merge_streaming_fallback(self, temp_directory):
+        """Test fusion en flux écartée si le résultat pourrait différer"""
+        pytest.importorskip("xlsxwriter")
+        from openpyxl import Workbook
+
+        def make(name, rows):
+            wb = Workbook()
+            for row in rows:
+                wb.active.append(row)
+            path = os.path.join(temp_directory, name)
+            wb.save(path)
+            return path
+
+        output = os.path.join(temp_directory, "merged.xlsx")
+        cases = [
+            make("bool.xlsx", [["A"], [True]]),
+            make("wide.xlsx", [["A"], ["a", "hors en-tête"]]),
+            make("unnamed.xlsx", [["A", None, "C"], ["a", "b", "c"]]),
+            make("dup.xlsx", [["A", "A "], ["a", "b"]]),
+        ]
+        for path in cases:
+            assert ExcelUtils._merge_excel_files_streaming([path], output) is None
+            assert not os.path.exists(output)
+
+        success, count, error = ExcelUtils.merge_excel_files(cases[:1], output)
+        assert success is True
+        assert count == 1
+
+    def test_merge_different_headers(self, temp_directory):
+        """Test fusion de fichiers aux colonnes différentes (alignement par nom)"""
+        file1 = os.path.join(temp_directory, "f1.xlsx")
+        file2 = os.path.join(temp_directory, "f2.xlsx")
+        output = os.path.join(temp_directory, "merged.xlsx")
+        pd.DataFrame({"A": ["a1"], "B": ["b1"]}).to_excel(file1, index=False)
+        pd.DataFrame({"B": ["b2"], "A": ["a2"]}).to_excel(file2, index=False)
+
+        success, count, error = ExcelUtils.merge_excel_files(
+            [file1, file2], output, skip_headers=False
+        )
+
+        assert success is True
+        assert count == 2
+        df_merged, _, _ = ExcelUtils.read_excel_file(output)
+        assert df_merged["A"].tolist() == ["a1", "a2"]
+        assert df_merged["B"].tolist() == ["b1", "b2"]
+
 
 class TestExcelUtilsAddSheet:
     """Tests pour l'ajout d'onglets"""
@@ -235,6 +235,50 @@ class TestFileUtilsFormatSize:
         assert "MB" in FileUtils.format_size(2 * 1024 * 1024)
 
 
+class TestFileUtilsCsvFormat:
+    """Tests pour la détection du format CSV"""
+
+    def test_detect_semicolon_utf8(self, temp_directory):
+        """Test CSV UTF-8 séparé par des points-virgules"""
+        filepath = os.path.join(temp_directory, "data.csv")
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write("Nom;Ville\nÉlodie;Besançon\nJean;Nîmes\n")
+
+        assert FileUtils.detect_csv_format(filepath) == ("utf-8", ";")
+
+    def test_detect_utf8_bom(self, temp_directory):
+        """Test CSV UTF-8 avec BOM"""
+        filepath = os.path.join(temp_directory, "bom.csv")
+        with open(filepath, "w", encoding="utf-8-sig") as f:
+            f.write("A,B\n1,2\n3,4\n")
+
+        assert FileUtils.detect_csv_format(filepath) == ("utf-8-sig", ",")
+
+    def test_detect_non_utf8(self, temp_directory):
+        """Test CSV non UTF-8 (décodable avec l'encodage détecté)"""
+        filepath = os.path.join(temp_directory, "latin.csv")
+        content = "Nom\tVille\n" + "Élodie\tBesançon à côté de la forêt\n" * 20
+        with open(filepath, "w", encoding="cp1252") as f:
+            f.write(content)
+
+        encoding, separator = FileUtils.detect_csv_format(filepath)
+
+        assert encoding is not None and encoding != "utf-8"
+        assert separator == "\t"
+
+    def test_detect_truncated_sample(self, temp_directory):
+        """Test échantillon coupé au milieu d'une ligne et d'un caractère"""
+        filepath = os.path.join(temp_directory, "long.csv")
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write("A|B\n" + "é|è\n" * 100)
+
+        assert FileUtils.detect_csv_format(filepath, sample_size=101) == ("utf-8", "|")
+
+    def test_detect_missing_file(self):
+        """Test fichier inexistant"""
+        assert FileUtils.detect_csv_format("absent.csv") == (None, None)
+
+
 class TestFileUtilsValidation:
     """Tests pour la validation de chemins"""
 
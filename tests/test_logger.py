@@ -2,10 +2,12 @@
 Tests unitaires pour le système de logging
 """
 
+import logging
 import pytest
 import sys
 from pathlib import Path
 import tempfile
+import time
 import os
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -33,9 +35,8 @@ class TestLogEntry:
 
     def test_create_entry(self):
         """Test création entrée"""
-        from datetime import datetime
         entry = LogEntry(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             level=LogLevel.INFO,
             message="Test message"
         )
@@ -44,9 +45,8 @@ class TestLogEntry:
 
     def test_format_entry(self):
         """Test formatage entrée"""
-        from datetime import datetime
         entry = LogEntry(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             level=LogLevel.WARNING,
             message="Warning message",
             source="TestModule"
@@ -59,9 +59,8 @@ class TestLogEntry:
 
     def test_format_without_timestamp(self):
         """Test formatage sans horodatage"""
-        from datetime import datetime
         entry = LogEntry(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             level=LogLevel.INFO,
             message="Test"
         )
@@ -69,6 +68,18 @@ class TestLogEntry:
 
         # Ne doit pas contenir le format de l'heure
         assert "[INFO]" in formatted
+        assert formatted == "[INFO] Test"
+
+    def test_format_full_layout(self):
+        """Test disposition complète de l'entrée formatée"""
+        from datetime import datetime
+        entry = LogEntry(
+            timestamp=datetime(2024, 1, 2, 13, 45, 7).timestamp(),
+            level=LogLevel.ERROR,
+            message="Boom",
+            source="Module"
+        )
+        assert entry.format() == "[13:45:07] [ERROR] [Module] Boom"
 
 
 class TestLogger:
@@ -113,11 +124,53 @@ class TestLogger:
 
     def test_log_debug(self, temp_log_dir):
         """Test log DEBUG"""
-        logger = Logger(log_dir=temp_log_dir)
+        logger = Logger(log_dir=temp_log_dir, level=LogLevel.DEBUG)
         logger.debug("Debug message")
 
         assert logger.entries[0].level == LogLevel.DEBUG
 
+    def test_log_below_level_is_skipped(self, temp_log_dir):
+        """Test filtrage des messages sous le niveau minimal"""
+        logger = Logger(log_dir=temp_log_dir, level=LogLevel.INFO)
+        callback_entries = []
+        logger.add_callback(callback_entries.append)
+
+        logger.debug("Debug message")
+
+        assert len(logger.entries) == 0
+        assert callback_entries == []
+        assert logger.debug_enabled is False
+
+    def test_log_deferred_formatting(self, temp_log_dir):
+        """Test formatage différé des arguments"""
+        logger = Logger(log_dir=temp_log_dir, level=LogLevel.INFO)
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("ne doit pas être formaté")
+
+        logger._log(LogLevel.DEBUG, "Valeur %s", "test", (Exploding(),))
+        logger._log(LogLevel.INFO, "Fichier %s (%d lignes)", "test", ("a.xlsx", 3))
+        logger.info("100% sans arguments")
+
+        assert len(logger.entries) == 2
+        assert logger.entries[0].message == "Fichier a.xlsx (3 lignes)"
+        assert logger.entries[1].message == "100% sans arguments"
+
+    def test_set_level_from_name(self, temp_log_dir):
+        """Test changement de niveau par nom"""
+        logger = Logger(log_dir=temp_log_dir)
+        logger.set_level("DEBUG")
+
+        assert logger.level == LogLevel.DEBUG
+        assert logger.debug_enabled is True
+        assert logger.is_enabled_for(LogLevel.DEBUG)
+
+        logger.set_level("ERROR")
+        logger.warning("Filtered")
+        assert logger.warning_count == 0
+        assert not logger.is_enabled_for(LogLevel.SUCCESS)
+
     def test_log_success(self, temp_log_dir):
         """Test log SUCCESS"""
         logger = Logger(log_dir=temp_log_dir)
@@ -164,6 +217,17 @@ class TestLogger:
             logger.info(f"Message {i}")
 
         assert len(logger.entries) == 5
+        assert logger.entries[0].message == "Message 5"
+        assert logger.entries[-1].message == "Message 9"
+
+    def test_get_entries_limit(self, temp_log_dir):
+        """Test limite du nombre d'entrées retournées"""
+        logger = Logger(log_dir=temp_log_dir)
+        for i in range(10):
+            logger.info(f"Message {i}")
+
+        entries = logger.get_entries(limit=3)
+        assert [e.message for e in entries] == ["Message 7", "Message 8", "Message 9"]
 
     def test_callback_called(self, temp_log_dir):
         """Test appel callback"""
@@ -255,6 +319,8 @@ class TestLogger:
         logger.clear()
 
         assert len(logger.entries) == 0
+        assert logger.get_errors() == []
+        assert logger.get_warnings() == []
         assert logger.error_count == 0
         assert logger.warning_count == 0
 
@@ -265,6 +331,36 @@ class TestLogger:
 
         assert logger.log_file.exists()
 
+    def test_log_file_written(self, temp_log_dir):
+        """Test écriture des messages dans le fichier (via la file d'attente)"""
+        logger = Logger(log_dir=temp_log_dir)
+        logger.info("Written to file")
+        logger.shutdown()
+
+        content = logger.log_file.read_text(encoding='utf-8')
+        assert "Written to file" in content
+
+    def test_same_name_replaces_listener(self, temp_log_dir):
+        """Test nouvelle instance du même nom: écoute et fichiers précédents fermés"""
+        import gc
+        import threading
+
+        first = Logger(log_dir=temp_log_dir, name="ReplaceTest")
+        threads = threading.active_count()
+        first_handlers = list(first._finalizer.peek()[2][3])
+
+        second = Logger(log_dir=temp_log_dir / "second", name="ReplaceTest")
+        assert not first._finalizer.alive
+        assert all(getattr(h, "stream", None) is None for h in first_handlers
+                   if isinstance(h, logging.FileHandler))
+        assert threading.active_count() == threads
+
+        second.info("Écrit par la seconde instance")
+        del first, second
+        gc.collect()
+        assert threading.active_count() == threads - 1
+        assert logging.getLogger("ReplaceTest").handlers == []
+
     def test_export_logs(self, temp_log_dir):
         """Test export logs"""
         logger = Logger(log_dir=temp_log_dir)
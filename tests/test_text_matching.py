@@ -0,0 +1,72 @@
+"""
+Tests unitaires pour la correspondance approximative de texte
+"""
+
+import sys
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import text_matching
+from src.utils.text_matching import FuzzyMatcher
+
+
+class TestFuzzyMatcher:
+    """Tests pour FuzzyMatcher"""
+
+    def test_exact_value_matches(self):
+        """Test valeur identique à une référence"""
+        matcher = FuzzyMatcher(["apple", "banana"], 0.8)
+        assert matcher.matches("apple") is True
+
+    def test_close_value_matches(self):
+        """Test valeur proche au-dessus du seuil"""
+        matcher = FuzzyMatcher(["bananna"], 0.8)
+        assert matcher.matches("banana") is True
+
+    def test_value_below_threshold(self):
+        """Test valeur sous le seuil"""
+        matcher = FuzzyMatcher(["cheri"], 0.8)
+        assert matcher.matches("cherry") is False
+
+    def test_empty_references(self):
+        """Test sans référence"""
+        matcher = FuzzyMatcher([], 0.5)
+        assert matcher.found_mask(["a", "b"]) == [False, False]
+
+    def test_same_result_as_sequence_matcher(self):
+        """Test résultats identiques à SequenceMatcher.ratio"""
+        references = ["REF-001", "REF-010", "ABC-123", "XYZ"]
+        values = ["REF-002", "ref-001", "ABC-132", "XY", "QQQQQQQ", ""]
+        threshold = 0.75
+
+        expected = [
+            any(SequenceMatcher(None, v, r).ratio() >= threshold for r in references)
+            for v in values
+        ]
+        assert FuzzyMatcher(references, threshold).found_mask(values) == expected
+
+    def test_length_window_keeps_results(self):
+        """Test filtrage par longueur sans perte de correspondance"""
+        references = ["a", "ab", "abcd", "abcdefgh", ""]
+        values = ["", "a", "abc", "abcde", "abcdefg", "abcdefghijklmnop"]
+
+        for threshold in (0.0, 0.5, 0.8, 1.0):
+            expected = [
+                any(SequenceMatcher(None, v, r).ratio() >= threshold for r in references)
+                for v in values
+            ]
+            assert FuzzyMatcher(references, threshold).found_mask(values) == expected
+
+    def test_process_pool_worker(self):
+        """Test exécution dans des processus de travail"""
+        with ProcessPoolExecutor(
+            max_workers=2,
+            initializer=text_matching.init_worker,
+            initargs=(["apple", "bananna"], 0.8)
+        ) as pool:
+            masks = list(pool.map(text_matching.worker_found_mask, [["apple", "zzz"], ["banana"]]))
+
+        assert masks == [[True, False], [True]]